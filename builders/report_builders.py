@@ -265,7 +265,8 @@ def build_full_html_cli(report: Dict[str, Any], tr: Callable[[str], str] | None
 
 
 def build_html_body_gui(report: Dict[str, Any], tr: Translator | None, *, conflicts_only: bool, include_reference: bool,
-                        include_wrap: bool, disable_file_links: bool, impact_fn=None, anchor_fn=None) -> str:
+                        include_wrap: bool, disable_file_links: bool, impact_fn=None, anchor_fn=None,
+                        anchors=None) -> str:
     """Generate HTML body content compatible with GUI output format.
 
     Parameters:
@@ -276,6 +277,8 @@ def build_html_body_gui(report: Dict[str, Any], tr: Translator | None, *, confli
       disable_file_links: Suppress file:// links
       impact_fn: (cls,meth,mods,entries)->{'severity':str,'message':str} GUI-specific heuristic (optional)
       anchor_fn: (idx|None, cls, meth)->id generator (simple implementation if omitted)
+      anchors: optional precomputed [(row_anchor, detail_anchor), ...] aligned with
+        report['conflicts']; when given (and the length matches) anchor_fn is not called
 
     NOTE: Maintains structural compatibility with GUI's existing build_html_body,
     returning only the fragment before external template insertion.
@@ -329,64 +332,71 @@ def build_html_body_gui(report: Dict[str, Any], tr: Translator | None, *, confli
     conf_head = (_('report.conflicts') or 'Conflicts').split('(')[0].strip()
     parts.append(f"<h2>{conf_head} <span class='badge'>{_('summary.total')}: {total_conf}</span></h2>")
     if conflicts:
-        sev_hdr = _('filters.severity')
-        parts.append(f"<table><thead><tr><th>#</th><th>Class.Method</th><th>Mods</th><th>Count</th><th>{sev_hdr}</th></tr></thead><tbody>")
-        for idx, c in enumerate(conflicts, start=1):
+        # Per-conflict data is computed once here and shared by the summary table and the
+        # detail sections (impact/baseline, wrap lookup and anchors were previously derived twice).
+        try:
+            global_include_wrap = bool((report.get('_options') or {}).get('include_wrap_coexistence', True))
+        except Exception:
+            global_include_wrap = True
+        hidden_wrap_tooltip_attr = ''
+        if not global_include_wrap:
+            from html import escape as _esc
+            tip_txt = _('impact.wrapHiddenTooltip')
+            if tip_txt == 'impact.wrapHiddenTooltip':  # fallback English if key missing
+                tip_txt = 'wrapMethod coexistence exists (hidden)'
+            hidden_wrap_tooltip_attr = f" title='{_esc(tip_txt)}'"
+        # First wrap_coexistence group per (class, method) for the inline wrap list
+        wrap_groups_by_key: Dict[tuple, Any] = {}
+        try:
+            for g in report.get('wrap_coexistence') or []:
+                wrap_groups_by_key.setdefault((g.get('class'), g.get('method')), g)
+        except Exception:
+            wrap_groups_by_key = {}
+        if anchors is None or len(anchors) != len(conflicts):
+            anchors = [(_anchor(i, c.get('class',''), c.get('method','')), _anchor(None, c.get('class',''), c.get('method','')))
+                       for i, c in enumerate(conflicts, start=1)]
+        rows = []
+        for c in conflicts:
             cls = c.get('class',''); meth = c.get('method',''); mods = c.get('mods', []) or []
             entries = c.get('occurrences') or c.get('entries') or []
             # Per-method wrap detection to avoid global wrap inflation
             has_wrap = method_has_wrap(report, cls, meth)
+            impact = baseline = {'severity':'','message':''}
             if impact_fn:
                 # ignore provided global wrap inside impact_fn by recomputing here for accuracy
                 try:
                     impact = compute_impact_unified(cls, meth, mods, entries, wrap_coexist=has_wrap)
                 except Exception:
                     impact = {'severity':'','message':''}
-            else:
-                impact = {'severity':'','message':''}
+                # Baseline if wrap present
+                baseline = impact
+                if has_wrap:
+                    try:
+                        baseline = compute_impact_unified(cls, meth, mods, entries, wrap_coexist=False)
+                    except Exception:
+                        baseline = impact
+            rows.append((c, cls, meth, mods, entries, has_wrap, impact, baseline))
+
+        sev_hdr = _('filters.severity')
+        parts.append(f"<table><thead><tr><th>#</th><th>Class.Method</th><th>Mods</th><th>Count</th><th>{sev_hdr}</th></tr></thead><tbody>")
+        for idx, (c, cls, meth, mods, entries, has_wrap, impact, _baseline) in enumerate(rows, start=1):
             sev = impact.get('severity','')
             sev_key = f"filters.sev.{sev.lower()}" if sev else ''
             sev_label = _(sev_key) if sev_key else ''
             if sev_key and sev_label == sev_key:
                 sev_label = sev
             # Hidden wrap tooltip: only when include_wrap option is False globally but this method actually has wrap coexistence
-            hidden_wrap_tooltip = ''
-            try:
-                global_include_wrap = bool((report.get('_options') or {}).get('include_wrap_coexistence', True))
-            except Exception:
-                global_include_wrap = True
-            if has_wrap and not global_include_wrap:
-                tip_txt = _('impact.wrapHiddenTooltip')
-                if tip_txt == 'impact.wrapHiddenTooltip':  # fallback English if key missing
-                    tip_txt = 'wrapMethod coexistence exists (hidden)'
-                from html import escape as _esc
-                hidden_wrap_tooltip = f" title='{_esc(tip_txt)}'"
-            anchor = _anchor(idx, cls, meth)
+            hidden_wrap_tooltip = hidden_wrap_tooltip_attr if has_wrap else ''
+            anchor = anchors[idx - 1][0]
             parts.append(f"<tr><td>{idx}</td><td><a href='#{anchor}'>{cls}.{meth}</a></td><td>{len(set(mods))}</td><td>{c.get('count',0)}</td><td><span class='badge sev-{sev.lower()}'{hidden_wrap_tooltip}>{sev_label}</span></td></tr>")
         parts.append("</tbody></table>")
-        for c in conflicts:
-            cls = c.get('class',''); meth = c.get('method','')
-            entries = c.get('occurrences') or c.get('entries') or []
-            mods = c.get('mods', []) or []
-            anchor = _anchor(None, cls, meth)
+        for pos, (c, cls, meth, mods, entries, has_wrap, impact, baseline) in enumerate(rows):
+            anchor = anchors[pos][1]
             parts.append(f"<div class='conflict' id='{anchor}'>")
             parts.append(f"<h3>{cls}.{meth}</h3>")
             if mods:
                 parts.append(f"<div><b>Mods:</b> {', '.join(sorted(set(mods)))} </div>")
             if impact_fn:
-                has_wrap = method_has_wrap(report, cls, meth)
-                try:
-                    impact = compute_impact_unified(cls, meth, mods, entries, wrap_coexist=has_wrap)
-                except Exception:
-                    impact = {'severity':'','message':''}
-                # Baseline if wrap present
-                if has_wrap:
-                    try:
-                        baseline = compute_impact_unified(cls, meth, mods, entries, wrap_coexist=False)
-                    except Exception:
-                        baseline = impact
-                else:
-                    baseline = impact
                 sev2 = impact.get('severity','')
                 sev2_key = f"filters.sev.{sev2.lower()}" if sev2 else ''
                 sev2_label = _(sev2_key) if sev2_key else sev2
@@ -395,17 +405,7 @@ def build_html_body_gui(report: Dict[str, Any], tr: Translator | None, *, confli
                 raw_msg = impact.get('message','') or ''
                 disp_msg = _ci_localize_impact_placeholders(raw_msg, _)
                 # Hidden wrap tooltip attribute (global include_wrap disabled AND method has wrap)
-                try:
-                    global_include_wrap = bool((report.get('_options') or {}).get('include_wrap_coexistence', True))
-                except Exception:
-                    global_include_wrap = True
-                hidden_wrap_tooltip = ''
-                if has_wrap and not global_include_wrap:
-                    tip_txt = _('impact.wrapHiddenTooltip')
-                    if tip_txt == 'impact.wrapHiddenTooltip':
-                        tip_txt = 'wrapMethod coexistence exists (hidden)'
-                    from html import escape as _esc
-                    hidden_wrap_tooltip = f" title='{_esc(tip_txt)}'"
+                hidden_wrap_tooltip = hidden_wrap_tooltip_attr if has_wrap else ''
                 # Main impact line
                 parts.append(f"<div class='impact'><b>{_('impact.label')}</b> <span class='badge sev-{sev2.lower()}'{hidden_wrap_tooltip}>{sev2_label}</span> — {disp_msg}</div>")
                 # Baseline line (only if different)
@@ -435,11 +435,10 @@ def build_html_body_gui(report: Dict[str, Any], tr: Translator | None, *, confli
                 parts.append('</ul>')
                 # Inline wrap occurrences list (other mods performing @wrapMethod on this target)
                 try:
-                    wrap_groups = report.get('wrap_coexistence') or []
                     # gather wraps for this class.method
-                    matched = [g for g in wrap_groups if g.get('class')==cls and g.get('method')==meth]
+                    matched = wrap_groups_by_key.get((cls, meth))
                     if matched:
-                        wraps = matched[0].get('occurrences') or []
+                        wraps = matched.get('occurrences') or []
                         if wraps:
                             # Fallback heading if translation key unresolved (mirrors markdown builder logic)
                             _heading = _('conflict.wrapInlineHeading')
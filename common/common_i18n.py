@@ -90,23 +90,46 @@ def load_bundles(force: bool = False) -> Dict[str, Dict[str, Any]]:
     if _BUNDLE_CACHE is not None and not force:
         return _BUNDLE_CACHE
     bundles: Dict[str, Dict[str, Any]] = {}
+    files: list[Path] = []
     for d in _candidate_i18n_dirs():
         try:
             if not d.exists():
                 continue
-            for f in d.glob('*.json'):
-                try:
-                    data = json.loads(f.read_text(encoding='utf-8'))
-                    lang = (data.get('$meta') or {}).get('lang') or f.stem
-                    bundles[str(lang)] = data
-                except Exception:
-                    continue
+            files.extend(d.glob('*.json'))
+        except Exception:
+            continue
+    # Read + parse concurrently (file I/O releases the GIL); results are merged
+    # in discovery order so duplicate language precedence stays unchanged.
+    parsed: list[Optional[Dict[str, Any]]]
+    if len(files) > 1:
+        try:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(4, len(files))) as ex:
+                parsed = list(ex.map(_read_bundle_file, files))
+        except Exception:
+            parsed = [_read_bundle_file(f) for f in files]
+    else:
+        parsed = [_read_bundle_file(f) for f in files]
+    for f, data in zip(files, parsed):
+        if not isinstance(data, dict):
+            continue
+        try:
+            lang = (data.get('$meta') or {}).get('lang') or f.stem
+            bundles[str(lang)] = data
         except Exception:
             continue
     _BUNDLE_CACHE = bundles
     return bundles
 
 
+def _read_bundle_file(f: Path) -> Optional[Dict[str, Any]]:
+    """Read and parse one bundle file; returns None on any failure."""
+    try:
+        return json.loads(f.read_text(encoding='utf-8'))
+    except Exception:
+        return None
+
+
 def choose_lang(bundles: Dict[str, Dict[str, Any]], requested: Optional[str] = None) -> str:
     if not bundles:
         return 'en'
@@ -21,6 +21,9 @@ import math
 import json
 import locale
 import threading
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -29,12 +32,16 @@ from typing import Optional, Dict, Any, List, TYPE_CHECKING, Protocol, runtime_c
 import re
 import tempfile
 import os
-import uuid
+import secrets
+import hashlib
 import atexit
 import webbrowser
 import time
-from datetime import datetime, timedelta, timezone
+_perf = time.perf_counter  # monotonic, high-resolution clock for the _timings / [BROWSE] durations
+_NOW = time.perf_counter_ns  # integer ns clock for the scan [TIMER] bracketing in work()
+from datetime import datetime, timezone
 import shutil
+from functools import cached_property
 from common.common_util import safe_call, ensure_row_visibility, log_message  # lightweight helpers (broad UI safety)
 from common.common_assets import (
     discover_asset_dirs as discover_asset_dirs,
@@ -47,6 +54,9 @@ from common.common_assets import (
 PAD_MAIN: dict[str, int] = {'padx': 8, 'pady': 6}      # General section padding
 PAD_TIGHT: dict[str, int] = {'padx': 4, 'pady': 2}     # Compact rows / button clusters
 
+# Default symptom category order (internal codes; i18n may override via filters.symptoms.order)
+_SYMPTOM_CODES: tuple[str, ...] = ('uiHud', 'player', 'vehicle', 'quest', 'inventory', 'damage', 'other')
+
 # --- Path constants (restored) -------------------------------------------------
 THIS_DIR = Path(__file__).parent.resolve()
 # When running from source, the project root is the parent of this GUI file.
@@ -55,14 +65,17 @@ SRC_DIR = THIS_DIR
 # In a frozen (PyInstaller) build we still want SRC_DIR style paths to resolve to the
 # extracted temporary folder so our relative asset discovery keeps working. We attempt
 # to remap if frozen; fall back silently otherwise.
+_IS_FROZEN: bool = bool(getattr(sys, 'frozen', False))
 try:  # pragma: no cover - defensive
-    if getattr(sys, 'frozen', False):  # type: ignore[attr-defined]
+    if _IS_FROZEN:
         # sys._MEIPASS points to the extraction dir for one-file bundles
         _meipass = Path(getattr(sys, '_MEIPASS', THIS_DIR))  # type: ignore[attr-defined]
         if _meipass.exists():
             SRC_DIR = _meipass  # type: ignore
 except Exception:  # pragma: no cover
     pass
+# Directory next to the executable (frozen) or the source tree; resolved once at import.
+_EXE_DIR: Path = Path(sys.executable).parent if _IS_FROZEN else SRC_DIR
 _WEBVIEW2_IMPORT_ERR: Optional[Tuple[Exception, Optional[Exception]]] = None
 _WEBVIEW2_IMPORT_SRC: Optional[str] = None
 
@@ -102,20 +115,162 @@ try:  # pragma: no cover
 except Exception:  # pragma: no cover
     core = None  # type: ignore
 WebView2 = _WV2Type  # type: ignore  # unify name used elsewhere
+try:  # pragma: no cover - optional fast JSON encoder
+    import orjson as _orjson  # type: ignore
+    _ORJSON_OPTS = _orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS
+except Exception:  # pragma: no cover
+    _orjson = None  # type: ignore
+    _ORJSON_OPTS = 0
+
+
+def _json_text(obj: Any) -> str:
+    """``obj`` as 2-space indented JSON text for the JSON preview tab (orjson when installed).
+
+    Preview only: orjson formats some floats differently (``1e+16`` vs ``1e16``) and writes
+    NaN/Infinity as ``null``, so report files are always serialized by stdlib json.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_ORJSON_OPTS).decode('utf-8')
+        except Exception:
+            pass  # e.g. ints beyond 64 bit: stdlib json handles everything it did before
+    return json.dumps(obj, ensure_ascii=False, indent=2)
 
 _ASSET_DIR_CACHE: Optional[List[Path]] = None  # retained name for any external references
 
 _ASSET_LOG_ONCE = False
 
+# Template placeholders substituted by App._render_full_html (single pass over the template)
+_TPL_PLACEHOLDER_RE = re.compile(r'\{\{(TITLE|HEADER_LABEL|THEME_CLASS|BODY)\}\}')
+# ASCII anchor slug table for _anchor_id_for_conflict: space -> '-', drop anything not alnum or '-_.'
+_ANCHOR_TABLE = {i: None for i in range(128) if not (chr(i).isalnum() or chr(i) in '-_.')}
+_ANCHOR_TABLE[ord(' ')] = '-'
+
+# Font chooser categories: first matching rule wins (substring match on the lowercased family).
+# CJK is checked before sans with CJK-specific keys only, so Latin 'gothic' families
+# (Century Gothic, Franklin Gothic) still fall through to sans.
+_FONT_CAT_RULES = (
+    ('mono', ('mono', 'console', 'terminal', 'courier', 'code', 'fixed')),
+    ('cjk', ('meiryo', 'yu gothic', 'yu mincho', 'ms gothic', 'ms pgothic', 'ms ui gothic', 'ms mincho',
+             'ms pmincho', 'noto sans cjk', 'noto serif cjk', 'hiragino', 'ud ')),
+    ('sans', ('gothic', 'ui', 'segoe', 'arial', 'helvetica', 'sans', 'verdana', 'roboto', 'noto')),
+    ('serif', ('serif', 'times', 'georgia', 'garamond', 'roman')),
+)
+
+# (inline_css, template path, template mtime_ns, css mtime_ns) -> (html, used_external_template)
+_TPL_CACHE: Dict[tuple, Tuple[str, bool]] = {}
+
+def _tpl_cache_key(inline_css: bool) -> Optional[tuple]:
+    """Stat-only lookup of the template common_assets would pick (same search order)."""
+    for d in discover_asset_dirs():
+        for name in ('report_template.html', 'template.html'):
+            try:
+                st = os.stat(d / name)
+            except OSError:
+                continue
+            try:
+                css_mtime = os.stat(d / 'report.css').st_mtime_ns
+            except OSError:
+                css_mtime = None
+            return (inline_css, str(d / name), st.st_mtime_ns, css_mtime)
+    return None
+
 def _load_template_and_css(inline_css: bool) -> tuple[str, bool]:
-    """Wrapper around common_assets.load_template_and_css preserving (html, used_external_template)."""
+    """Wrapper around common_assets.load_template_and_css preserving (html, used_external_template).
+
+    Results are cached until the template (or report.css) mtime changes.
+    """
+    key = _tpl_cache_key(inline_css)
+    if key is not None:
+        hit = _TPL_CACHE.get(key)
+        if hit is not None:
+            return hit
     tpl, used, _css_inline, _dir = _ca_load_template_and_css(inline_css=inline_css)
+    if key is not None:
+        if len(_TPL_CACHE) > 8:
+            _TPL_CACHE.clear()
+        _TPL_CACHE[key] = (tpl, used)
     return tpl, used
 
+def _fast_rmtree(path) -> None:
+    """Best-effort recursive delete using os.scandir (no per-entry stat like shutil.rmtree).
+
+    Entries that cannot be removed (e.g. files still held open by WebView2) are skipped;
+    the containing directories then simply remain in place. Never raises.
+    """
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for e in it:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    _fast_rmtree(e.path)
+                else:
+                    os.unlink(e.path)
+            except OSError:
+                pass
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+def _dir_size_scandir(path) -> int:
+    """Total size in bytes of regular files under ``path`` (symlinks not followed).
+
+    Uses an explicit stack of os.scandir iterators; DirEntry.stat() is served from the
+    directory listing on Windows, so each file costs a single syscall. Never raises.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.is_file(follow_symlinks=False):
+                        total += e.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    return total
+
 from common.common_i18n import load_bundles as _ci_load_bundles, choose_lang as _ci_choose_lang  # type: ignore
 
 
 
+class _Catalog(dict):
+    """Translation catalog whose unknown keys resolve to their last dotted segment ('foo.bar.label' -> 'label')."""
+    def __missing__(self, key: str) -> str:
+        return key.split('.')[-1]
+
+
+class _KeepMissing(dict):
+    """format_map mapping that leaves unknown ``{placeholders}`` untouched."""
+    def __missing__(self, key: str) -> str:
+        return '{' + key + '}'
+
+
+# Browse dialogs: kind -> (filedialog function name, title key, App var attr, initial-dir method, on_result method, dialog kwargs).
+# The dialog function is looked up on filedialog at call time so it stays patchable.
+_BROWSE_SPECS: Dict[str, tuple] = {
+    'root': ('askdirectory', 'scan.root', 'var_root', '_browse_init_root', None, {'mustexist': True}),
+    'json': ('asksaveasfilename', 'scan.outJson', 'var_out_json', '_browse_init_output', None,
+             {'defaultextension': '.json', 'filetypes': [('JSON', '*.json'), ('All Files', '*.*')]}),
+    'md': ('asksaveasfilename', 'scan.outMd', 'var_out_md', '_browse_init_output', None,
+           {'defaultextension': '.md', 'filetypes': [('Markdown', '*.md'), ('All Files', '*.*')]}),
+    'html': ('asksaveasfilename', 'scan.outHtml', 'var_out_html', '_browse_init_output', None,
+             {'defaultextension': '.html', 'filetypes': [('HTML', '*.html'), ('All Files', '*.*')]}),
+    'settings': ('asksaveasfilename', 'scan.saveAs', 'var_settings_path', '_browse_init_settings', '_on_settings_path_chosen',
+                 {'defaultextension': '.json', 'filetypes': [('JSON', '*.json'), ('All Files', '*.*')]}),
+}
+
+
 # --- Theme helpers (must be defined before main/apply_theme) ---
 def _setup_style_dark(style: ttk.Style):
     # Minimal dark theme setup for ttk widgets
@@ -211,7 +366,7 @@ def discover_default_paths():
     Here we only return candidate path strings.
     """
     cwd = Path.cwd()
-    exe_dir = Path(sys.executable).parent if getattr(sys, 'frozen', False) else SRC_DIR
+    exe_dir = _EXE_DIR
     candidates_root = [
         cwd / 'r6' / 'scripts',
         exe_dir / '..' / 'r6' / 'scripts',
@@ -252,6 +407,26 @@ class App(tk.Tk):
     Public knobs are stored in tk Variables (StringVar/BooleanVar/DoubleVar) so they can be
     easily traced/observed and bound to UI widgets.
     """
+    # Severity filter checkbuttons: (code, widget attribute, BooleanVar attribute); code maps to filters.sev.<code>
+    _SEV_SPEC = (
+        ('critical', 'chk_sev_c', 'var_filter_sev_critical'),
+        ('high', 'chk_sev_h', 'var_filter_sev_high'),
+        ('medium', 'chk_sev_m', 'var_filter_sev_medium'),
+        ('low', 'chk_sev_l', 'var_filter_sev_low'),
+    )
+    # Text-fallback tag fonts scaled by apply_font_scale: (Font attribute, min size)
+    _TEXT_FONT_SPEC = (
+        ('font_base', 6),
+        ('font_bold', 6),
+        ('font_h1', 7),
+        ('font_h2', 7),
+        ('font_mono', 6),
+        ('font_meta', 6),
+        ('font_impact', 6),
+    )
+    # Bits OR-ed into _filter_dirty_mask by the filter traces
+    _FILTER_DIRTY_TEXT = 1
+    _FILTER_DIRTY_TOGGLE = 2
     def __init__(self):
         super().__init__()
         # Application semantic version
@@ -261,7 +436,10 @@ class App(tk.Tk):
         self._bundles = _ci_load_bundles()
         self.var_lang = tk.StringVar(value=_ci_choose_lang(self._bundles))  # Language variable
         self._ = self._make_gettext()  # Gettext function
-        self.title(self._('app.title'))  # Set window title
+        self._tr_cache: Dict[str, str] = {}  # memoized self._ lookups (cleared on language change)
+        self._gettext_for_cache: Dict[str, Callable[[str], str]] = {}  # see _make_gettext_for
+        self._localized_json_block: Dict[str, dict] = {}  # lang -> 'localized' block (see _augment_json_with_localized)
+        self.title(self._tr('app.title'))  # Set window title
         # Default size: height x1.5 (520 -> 780)
         # Size the initial window to the minimum width (720px)
         self.geometry('720x780')
@@ -274,7 +452,6 @@ class App(tk.Tk):
         # Text/preview widgets
         self.txt_html = None  # type: Optional[tk.Text]
         self.html_text_container = None  # type: Optional[ttk.Frame]
-        self.sb_html = None  # type: Optional[ttk.Scrollbar]
         self.webview2 = None  # type: Optional[WebView2]  # noqa: N815
         self._webview2_last_error = None  # type: Optional[Exception]
         self.wv_hint = None  # type: Optional[ttk.Frame]  # hint banner placeholder
@@ -381,7 +558,7 @@ class App(tk.Tk):
                     if _t.time() > getattr(self, '_startup_geom_deadline', 0):
                         # Unbind configure handler to reduce overhead/noise
                         try:
-                            self.unbind('<Configure>', self._startup_configure_bind_id)
+                            self._unbind_func('<Configure>', self._startup_configure_bind_id)
                         except Exception:
                             pass
                 except Exception:
@@ -400,17 +577,18 @@ class App(tk.Tk):
             pass
 
         if core is None:
-            messagebox.showerror(self._('error.import.title'), self._('error.import.body'))
+            messagebox.showerror(self._tr('error.import.title'), self._tr('error.import.body'))
 
         self.var_root = tk.StringVar()
         self.var_out_json = tk.StringVar()
         self.var_out_md = tk.StringVar()
         # Exclusive mode: True = Conflicts only, False = Include reference
         self.var_mode_conflicts = tk.BooleanVar(value=True)
-        self.var_mode_text = tk.StringVar(value=self._('mode.conflicts'))
-        # Backwards compatibility flags (not bound to UI)
-        self.var_conflicts_only = tk.BooleanVar(value=True)
-        self.var_include_reference = tk.BooleanVar(value=False)
+        self.var_mode_text = tk.StringVar(value=self._tr('mode.conflicts'))
+        self._vn_mode_text = str(self.var_mode_text)  # Tcl name for direct globalsetvar writes
+        # Backwards compatibility flags (not bound to UI; plain attributes, no Tcl variable needed)
+        self._conflicts_only = True
+        self._include_reference = False
         self.var_enable_json = tk.BooleanVar(value=False)
         self.var_enable_md = tk.BooleanVar(value=False)
         # New: enable saving Preview (HTML) as a file
@@ -420,7 +598,10 @@ class App(tk.Tk):
         self.var_include_wrap = tk.BooleanVar(value=False)
         # Dark/Light exclusive toggle
         self.var_dark_mode = tk.BooleanVar(value=False)  # False=Light, True=Dark
-        self.var_dark_label = tk.StringVar(value=self._('theme.light'))
+        # Cached template THEME_CLASS ('dark' / ''); any write to var_dark_mode invalidates it
+        self._theme_class_cached: Optional[str] = None
+        self.var_dark_mode.trace_add('write', self._invalidate_theme_class)
+        self.var_dark_label = tk.StringVar(value=self._tr('theme.light'))
 
         # Preview filters (Preview-only)
         self.var_filter_mods = tk.StringVar(value='')  # comma-separated tokens
@@ -466,7 +647,7 @@ class App(tk.Tk):
 
         # Settings
         # Default settings path bootstrap: exe-adjacent redscript_conflict_gui.json
-        self._exe_dir = Path(sys.executable).parent if getattr(sys, 'frozen', False) else SRC_DIR
+        self._exe_dir = _EXE_DIR
         self._settings_bootstrap = self._exe_dir / 'redscript_conflict_gui.json'
         default_settings = self._settings_bootstrap
         # Read bootstrap for `settings_path` only
@@ -486,22 +667,14 @@ class App(tk.Tk):
         except Exception:
             self._first_run = True
         self._last_report = None
-        # Impact configuration - use shared defaults for consistency
-        try:  # lazy import so module loads even if common_impact has issues
-            from common.common_impact import get_default_impact_config as _gui_gdic  # type: ignore
-            self._impact_cfg = _gui_gdic()  # deep copy of defaults
-        except Exception:
-            # Fallback configuration if common_impact unavailable
-            self._impact_cfg = {
-                'thresholds': {'critical': 95, 'high': 70, 'medium': 45},
-                'weights': {
-                    'per_mod': 25,
-                    'class_keywords': {},
-                    'method_keywords': {},
-                    'signature': {'per_arg': 3, 'has_return': 6},
-                    'wrap_coexist_bonus': 12,
-                }
-            }
+        self._last_filter_state: Optional[tuple] = None  # filter inputs behind the current preview
+        self._last_include_wrap: Optional[bool] = None  # include_wrap behind the current tabs/preview
+        self._include_wrap_after_id = None
+        self._font_search_after = None  # pending debounced font chooser search refresh
+        self._font_preview_font = None  # font chooser sample font (reconfigured per selection)
+        self._preview_cache: Dict[tuple, Path] = {}  # (body digest, theme, header, template key) -> browser preview temp file
+        self._md_cache: Dict[tuple, tuple] = {}  # see _localized_markdown_cached
+        # Impact configuration: built lazily on first access (see _impact_cfg property)
         # Event listeners storage (placeholder for future extension)
         # self._event_listeners = {}
 
@@ -515,10 +688,30 @@ class App(tk.Tk):
         except Exception:
             self.var_out_html = tk.StringVar(value='redscript_conflicts.html')
 
-        # Early log buffer (flush after txt_log widget exists)
-        self._early_logs = []  # list of tuples (msg, tag)
+        # Early log buffer (flush after txt_log widget exists). Bounded: the Log tab is built lazily, so
+        # every scan's lines land here until it is opened; older lines beyond the cap are dropped
+        self._early_logs: 'deque[tuple]' = deque(maxlen=self._EARLY_LOG_MAX)  # (msg, tag)
+        self._early_logs_dropped = 0
+        self._log_queue: 'queue.SimpleQueue[tuple]' = queue.SimpleQueue()  # (msg, tag) awaiting _drain_log_queue
+        self._log_drain_scheduled = False
+        self._ui_queue: 'queue.SimpleQueue[tuple]' = queue.SimpleQueue()  # (coalesce key, callable) for _drain_ui_queue
+        self._ui_drain_scheduled = False
+        self._scan_done_pipes: set = set()  # armed per-run completion pipes (closed on completion / window close)
+        # Text widgets and their creation-time line heights (for font-scale height compensation)
+        self._text_widgets: List[tk.Text] = []
+        self._text_base_heights: Dict[Any, int] = {}
+        self._text_last_heights: Dict[Any, int] = {}  # height last applied by _adjust_text_widget_heights_for_scale
+        self._ui_ready = False  # True once _build_ui finished (late-built widgets need their own setup)
+        self._font_bases_ready = False  # set by _init_font_bases (content/tag font bases captured)
+        self._last_applied_scale = -1.0  # scale last applied by _apply_font_scale_preserving_size (no-op guard)
+        self._geom_dirty = True  # pending layout worth flushing before the next geometry snapshot
+        self._css_dir_cached: Optional[Path] = None  # asset dir holding report.css (see _maybe_copy_report_css)
+        self._css_dir_resolved = False
+        # [TIMER] scan profiling lines are emitted only with RCR_PROFILE=1 (or the documented RCR_DEBUG=1)
+        self._profile_enabled = any(os.environ.get(k, '') not in ('', '0') for k in ('RCR_PROFILE', 'RCR_DEBUG'))
 
         self._build_ui()
+        self._ui_ready = True
         self._wire_events()
         # Store latest HTML body (without head/style) for theme re-render
         self._last_html_body = ''
@@ -537,6 +730,28 @@ class App(tk.Tk):
         except Exception:
             pass
 
+    @cached_property
+    def _impact_cfg(self) -> Dict[str, Any]:
+        """Impact heuristic configuration (shared defaults), built on first use and then cached.
+
+        _load_settings_silent mutates the returned dict in place to apply user overrides.
+        """
+        try:  # lazy import so module loads even if common_impact has issues
+            from common.common_impact import get_default_impact_config as _gui_gdic  # type: ignore
+            return _gui_gdic()  # deep copy of defaults
+        except Exception:
+            # Fallback configuration if common_impact unavailable
+            return {
+                'thresholds': {'critical': 95, 'high': 70, 'medium': 45},
+                'weights': {
+                    'per_mod': 25,
+                    'class_keywords': {},
+                    'method_keywords': {},
+                    'signature': {'per_arg': 3, 'has_return': 6},
+                    'wrap_coexist_bonus': 12,
+                }
+            }
+
     def _detect_preferred_font(self) -> str:
         """Detect preferred default UI font.
 
@@ -648,10 +863,10 @@ class App(tk.Tk):
             pass
 
         # Scan settings --------------------------------------------------
-        self.lf = ttk.LabelFrame(frm, text=self._('scan.settings'))
+        self.lf = ttk.LabelFrame(frm, text=self._tr('scan.settings'))
         # Use explicit padx/pady (avoid some analyzers mis-reading **dict expansion here)
         self.lf.pack(fill='x', padx=PAD_MAIN['padx'], pady=PAD_MAIN['pady'])
-        self.lbl_scan_root = ttk.Label(self.lf, text=self._('scan.root'))
+        self.lbl_scan_root = ttk.Label(self.lf, text=self._tr('scan.root'))
         self.lbl_scan_root.grid(row=0, column=0, sticky='w', padx=8, pady=6)
         self.ent_root = ttk.Entry(self.lf, textvariable=self.var_root)
         self.ent_root.grid(row=0, column=1, sticky='ew', padx=8, pady=6)
@@ -659,21 +874,16 @@ class App(tk.Tk):
         self.lf.columnconfigure(1, weight=1)
 
         # Mode (exclusive toggle) ----------------------------------------
-        self.mf = ttk.LabelFrame(frm, text=self._('mode.label'))
+        self.mf = ttk.LabelFrame(frm, text=self._tr('mode.label'))
         self.mf.pack(fill='x', padx=PAD_MAIN['padx'], pady=PAD_MAIN['pady'])
         self.chk_mode = ttk.Checkbutton(self.mf, textvariable=self.var_mode_text, variable=self.var_mode_conflicts,
                                         style='Switch.TCheckbutton', command=self._on_mode_toggle)
         self.chk_mode.grid(row=0, column=0, sticky='w', padx=(8, 6), pady=6)
         # Include wrapMethod coexistence toggle moved under Mode section
         try:
-            self.chk_include_wrap = ttk.Checkbutton(self.mf, text=self._('options.includeWrap'), variable=self.var_include_wrap,
+            self.chk_include_wrap = ttk.Checkbutton(self.mf, text=self._tr('options.includeWrap'), variable=self.var_include_wrap,
                                                    command=self._on_include_wrap_toggle)
-            try:
-                self.mf.columnconfigure(0, weight=0)
-                self.mf.columnconfigure(1, weight=0)
-                self.mf.columnconfigure(2, weight=1)
-            except Exception:
-                pass
+            self._cfg_cols(self.mf, {0: 0, 1: 0, 2: 1})
             self.chk_include_wrap.grid(row=0, column=1, sticky='w', padx=(0, 8), pady=6)
         except Exception:
             pass
@@ -682,13 +892,13 @@ class App(tk.Tk):
         # Actions ---------------------------------------------------------
         af = ttk.Frame(frm)
         af.pack(fill='x', padx=PAD_MAIN['padx'], pady=PAD_MAIN['pady'])
-        self.btn_run = ttk.Button(af, text=self._('actions.generate'), command=self.on_run)
+        self.btn_run = ttk.Button(af, text=self._tr('actions.generate'), command=self.on_run)
         self.btn_run.pack(side='left', padx=(6, 6))  # keep first and always visible
         try:
-            self.btn_open_browser = ttk.Button(af, text=self._('actions.openBrowser'), command=self.on_open_browser)
+            self.btn_open_browser = ttk.Button(af, text=self._tr('actions.openBrowser'), command=self.on_open_browser)
         except Exception:
             self.btn_open_browser = None
-        self.btn_open_folder = ttk.Button(af, text=self._('actions.openFolder'), command=self.on_open_folder)
+        self.btn_open_folder = ttk.Button(af, text=self._tr('actions.openFolder'), command=self.on_open_folder)
         self.progress = ttk.Progressbar(af, mode='indeterminate', length=160)
         self.progress.pack(side='right')
         self.progress.stop()
@@ -698,7 +908,7 @@ class App(tk.Tk):
 
         # --- Symptom category filter variables (normalized internal codes + i18n labels) ---
         # Use internal codes so filtering is language-agnostic; map to i18n for UI labels.
-        self.var_filter_symptoms = {}
+        self.var_filter_symptoms = {c: tk.BooleanVar(value=True) for c in _SYMPTOM_CODES}  # default all True
         self.chk_symptoms = {}
         # UI layout tweak: place the "inventory/items" symptom group on the second row initially (one-time forced break)
         try:
@@ -706,16 +916,9 @@ class App(tk.Tk):
             self._sym_force_break_applied = False
         except Exception:
             pass
-        try:
-            for code in ['uiHud', 'player', 'vehicle', 'quest', 'inventory', 'damage', 'other']:
-                # Default all True
-                self.var_filter_symptoms[code] = tk.BooleanVar(value=True)
-        except Exception:
-            pass
 
-        # Preview options — place ABOVE Notebook so controls remain visible
-        self.pf = ttk.LabelFrame(frm, text=self._('preview.options'))
-        self.pf.pack(fill='x', padx=PAD_MAIN['padx'], pady=PAD_MAIN['pady'])
+        # Preview options (packed below the filters, see the single pack pass after the Notebook)
+        self.pf = ttk.LabelFrame(frm, text=self._tr('preview.options'))
         # Status bar at bottom showing engine/theme/lang
         try:
             self.status_bar = ttk.Label(frm, anchor='w')
@@ -726,103 +929,66 @@ class App(tk.Tk):
         # (No startup popup): Suppress preview state toast on GUI startup per request
         # Widgets: font scale label + slider
         _ppad = {'padx': 8, 'pady': 4}
-        self.lbl_font_scale = ttk.Label(self.pf, text=self._('preview.fontScale'))
+        self.lbl_font_scale = ttk.Label(self.pf, text=self._tr('preview.fontScale'))
         self.lbl_font_scale.grid(row=0, column=0, sticky='w', padx=_ppad['padx'], pady=_ppad['pady'])
         # Scale stretches with window width
         # Add decrement button (-), slider, increment button (+) for 10% steps
-        def _nudge_font_scale(delta: float):
-            """Move scale to the next/previous 10%-step so percentage ones digit becomes 0."""
-            try:
-                cur = float(self.var_font_scale.get() or 1.0)
-            except Exception:
-                cur = 1.0
-            cur = max(0.5, min(1.5, cur))
-            n = cur * 10.0
-            if delta > 0:
-                new_n = math.floor(n + 1e-6) + 1
-            else:
-                new_n = math.ceil(n - 1e-6) - 1
-            new_val = max(0.5, min(1.5, new_n / 10.0))
-            self.var_font_scale.set(round(new_val, 1))
         # +/- buttons use fixed metrics (dynamic sizing disabled)
         # Rough height target matches Windows ttk.Scale trough (~22-26px)
         btn_pad = {'padx': 4, 'pady': 0}
         try:
             if not hasattr(self, 'style'):
                 self.style = ttk.Style(self)
-            try:
-                _btn_font = tkfont.Font(family='Segoe UI', size=8)
-            except Exception:
-                _btn_font = None
-            if _btn_font is not None:
-                self.style.configure('FontScale.TButton', padding=(6, 1), font=_btn_font)
-            else:
-                self.style.configure('FontScale.TButton', padding=(6, 1))
+            if not getattr(self, '_fontscale_style_done', False):
+                # Keep the Font object alive on the instance (tk fonts are per interpreter, so not class-level)
+                style_kw: Dict[str, Any] = {'padding': (6, 1)}
+                try:
+                    self._fontscale_btn_font = tkfont.Font(family='Segoe UI', size=8)
+                    style_kw['font'] = self._fontscale_btn_font
+                except Exception:
+                    self._fontscale_btn_font = None
+                self.style.configure('FontScale.TButton', **style_kw)
+                self._fontscale_style_done = True
         except Exception:
             pass
-        self.btn_font_dec = ttk.Button(self.pf, text='-', width=2, style='FontScale.TButton', command=lambda: _nudge_font_scale(-0.10))
+        self.btn_font_dec = ttk.Button(self.pf, text='-', width=2, style='FontScale.TButton', command=self._nudge_font_dec)
         # Make it slimmer: set ipady=0 and avoid vertical stretch (no sticky NS)
         self.btn_font_dec.grid(row=0, column=1, sticky='w', ipady=0, padx=btn_pad['padx'], pady=btn_pad['pady'])
-        self.sld_font_scale = ttk.Scale(self.pf, from_=0.5, to=1.5, orient='horizontal', variable=self.var_font_scale)
+        # Slider range is fixed; keep it on the instance so click handling needs no cget round-trips
+        self._scale_from, self._scale_to = 0.5, 1.5
+        self.sld_font_scale = ttk.Scale(self.pf, from_=self._scale_from, to=self._scale_to, orient='horizontal', variable=self.var_font_scale)
         self.sld_font_scale.grid(row=0, column=2, sticky='ew', padx=_ppad['padx'], pady=_ppad['pady'])
-        self.btn_font_inc = ttk.Button(self.pf, text='+', width=2, style='FontScale.TButton', command=lambda: _nudge_font_scale(+0.10))
+        self.btn_font_inc = ttk.Button(self.pf, text='+', width=2, style='FontScale.TButton', command=self._nudge_font_inc)
         self.btn_font_inc.grid(row=0, column=3, sticky='e', ipady=0, padx=btn_pad['padx'], pady=btn_pad['pady'])
-        def _click_set_scale(event):
-            """Move the slider thumb to the click position. If near the thumb (±8px), allow default drag start."""
-            try:
-                w = max(1, event.widget.winfo_width())
-                from_v = float(event.widget.cget('from'))
-                to_v = float(event.widget.cget('to'))
-                cur = float(self.var_font_scale.get() or from_v)
-                frac_cur = (cur - from_v) / (to_v - from_v) if to_v != from_v else 0
-                thumb_x = frac_cur * w
-                if abs(event.x - thumb_x) <= 8:
-                    return
-                x = min(max(0, event.x), w)
-                frac = x / w
-                val = from_v + (to_v - from_v) * frac
-                val = max(from_v, min(to_v, round(val * 100) / 100))
-                self.var_font_scale.set(val)
-                return 'break'
-            except Exception:
-                return 'break'
-        try:
-            self.sld_font_scale.bind('<Button-1>', _click_set_scale, add='+')
-        except Exception:
-            pass
-        try:
-            self.var_font_px = tk.StringVar()
-            self.lbl_font_px = ttk.Label(self.pf, textvariable=self.var_font_px)
-            self.lbl_font_px.grid(row=0, column=4, sticky='w', padx=_ppad['padx'], pady=_ppad['pady'])
-        except Exception:
-            self.var_font_px = tk.StringVar(value='')
-            self.lbl_font_px = ttk.Label(self.pf, textvariable=self.var_font_px)
-            self.lbl_font_px.grid(row=0, column=4, sticky='w', padx=_ppad['padx'], pady=_ppad['pady'])
-        self.pf.columnconfigure(0, weight=0)
-        self.pf.columnconfigure(1, weight=0)
-        self.pf.columnconfigure(2, weight=1)
-        self.pf.columnconfigure(3, weight=0)
-        self.pf.columnconfigure(4, weight=0)
+        self.sld_font_scale.bind('<Button-1>', self._on_scale_click, add='+')
+        self.sld_font_scale.bind('<ButtonRelease-1>', self._on_scale_release, add='+')
+        self._scale_dragging = False
+        self._scale_drag_dirty = False
+        self.var_font_px = tk.StringVar()
+        self._vn_font_px = str(self.var_font_px)  # written at drag rate via globalsetvar
+        self._last_font_pct: Optional[int] = None  # percent currently shown in lbl_font_px
+        self.lbl_font_px = ttk.Label(self.pf, textvariable=self.var_font_px)
+        self.lbl_font_px.grid(row=0, column=4, sticky='w', padx=_ppad['padx'], pady=_ppad['pady'])
+        self._cfg_cols(self.pf, {0: 0, 1: 0, 2: 1, 3: 0, 4: 0})
         try:
             self._update_font_px_label()
         except Exception:
             pass
 
-        # Notebook with Preview / Markdown / JSON / Log (placed after options; filters go below)
+        # Notebook with Preview / Markdown / JSON / Log (filters and options go below)
         nb = ttk.Notebook(frm)
-        nb.pack(fill='both', expand=True, padx=PAD_MAIN['padx'], pady=PAD_MAIN['pady'])
         self.nb = nb
 
         # Tabs (in order): Preview, Markdown, JSON, Log
-        tab_preview = ttk.Frame(nb)
-        tab_md = ttk.Frame(nb)
-        tab_json = ttk.Frame(nb)
-        tab_log = ttk.Frame(nb)
+        tab_preview = self._tab_preview = ttk.Frame(nb)
+        tab_md = self._tab_md = ttk.Frame(nb)
+        tab_json = self._tab_json = ttk.Frame(nb)
+        tab_log = self._tab_log = ttk.Frame(nb)
         # Add localized tab labels (HTML/Markdown/JSON/Log)
-        nb.add(tab_preview, text=self._('tabs.html'))
-        nb.add(tab_md, text=self._('tabs.markdown'))
-        nb.add(tab_json, text=self._('tabs.json'))
-        nb.add(tab_log, text=self._('tabs.log'))
+        nb.add(tab_preview, text=self._tr('tabs.html'))
+        nb.add(tab_md, text=self._tr('tabs.markdown'))
+        nb.add(tab_json, text=self._tr('tabs.json'))
+        nb.add(tab_log, text=self._tr('tabs.log'))
 
         # Preview tab: HTML area only (GUI-only; does not affect output files)
         self.webview2 = None  # active HTML engine widget (WebView2) or None
@@ -840,15 +1006,7 @@ class App(tk.Tk):
         def _ensure_text_fallback():
             if not hasattr(self, 'txt_html') or self.txt_html is None:
                 try:
-                    # Container + Text widget with vertical Scrollbar
-                    self.html_text_container = ttk.Frame(tab_preview)
-                    self.html_text_container.pack(fill='both', expand=True, padx=6, pady=6)
-                    # Pack scrollbar first to prevent width=0 at high font scales
-                    self.txt_html = tk.Text(self.html_text_container, height=12)
-                    self.sb_html = ttk.Scrollbar(self.html_text_container, orient='vertical', command=self.txt_html.yview)
-                    self.txt_html.configure(yscrollcommand=self.sb_html.set)
-                    self.sb_html.pack(side='right', fill='y')
-                    self.txt_html.pack(side='left', fill='both', expand=True)
+                    self.txt_html, self.html_text_container = self._make_scrolled_text(self._tab_preview)
                 except Exception:
                     pass
 
@@ -866,7 +1024,7 @@ class App(tk.Tk):
             # If translation is missing/incomplete, fall back to an English default message
             try:
                 key = 'hint.webview2.unavailable'
-                tr = self._(key)
+                tr = self._tr(key)
             except Exception:
                 tr = None
             if not tr or tr == key or len(str(tr).strip()) < 10:
@@ -874,16 +1032,19 @@ class App(tk.Tk):
             _show_wv_hint(tr)
 
         if HAS_WEBVIEW2 and WebView2 is not None:
-            # Prevent duplicate scheduling from both <Map> and timer
-            if not hasattr(self, '_webview2_init_scheduled'):
-                self._webview2_init_scheduled = False
+            # Prevent duplicate scheduling from both <Map> and timer (0=idle, 1=scheduled, 2=done)
+            self._webview2_init_state = 0
+            self._webview2_init_failures = 0  # failed control creations (bounds hook retries)
+            self._wv2_profile_path: Optional[Path] = None  # created once, reused by later init attempts
 
             def _init_webview2(attempt: int = 1, max_attempts: int = 1):
                 try:
-                    # Single attempt: if parent is unmapped or extremely small, do not reschedule and exit
+                    # If the parent is unmapped or extremely small, go back to idle; the
+                    # <Configure>/<Map> hook stays bound and retries once the tab has a real size
                     try:
-                        if not tab_preview.winfo_ismapped() or tab_preview.winfo_width() < 50 or tab_preview.winfo_height() < 50:
-                            log_message('info', self.log, 'WebView2 init skipped: tab not ready (single-attempt mode)')
+                        if not self._preview_ready():
+                            log_message('info', self.log, 'WebView2 init deferred: tab not ready')
+                            self._webview2_init_state = 0
                             return
                     except Exception:
                         pass
@@ -898,20 +1059,19 @@ class App(tk.Tk):
                         pass
                     # Pin WebView2 user data folder to a session-specific directory (avoid permission/lock issues)
                     try:
-                        base = self.session_temp_dir or (Path(tempfile.gettempdir()) / 'RedScriptConflictGUI')
-                        ud = Path(base) / 'wv2_profile'
-                        ud.mkdir(parents=True, exist_ok=True)
-                        os.environ.setdefault('WEBVIEW2_USER_DATA_FOLDER', str(ud))
-                        log_message('info', self.log, f"WEBVIEW2_USER_DATA_FOLDER={ud}")
-                    except Exception:
-                        pass
-                    # Ensure geometry calculations are settled before creating the control
-                    try:
-                        self.update_idletasks()
+                        ud = self._wv2_profile_path
+                        if ud is None:
+                            base = self.session_temp_dir or (Path(tempfile.gettempdir()) / 'RedScriptConflictGUI')
+                            ud = Path(base) / 'wv2_profile'
+                            ud.mkdir(parents=True, exist_ok=True)
+                            self._wv2_profile_path = ud
+                            if 'WEBVIEW2_USER_DATA_FOLDER' not in os.environ:
+                                os.environ['WEBVIEW2_USER_DATA_FOLDER'] = str(ud)
+                            log_message('info', self.log, f"WEBVIEW2_USER_DATA_FOLDER={os.environ.get('WEBVIEW2_USER_DATA_FOLDER')}")
                     except Exception:
                         pass
                     # Reserve a small initial size (avoid init failures due to tiny size)
-                    wv = WebView2(tab_preview, width=100, height=60)
+                    wv = WebView2(self._tab_preview, width=100, height=60)
                     try:
                         wv.pack(fill='both', expand=True)
                     except Exception:
@@ -929,6 +1089,7 @@ class App(tk.Tk):
                         pass
                     # Store the control reference
                     self.webview2 = wv
+                    self._webview2_init_state = 2
                     _hide_wv_hint()
                     # Hide Text fallback if it exists
                     try:
@@ -955,9 +1116,11 @@ class App(tk.Tk):
                     except Exception:
                         pass
                 except Exception as e:
-                    # Single-attempt mode: do not retry
+                    # Back to idle so the still-bound <Configure>/<Map> hook can retry (bounded, see _on_preview_map)
                     self.webview2 = None
                     self._webview2_last_error = e
+                    self._webview2_init_state = 0
+                    self._webview2_init_failures = getattr(self, '_webview2_init_failures', 0) + 1
                     log_message('warn', self.log, f"WebView2 init failed: {e.__class__.__name__}: {e}")
                     # Probe runtime presence and include in hint
                     try:
@@ -971,7 +1134,7 @@ class App(tk.Tk):
                     # If translation is missing/incomplete, fall back to a clear English hint
                     try:
                         key = 'hint.webview2.failed'
-                        tr = self._(key)
+                        tr = self._tr(key)
                     except Exception:
                         tr = None
                     if not tr or tr == key or len(str(tr).strip()) < 10:
@@ -989,102 +1152,46 @@ class App(tk.Tk):
             # After the tab is mapped, attempt the first initialization (avoid duplicate starts)
             def _schedule_wv_init(delay: int = 60):
                 try:
-                    if getattr(self, '_webview2_init_scheduled', False):
+                    if self._webview2_init_state:
                         return
-                    self._webview2_init_scheduled = True
+                    self._webview2_init_state = 1
                     self.after(delay, _init_webview2)
                 except Exception:
                     pass
-            try:
-                tab_preview.bind('<Map>', lambda *_: _schedule_wv_init(80))
-            except Exception:
-                pass
-            # Also try once at startup
-            try:
-                _schedule_wv_init(140)
-            except Exception:
-                pass
             # Save callbacks to allow re-initialization from later diagnostics/hints
             try:
                 self._init_webview2_cb = _init_webview2
                 self._schedule_wv_init_cb = _schedule_wv_init
             except Exception:
                 pass
+            # Event-driven first init: the hook fires when the tab gets a usable size and detaches
+            # itself once the control exists (or after _WV_INIT_MAX_FAILURES failed creations)
+            try:
+                self._preview_hook_ids = [(seq, tab_preview.bind(seq, self._on_preview_map, add='+'))
+                                          for seq in ('<Configure>', '<Map>')]
+            except Exception:
+                pass
         else:
             # Without tkwebview2, keep using the Text fallback preview
             pass
 
-        # Log tab content (Scrolled)
-        try:
-            self.log_text_container = ttk.Frame(tab_log)
-            self.log_text_container.pack(fill='both', expand=True, padx=6, pady=6)
-            self.txt_log = tk.Text(self.log_text_container, height=12)
-            self.sb_log = ttk.Scrollbar(self.log_text_container, orient='vertical', command=self.txt_log.yview)
-            self.txt_log.configure(yscrollcommand=self.sb_log.set)
-            # Pack Scrollbar before Text
-            self.sb_log.pack(side='right', fill='y')
-            self.txt_log.pack(side='left', fill='both', expand=True)
-        except Exception:
-            self.txt_log = tk.Text(tab_log, height=12)
-            self.txt_log.pack(fill='both', expand=True, padx=6, pady=6)
-        # Flush any early buffered logs now that log widget exists
-        try:
-            if hasattr(self, '_early_logs') and self._early_logs:
-                for _msg, _tag in self._early_logs:
-                    try:
-                        if _tag:
-                            self.txt_log.insert('end', _msg + '\n', _tag)
-                        else:
-                            self.txt_log.insert('end', _msg + '\n')
-                    except Exception:
-                        pass
-                self._early_logs.clear()
-        except Exception:
-            pass
-
-        # Markdown preview (Scrolled)
-        try:
-            self.md_text_container = ttk.Frame(tab_md)
-            self.md_text_container.pack(fill='both', expand=True, padx=6, pady=6)
-            self.txt_md = tk.Text(self.md_text_container, height=12)
-            self.sb_md = ttk.Scrollbar(self.md_text_container, orient='vertical', command=self.txt_md.yview)
-            self.txt_md.configure(yscrollcommand=self.sb_md.set)
-            self.sb_md.pack(side='right', fill='y')
-            self.txt_md.pack(side='left', fill='both', expand=True)
-        except Exception:
-            self.txt_md = tk.Text(tab_md, height=12)
-            self.txt_md.pack(fill='both', expand=True, padx=6, pady=6)
-
-        # JSON preview (Scrolled)
-        try:
-            self.json_text_container = ttk.Frame(tab_json)
-            self.json_text_container.pack(fill='both', expand=True, padx=6, pady=6)
-            self.txt_json = tk.Text(self.json_text_container, height=12)
-            self.sb_json = ttk.Scrollbar(self.json_text_container, orient='vertical', command=self.txt_json.yview)
-            self.txt_json.configure(yscrollcommand=self.sb_json.set)
-            self.sb_json.pack(side='right', fill='y')
-            self.txt_json.pack(side='left', fill='both', expand=True)
-        except Exception:
-            self.txt_json = tk.Text(tab_json, height=12)
-            self.txt_json.pack(fill='both', expand=True, padx=6, pady=6)
+        # Markdown / JSON / Log Text widgets are created on first tab activation (see _on_nb_tab_changed).
+        # The Log tab is built right away when messages are already buffered.
+        self._pending_tab_text: Dict[str, str] = {}
+        # Deferred Markdown/JSON producers: widget_attr -> (generation, producer, warn i18n key, on_done), run on first view
+        self._pending_tab_builders: Dict[str, tuple] = {}
+        self._tab_text_gen: Dict[str, int] = {}  # bumped by every new content/producer; stale producer results are dropped
+        # Coalesced Text updates from _safe_set_text (flushed once per idle tick)
+        self._pending_text: Dict[str, str] = {}
+        self._text_flush_id = None
+        self._text_chunk_gen: Dict[str, int] = {}  # per-widget generation for chunked inserts
+        if self._early_logs:
+            self._build_log_tab()
+        # Stays bound: every scan may register new deferred producers (see _defer_tab_text)
+        nb.bind('<<NotebookTabChanged>>', self._on_nb_tab_changed)
         # Initialize fonts for styled Text rendering (fallback path)
         self._init_fonts()
-        # Capture base line heights of text widgets for later scale compensation
-        try:
-            self._text_widgets = []
-            for _w_name in ('txt_html', 'txt_md', 'txt_json', 'txt_log'):
-                w = getattr(self, _w_name, None)
-                if w is not None:
-                    self._text_widgets.append(w)
-            self._text_base_heights = {}
-            for w in self._text_widgets:
-                try:
-                    self._text_base_heights[w] = int(w.cget('height') or 12)
-                except Exception:
-                    self._text_base_heights[w] = 12
-        except Exception:
-            self._text_widgets = []
-            self._text_base_heights = {}
+        self._init_font_bases()
 
         # Report which preview engine is active (helps user verify WebView2 is used)
         try:
@@ -1097,38 +1204,19 @@ class App(tk.Tk):
 
         # Copy toolbar omitted by design
 
-        # Log color tags (for simple visual categorization)
-        try:
-            self.txt_log.tag_config('INFO', foreground='#8aa2ff')
-            self.txt_log.tag_config('WARN', foreground='#ffb347')
-            self.txt_log.tag_config('ERROR', foreground='#ff6f6f')
-        except Exception:
-            pass
-
         # Filters UI (Preview only) — place BELOW Notebook content (after its creation)
         pad = PAD_MAIN  # backward compat local name for existing layout code below
-        self.ff = ttk.LabelFrame(frm, text=self._('filters.title'))
-        try:
-            self.ff.pack_forget()
-        except Exception:
-            pass
-        try:
-            self.nb.pack_forget()
-        except Exception:
-            pass
-        try:
-            self.pf.pack_forget()
-        except Exception:
-            pass
+        self.ff = ttk.LabelFrame(frm, text=self._tr('filters.title'))
+        # Pack exactly once in final order: Notebook, Filters, Preview options
         self.nb.pack(fill='both', expand=True, padx=PAD_MAIN['padx'], pady=PAD_MAIN['pady'])
         self.ff.pack(fill='x', padx=PAD_MAIN['padx'], pady=PAD_MAIN['pady'])
         self.pf.pack(fill='x', padx=PAD_MAIN['padx'], pady=PAD_MAIN['pady'])
         # Row 0: Mods / Class (entries)
-        self.lbl_filters_mods = ttk.Label(self.ff, text=self._('filters.mods'))
+        self.lbl_filters_mods = ttk.Label(self.ff, text=self._tr('filters.mods'))
         self.lbl_filters_mods.grid(row=0, column=0, sticky='e', padx=(8, 4), pady=6)
         self.ent_filter_mods = ttk.Entry(self.ff, textvariable=self.var_filter_mods)
         self.ent_filter_mods.grid(row=0, column=1, sticky='ew', padx=(0, 8), pady=6)
-        self.lbl_filters_class = ttk.Label(self.ff, text=self._('filters.class'))
+        self.lbl_filters_class = ttk.Label(self.ff, text=self._tr('filters.class'))
         self.lbl_filters_class.grid(row=0, column=2, sticky='e', padx=(8, 4), pady=6)
         self.ent_filter_class = ttk.Entry(self.ff, textvariable=self.var_filter_class)
         self.ent_filter_class.grid(row=0, column=3, sticky='ew', padx=(0, 8), pady=6)
@@ -1138,9 +1226,9 @@ class App(tk.Tk):
         self.ff_btn_row = ttk.Frame(self.ff)
         self.ff_btn_row.grid(row=1, column=0, columnspan=4, sticky='w', padx=btnpad['padx'], pady=btnpad['pady'])
         try:
-            self.btn_sym_all = ttk.Button(self.ff_btn_row, text=self._('filters.symptoms.all'), width=6, command=lambda: self._set_all_filters(True))
+            self.btn_sym_all = ttk.Button(self.ff_btn_row, text=self._tr('filters.symptoms.all'), width=6, command=lambda: self._set_all_filters(True))
             self.btn_sym_all.pack(side='left', padx=(0,4))
-            self.btn_sym_none = ttk.Button(self.ff_btn_row, text=self._('filters.symptoms.none'), width=8, command=lambda: self._set_all_filters(False))
+            self.btn_sym_none = ttk.Button(self.ff_btn_row, text=self._tr('filters.symptoms.none'), width=8, command=lambda: self._set_all_filters(False))
             self.btn_sym_none.pack(side='left', padx=(0,8))
         except Exception:
             pass
@@ -1149,44 +1237,23 @@ class App(tk.Tk):
         _ckpad = PAD_TIGHT
         self.ff_sev_row = ttk.Frame(self.ff)
         self.ff_sev_row.grid(row=2, column=0, columnspan=4, sticky='ew', padx=_ckpad['padx'], pady=_ckpad['pady'])
+        self._cfg_cols(self.ff_sev_row, {0: 0, 1: 1})
+        self.ff.rowconfigure(2, minsize=26)
         try:
-            self.ff_sev_row.columnconfigure(0, weight=0)
-            self.ff_sev_row.columnconfigure(1, weight=1)
-        except Exception:
-            pass
-        try:
-            self.ff.rowconfigure(2, minsize=26)
-        except Exception:
-            pass
-        try:
-            self.lbl_severity = ttk.Label(self.ff_sev_row, text=self._('filters.severity'))
+            self.lbl_severity = ttk.Label(self.ff_sev_row, text=self._tr('filters.severity'))
             self.lbl_severity.grid(row=0, column=0, sticky='w', padx=(0, 10))
         except Exception:
             self.lbl_severity = None
-        try:
-            self.ff_sev_checks = ttk.Frame(self.ff_sev_row)
-            self.ff_sev_checks.grid(row=0, column=1, sticky='ew')
-            self._sev_layout_scheduled = False
-            self._sev_layout_last_avail = None
-            self.ff_sev_checks.bind('<Configure>', self._on_sev_checks_configure)
-        except Exception:
-            self.ff_sev_checks = None
-        self.chk_sev_c = ttk.Checkbutton(self.ff_sev_checks, text=self._('filters.sev.critical'), variable=self.var_filter_sev_critical)
-        self.chk_sev_h = ttk.Checkbutton(self.ff_sev_checks, text=self._('filters.sev.high'), variable=self.var_filter_sev_high)
-        self.chk_sev_m = ttk.Checkbutton(self.ff_sev_checks, text=self._('filters.sev.medium'), variable=self.var_filter_sev_medium)
-        self.chk_sev_l = ttk.Checkbutton(self.ff_sev_checks, text=self._('filters.sev.low'), variable=self.var_filter_sev_low)
+        self.ff_sev_checks = ttk.Frame(self.ff_sev_row)
+        self.ff_sev_checks.grid(row=0, column=1, sticky='ew')
+        self._sev_layout_token = None
+        self._sev_layout_last_avail = None
+        self.ff_sev_checks.bind('<Configure>', self._on_sev_checks_configure)
+        self._create_severity_checks()
         self._relayout_severity_checks()
-        try:
-            if hasattr(self, 'ff_sev_row') and self.ff_sev_row is not None:
-                self.ff_sev_row.bind('<Map>', lambda *_: self._on_sev_checks_configure())
-        except Exception:
-            pass
-        try:
-            self.after(120, lambda: self._on_sev_checks_configure())
-        except Exception:
-            pass
-        for c in range(0, 4):
-            self.ff.columnconfigure(c, weight=1 if c in (1, 3) else 0)
+        self.ff_sev_row.bind('<Map>', lambda *_: self._on_sev_checks_configure())
+        self.after(120, lambda: self._on_sev_checks_configure())
+        self._cfg_cols(self.ff, {0: 0, 1: 1, 2: 0, 3: 1})
 
         # Row 3: Symptom checkboxes (labels from i18n; values bound to internal codes)
         try:
@@ -1194,26 +1261,20 @@ class App(tk.Tk):
             self.ff_sym_row.grid(row=3, column=0, columnspan=4, sticky='ew', padx=4, pady=(0,4))
             self.ff_sym_row.columnconfigure(0, weight=0)
             self.ff_sym_row.columnconfigure(1, weight=1, minsize=320)
+            self.ff.rowconfigure(3, minsize=26)
             try:
-                self.ff.rowconfigure(3, minsize=26)
-            except Exception:
-                pass
-            try:
-                sym_label = self._('impact.label')
+                sym_label = self._tr('impact.label')
                 self.lbl_symptoms = ttk.Label(self.ff_sym_row, text=sym_label)
                 self.lbl_symptoms.grid(row=0, column=0, sticky='w', padx=(0, 10))
             except Exception:
                 self.lbl_symptoms = None
             # Right-side frame for symptom checkbuttons (auto-wrap via grid)
-            try:
-                self.ff_sym_checks = ttk.Frame(self.ff_sym_row)
-                self.ff_sym_checks.grid(row=0, column=1, sticky='ew')
-                # Due to frequent resizes, schedule via debounce instead of calling directly
-                self._sym_layout_scheduled = False
-                self._sym_layout_last_avail = None
-                self.ff_sym_checks.bind('<Configure>', self._on_sym_checks_configure)
-            except Exception:
-                self.ff_sym_checks = None
+            self.ff_sym_checks = ttk.Frame(self.ff_sym_row)
+            self.ff_sym_checks.grid(row=0, column=1, sticky='ew')
+            # Due to frequent resizes, schedule via debounce instead of calling directly
+            self._sym_layout_token = None
+            self._sym_layout_last_avail = None
+            self.ff_sym_checks.bind('<Configure>', self._on_sym_checks_configure)
             # Build initial row (uses current language order if provided)
             try:
                 self._build_symptom_filter_row()
@@ -1222,152 +1283,455 @@ class App(tk.Tk):
         except Exception:
             pass
 
-    def _wire_events(self):
-        """Connect widget callbacks and setup dynamic enable/disable logic for outputs."""
-        # Root/settings browse now handled exclusively in the Output Settings window.
-        # React to language changes regardless of source (menu radiobutton)
+    # --- Lazily built Markdown / JSON / Log tabs ------------------------------------
+    def _on_nb_tab_changed(self, event=None):
+        """Build the Text widget of the newly selected tab on first activation and start its deferred producer."""
         try:
-            self.var_lang.trace_add('write', lambda *_: self.on_change_language())
+            current = self.nb.nametowidget(self.nb.select())
         except Exception:
-            pass
+            return
+        attr = None
+        if current is self._tab_md:
+            attr = 'txt_md'
+            if self.txt_md is None:
+                self._build_md_tab()
+        elif current is self._tab_json:
+            attr = 'txt_json'
+            if self.txt_json is None:
+                self._build_json_tab()
+        elif current is self._tab_log and self.txt_log is None:
+            self._build_log_tab()
+        if attr is not None and attr in self._pending_tab_builders:
+            self._start_tab_producer(attr)
+
+    def _defer_tab_text(self, widget_attr: str, producer: Callable[[], str], warn_key: str,
+                        on_done: Optional[Callable[[str], Any]] = None):
+        """Tk thread: fill the Markdown/JSON tab from ``producer`` the next time it is selected.
+
+        The producer runs on its own thread, so it must not touch Tk or shared caches; ``on_done``
+        (Tk thread) receives the text before it is shown. Any newer content supersedes it.
+        """
+        self._pending_tab_text.pop(widget_attr, None)
+        gen = self._tab_text_gen[widget_attr] = self._tab_text_gen.get(widget_attr, 0) + 1
+        self._pending_tab_builders[widget_attr] = (gen, producer, warn_key, on_done)
+        # The tab may already be the selected one
+        self._on_nb_tab_changed()
+
+    def _start_tab_producer(self, widget_attr: str):
+        """Run the pending producer of ``widget_attr`` off the Tk thread and post its result back."""
+        pending = self._pending_tab_builders.pop(widget_attr, None)
+        if pending is None:
+            return
+        gen, producer, warn_key, on_done = pending
 
-        # Update preview when font scale changes
-        try:
-            def _on_scale(*_):
-                # Apply scaling and re-render while preserving current window geometry
-                try:
-                    self._apply_font_scale_preserving_size()
-                except Exception:
-                    # Fallback if anything fails
-                    try:
-                        self.apply_font_scale()
-                    except Exception:
-                        pass
-                    try:
-                        self._rerender_preview()
-                    except Exception:
-                        pass
-                    try:
-                        self._update_font_px_label()
-                    except Exception:
-                        pass
-            self.var_font_scale.trace_add('write', lambda *_: _on_scale())
-            # Some ttk.Scale implementations don't update variable on drag without command, add one
-            if hasattr(self, 'sld_font_scale'):
-                self.sld_font_scale.configure(command=lambda *_: _on_scale())
-            # Ensure initial application so baseline capture occurs and initial value is reflected
-            try:
-                self._apply_font_scale_preserving_size()
-            except Exception:
+        def _apply(text: str):
+            if self._tab_text_gen.get(widget_attr) != gen:
+                return  # newer content arrived while producing
+            if on_done is not None:
                 try:
-                    self.apply_font_scale()
+                    on_done(text)
                 except Exception:
                     pass
-        except Exception:
-            pass
+            self._safe_set_text(widget_attr, text)
 
-        # Update output field enabled state based on checkboxes
-        def toggle_outputs(*_):
-            """Enable/disable output path entries if they exist (created in Output Settings window)."""
-            # If the Output Settings window is not open, return silently (getattr avoids exceptions).
-            ent_html = getattr(self, 'ent_out_html', None)
-            ent_md = getattr(self, 'ent_out_md', None)
-            ent_json = getattr(self, 'ent_out_json', None)
-            if not any([ent_html, ent_md, ent_json]):
-                return
-            state_html = 'normal' if self.var_enable_preview.get() else 'disabled'
-            state_md = 'normal' if self.var_enable_md.get() else 'disabled'
-            state_json = 'normal' if self.var_enable_json.get() else 'disabled'
-            try:
-                if ent_html is not None:
-                    ent_html.configure(state=state_html)
-                btn_html = getattr(self, 'btn_browse_html', None)
-                if btn_html is not None:
-                    btn_html.configure(state=state_html)
-            except Exception:
-                pass
-            try:
-                if ent_md is not None:
-                    ent_md.configure(state=state_md)
-                btn_md = getattr(self, 'btn_browse_md', None)
-                if btn_md is not None:
-                    btn_md.configure(state=state_md)
-            except Exception:
-                pass
+        def _run():
             try:
-                if ent_json is not None:
-                    ent_json.configure(state=state_json)
-                btn_json = getattr(self, 'btn_browse_json', None)
-                if btn_json is not None:
-                    btn_json.configure(state=state_json)
-            except Exception:
-                pass
-        self.var_enable_preview.trace_add('write', toggle_outputs)
-        self.var_enable_md.trace_add('write', toggle_outputs)
-        self.var_enable_json.trace_add('write', toggle_outputs)
-        # Re-render when wrapMethod coexistence toggle changes (affects preview and outputs)
+                text = producer()
+            except Exception as e:
+                self._log_i18n('[WARN]', warn_key, err=str(e))
+                return
+            # Own coalescing key: a queued concrete set_preview_* under 'tab_md'/'tab_json' must not be replaced
+            self._post_ui(lambda: _apply(text), key=widget_attr + ':produced')
+        threading.Thread(target=_run, daemon=True, name='rcr-' + widget_attr).start()
+
+    def _build_log_tab(self):
+        """Create the Log tab Text widget and flush buffered early log lines."""
+        # Log tab content (Scrolled)
         try:
-            self.var_include_wrap.trace_add('write', lambda *_: self._on_include_wrap_toggle())
+            self.txt_log, self.log_text_container = self._make_scrolled_text(self._tab_log)
         except Exception:
-            pass
-        toggle_outputs()
-        # Save settings on window close
-        self.protocol('WM_DELETE_WINDOW', self._on_close)
-
-        # --- Real-time filter updates (debounced) ---
+            self.txt_log = tk.Text(self._tab_log, height=12)
+            self.txt_log.pack(fill='both', expand=True, padx=6, pady=6)
+            self._track_text_widget(self.txt_log, 12)
+        # Flush any early buffered logs now that log widget exists
         try:
-            # Debounced schedule helper to avoid rendering on every keystroke
-            self._filter_after_id = None
-            def _schedule_rerender(delay_ms: int = 180):
+            if hasattr(self, '_early_logs') and self._early_logs:
+                # Single Text.insert with (chars, tags) pairs: keeps message order and
+                # collapses consecutive lines sharing a tag into one chunk.
+                runs: list = []
+                if self._early_logs_dropped:
+                    runs.append(([f"[INFO] {self._early_logs_dropped} earlier log line(s) omitted"], 'INFO'))
+                    self._early_logs_dropped = 0
+                for _msg, _tag in self._early_logs:
+                    _tag = _tag or ''
+                    if runs and runs[-1][1] == _tag:
+                        runs[-1][0].append(_msg)
+                    else:
+                        runs.append(([_msg], _tag))
+                args: list = []
+                for _lines, _tag in runs:
+                    args.append('\n'.join(_lines) + '\n')
+                    args.append(_tag or ())
                 try:
-                    if self._filter_after_id is not None:
-                        self.after_cancel(self._filter_after_id)
+                    self.txt_log.insert('end', *args)
                 except Exception:
                     pass
-                try:
-                    self._filter_after_id = self.after(delay_ms, self._rerender_preview)
-                except Exception:
-                    # fallback immediate
-                    self._rerender_preview()
-
-            self._schedule_rerender = _schedule_rerender  # stash for reuse
-
-            # Text filters: on change -> debounced re-render
-            self.var_filter_mods.trace_add('write', lambda *_: _schedule_rerender())
-            self.var_filter_class.trace_add('write', lambda *_: _schedule_rerender())
-            # Severity toggles: immediate (still cheap) or lightly debounced
-            self.var_filter_sev_critical.trace_add('write', lambda *_: _schedule_rerender(100))
-            self.var_filter_sev_high.trace_add('write', lambda *_: _schedule_rerender(100))
-            self.var_filter_sev_medium.trace_add('write', lambda *_: _schedule_rerender(100))
-            self.var_filter_sev_low.trace_add('write', lambda *_: _schedule_rerender(100))
+                self._early_logs.clear()
         except Exception:
             pass
+        # Log color tags (for simple visual categorization)
+        self.txt_log.tag_config('INFO', foreground='#8aa2ff')
+        self.txt_log.tag_config('WARN', foreground='#ffb347')
+        self.txt_log.tag_config('ERROR', foreground='#ff6f6f')
+        self._register_lazy_text_widget(self.txt_log)
 
-    def _on_mode_toggle(self):
-        # Update mode text and internal flags for downstream logic
-        if self.var_mode_conflicts.get():
-            self.var_mode_text.set(self._('mode.conflicts'))
-            self.var_conflicts_only.set(True)
-            self.var_include_reference.set(False)
-        else:
-            self.var_mode_text.set(self._('mode.reference'))
-            self.var_conflicts_only.set(False)
-            self.var_include_reference.set(True)
-
-    def on_toggle_dark(self):
-        # Update label and re-apply theme
-        if self.var_dark_mode.get():
-            self.var_dark_label.set(self._('theme.dark'))
-        else:
-            self.var_dark_label.set(self._('theme.light'))
-        self.apply_theme()
+    def _build_md_tab(self):
+        """Create the Markdown preview Text widget."""
+        # Markdown preview (Scrolled)
         try:
-            self._update_status_bar()
+            self.txt_md, self.md_text_container = self._make_scrolled_text(self._tab_md)
         except Exception:
-            pass
+            self.txt_md = tk.Text(self._tab_md, height=12)
+            self.txt_md.pack(fill='both', expand=True, padx=6, pady=6)
+            self._track_text_widget(self.txt_md, 12)
+        self._register_lazy_text_widget(self.txt_md, 'txt_md')
 
-    def _toggle_dark_clicked(self):
-        """Toggle dark mode from the right-aligned theme button and update its label."""
+    def _build_json_tab(self):
+        """Create the JSON preview Text widget."""
+        # JSON preview (Scrolled)
+        try:
+            self.txt_json, self.json_text_container = self._make_scrolled_text(self._tab_json)
+        except Exception:
+            self.txt_json = tk.Text(self._tab_json, height=12)
+            self.txt_json.pack(fill='both', expand=True, padx=6, pady=6)
+            self._track_text_widget(self.txt_json, 12)
+        self._register_lazy_text_widget(self.txt_json, 'txt_json')
+
+    def _make_scrolled_text(self, parent, height: int = 12) -> Tuple[tk.Text, ttk.Frame]:
+        """Create a Frame + Text + vertical Scrollbar inside parent and track the Text; returns (text, frame)."""
+        frame = ttk.Frame(parent)
+        frame.pack(fill='both', expand=True, padx=6, pady=6)
+        text = tk.Text(frame, height=height)
+        sb = ttk.Scrollbar(frame, orient='vertical', command=text.yview)
+        text.configure(yscrollcommand=sb.set)
+        # Pack scrollbar first to prevent width=0 at high font scales
+        sb.pack(side='right', fill='y')
+        text.pack(side='left', fill='both', expand=True)
+        self._track_text_widget(text, height)
+        return text, frame
+
+    def _track_text_widget(self, w, height: int):
+        """Record a Text widget and its creation-time height (avoids cget round-trips later)."""
+        self._text_widgets.append(w)
+        self._text_base_heights[w] = height
+        self._text_last_heights[w] = height
+
+    def _register_lazy_text_widget(self, w, widget_attr: Optional[str] = None):
+        """Bring a Text widget created after startup in line with theme/font scale and pending content."""
+        self._geom_dirty = True  # new tab content changes the requested layout
+        # During _build_ui the regular setup (_init_fonts / apply_theme) covers it
+        if not self._ui_ready:
+            return
+        try:
+            apply_text_widget_theme(w, self._is_dark_mode())
+        except Exception:
+            pass
+        try:
+            if self._font_bases_ready:
+                self._capture_content_font(w)
+            self.apply_font_scale()
+        except Exception:
+            pass
+        content = self._pending_tab_text.pop(widget_attr, None) if widget_attr else None
+        if content is not None:
+            self._safe_set_text(widget_attr, content)
+
+    def _init_font_bases(self):
+        """Capture unscaled fonts of the content Text widgets that exist after _init_fonts.
+
+        Widgets built later (lazy tabs) are captured by _register_lazy_text_widget.
+        """
+        self._content_fonts = {}
+        self._content_font_bases = {}
+        for w in (getattr(self, 'txt_md', None), getattr(self, 'txt_json', None), getattr(self, 'txt_log', None), getattr(self, 'txt_html', None)):
+            if w is None:
+                continue
+            try:
+                self._capture_content_font(w)
+            except Exception:
+                pass
+        self._font_bases_ready = True
+
+    def _capture_content_font(self, w):
+        """Bind a persistent Font to a content Text widget and record its unscaled base."""
+        f = tkfont.Font(font=w.cget('font'))
+        w.configure(font=f)
+        self._content_fonts[w] = f
+        self._content_font_bases[w] = {
+            'family': f.cget('family'),
+            'size': int(f.cget('size') or 12),
+            'weight': f.cget('weight'),
+            'slant': f.cget('slant')
+        }
+
+    @staticmethod
+    def _cfg_cols(frame, weights: Dict[int, int]) -> None:
+        """Apply grid column weights from a {column: weight} mapping in one pass."""
+        for col, weight in weights.items():
+            frame.columnconfigure(col, weight=weight)
+
+    def _wire_events(self):
+        """Connect widget callbacks and setup dynamic enable/disable logic for outputs."""
+        # Root/settings browse now handled exclusively in the Output Settings window.
+        # React to language changes regardless of source (menu radiobutton)
+        try:
+            self.var_lang.trace_add('write', lambda *_: self.on_change_language())
+        except Exception:
+            pass
+
+        # Update preview when font scale changes (debounced; the slider writes the variable itself)
+        try:
+            self._font_apply_token = None
+            self.var_font_scale.trace_add('write', self._schedule_font_apply)
+        except Exception:
+            pass
+        # Ensure initial application so baseline capture occurs and initial value is reflected
+        self._flush_font_apply()
+
+        # Update output field enabled state based on checkboxes: (entry attr, browse button attr, enable var)
+        self._output_toggle_spec = [
+            ('ent_out_html', 'btn_browse_html', self.var_enable_preview),
+            ('ent_out_md', 'btn_browse_md', self.var_enable_md),
+            ('ent_out_json', 'btn_browse_json', self.var_enable_json),
+        ]
+        def toggle_outputs(*_):
+            """Enable/disable output path entries if they exist (created in Output Settings window)."""
+            # If the Output Settings window is not open, return silently (getattr avoids exceptions).
+            for ent_attr, btn_attr, var in self._output_toggle_spec:
+                ent = getattr(self, ent_attr, None)
+                if ent is None:
+                    continue
+                try:
+                    state = 'normal' if var.get() else 'disabled'
+                    ent.configure(state=state)
+                    btn = getattr(self, btn_attr, None)
+                    if btn is not None:
+                        btn.configure(state=state)
+                except Exception:
+                    pass
+        self.var_enable_preview.trace_add('write', toggle_outputs)
+        self.var_enable_md.trace_add('write', toggle_outputs)
+        self.var_enable_json.trace_add('write', toggle_outputs)
+        # Re-render when wrapMethod coexistence toggle changes (affects preview and outputs)
+        try:
+            self.var_include_wrap.trace_add('write', lambda *_: self._on_include_wrap_toggle())
+        except Exception:
+            pass
+        toggle_outputs()
+        # Save settings on window close
+        self.protocol('WM_DELETE_WINDOW', self._on_close)
+
+        # --- Real-time filter updates (debounced) ---
+        try:
+            # Debounced schedule helper to avoid rendering on every keystroke
+            self._filter_after_id = None
+            self._filter_refresh_token = None
+            self._filter_dirty_mask = 0
+            self._in_bulk_filter_set = False
+            def _schedule_rerender(delay_ms: int = 180):
+                try:
+                    if self._filter_after_id is not None:
+                        self.after_cancel(self._filter_after_id)
+                except Exception:
+                    pass
+                try:
+                    self._filter_after_id = self.after(delay_ms, self._apply_filters)
+                except Exception:
+                    # fallback immediate
+                    self._apply_filters()
+
+            self._schedule_rerender = _schedule_rerender  # stash for reuse
+
+            # All filter variables share one trace command (registered once with Tcl):
+            # text filters -> keystroke debounce, severity/symptom toggles -> coalesced idle re-render
+            self._filter_text_var_names = {str(self.var_filter_mods), str(self.var_filter_class)}
+            cbname = self.register(self._on_filter_var_change)
+            filter_vars = [self.var_filter_mods, self.var_filter_class]
+            filter_vars += [getattr(self, var_attr) for _code, _attr, var_attr in self._SEV_SPEC]
+            filter_vars += list((self.var_filter_symptoms or {}).values())
+            for var in filter_vars:
+                self.tk.call('trace', 'add', 'variable', str(var), 'write', cbname)
+        except Exception:
+            pass
+
+    def _nudge_font_scale(self, delta: float):
+        """Move scale to the next/previous 10%-step so percentage ones digit becomes 0."""
+        try:
+            cur = float(self.var_font_scale.get() or 1.0)
+        except Exception:
+            cur = 1.0
+        cur = max(0.5, min(1.5, cur))
+        n = cur * 10.0
+        if delta > 0:
+            new_n = math.floor(n + 1e-6) + 1
+        else:
+            new_n = math.ceil(n - 1e-6) - 1
+        new_val = max(0.5, min(1.5, new_n / 10.0))
+        self.var_font_scale.set(round(new_val, 1))
+
+    def _nudge_font_dec(self):
+        self._nudge_font_scale(-0.10)
+
+    def _nudge_font_inc(self):
+        self._nudge_font_scale(+0.10)
+
+    def _preview_ready(self) -> bool:
+        """True when the Preview tab is mapped and large enough to host WebView2."""
+        tab = self._tab_preview
+        return bool(tab.winfo_ismapped()) and tab.winfo_width() >= 50 and tab.winfo_height() >= 50
+
+    _WV_INIT_MAX_FAILURES = 3
+    _WV_RETRY_BACKOFF_MS = 1000  # per failed attempt; a resize drag must not replay every init at once
+
+    def _on_preview_map(self, event=None):
+        """<Map>/<Configure> hook on the Preview tab: schedule WebView2 init outside the geometry event.
+
+        The control is created (and packed into this tab) from after_idle, not from the tab's own
+        <Configure>. The hook stays bound until creation succeeded or failed _WV_INIT_MAX_FAILURES times.
+        """
+        try:
+            if self._webview2_init_state:
+                return
+            if not self._preview_ready():
+                return
+            self._webview2_init_state = 1
+            self.after_idle(self._run_preview_init)
+        except Exception:
+            self._webview2_init_state = 0
+
+    def _run_preview_init(self):
+        """Idle callback for _on_preview_map: one init attempt, then detach the hook or back off."""
+        failures_before = getattr(self, '_webview2_init_failures', 0)
+        try:
+            self._init_webview2_cb()
+        except Exception:
+            self._webview2_init_state = 0
+        failures = getattr(self, '_webview2_init_failures', 0)
+        if getattr(self, 'webview2', None) is not None or failures >= self._WV_INIT_MAX_FAILURES:
+            self._detach_preview_hook()
+        elif failures > failures_before:
+            # Hold the state busy for a while so the next resize events don't retry immediately
+            self._webview2_init_state = 1
+
+            def _rearm():
+                if getattr(self, 'webview2', None) is None:
+                    self._webview2_init_state = 0
+            try:
+                self.after(self._WV_RETRY_BACKOFF_MS * failures, _rearm)
+            except Exception:
+                self._webview2_init_state = 0
+
+    def _detach_preview_hook(self):
+        """Remove only the Preview tab's own <Configure>/<Map> bindings (other handlers stay)."""
+        for seq, funcid in getattr(self, '_preview_hook_ids', None) or []:
+            self._unbind_func(seq, funcid, widget=self._tab_preview)
+        self._preview_hook_ids = []
+
+    def _on_scale_click(self, event):
+        """Move the slider thumb to the click position. If near the thumb (±8px), allow default drag start."""
+        try:
+            w = max(1, event.widget.winfo_width())
+            from_v = self._scale_from
+            to_v = self._scale_to
+            cur = float(self.var_font_scale.get() or from_v)
+            frac_cur = (cur - from_v) / (to_v - from_v) if to_v != from_v else 0
+            thumb_x = frac_cur * w
+            if abs(event.x - thumb_x) <= 8:
+                # Default ttk drag starts here; see _on_scale_release
+                self._scale_dragging = True
+                self._scale_drag_dirty = False
+                return
+            x = min(max(0, event.x), w)
+            frac = x / w
+            val = from_v + (to_v - from_v) * frac
+            val = max(from_v, min(to_v, round(val * 100) / 100))
+            # Skip no-op writes (each write schedules a re-render)
+            if round(cur * 100) != round(val * 100):
+                self.var_font_scale.set(val)
+            return 'break'
+        except Exception:
+            return 'break'
+
+    # Trailing debounce delays (ms) for font-scale applies: idle writes / during a thumb drag
+    # (label only) / after the drag is released (final full apply)
+    _FONT_APPLY_DELAY_MS = 200
+    _FONT_APPLY_DRAG_MS = 50
+    _FONT_APPLY_RELEASE_MS = 300
+
+    def _schedule_font_apply(self, *_, delay: Optional[int] = None):
+        """Apply the font scale once writes to var_font_scale have been quiet for a short while."""
+        if delay is None:
+            delay = self._FONT_APPLY_DRAG_MS if getattr(self, '_scale_dragging', False) else self._FONT_APPLY_DELAY_MS
+        tok = getattr(self, '_font_apply_token', None)
+        try:
+            if tok is not None:
+                self.after_cancel(tok)
+            self._font_apply_token = self.after(delay, self._flush_font_apply)
+        except Exception:
+            self._font_apply_token = None
+            self._flush_font_apply()
+
+    def _on_scale_release(self, _event=None):
+        """End of a thumb drag: replace the cheap drag-time updates with one full apply."""
+        if not getattr(self, '_scale_dragging', False):
+            return
+        self._scale_dragging = False
+        if getattr(self, '_font_apply_token', None) is None and not self._scale_drag_dirty:
+            return
+        self._schedule_font_apply(delay=self._FONT_APPLY_RELEASE_MS)
+
+    def _flush_font_apply(self):
+        self._font_apply_token = None
+        # While dragging only the px label follows the thumb; the heavy work runs on release
+        if getattr(self, '_scale_dragging', False):
+            self._scale_drag_dirty = True
+            safe_call(self._update_font_px_label)
+            return
+        self._scale_drag_dirty = False
+        # Apply scaling and re-render while preserving current window geometry
+        try:
+            self._apply_font_scale_preserving_size()
+        except Exception:
+            # Fallback if anything fails
+            safe_call(self.apply_font_scale)
+            safe_call(self._rerender_preview)
+            safe_call(self._update_font_px_label)
+
+    def _on_mode_toggle(self):
+        # Update mode text and internal flags for downstream logic
+        if self.var_mode_conflicts.get():
+            self.tk.globalsetvar(self._vn_mode_text, self._tr('mode.conflicts'))
+            self._conflicts_only = True
+            self._include_reference = False
+        else:
+            self.tk.globalsetvar(self._vn_mode_text, self._tr('mode.reference'))
+            self._conflicts_only = False
+            self._include_reference = True
+
+    def on_toggle_dark(self):
+        # Update label and re-apply theme
+        if self.var_dark_mode.get():
+            self.var_dark_label.set(self._tr('theme.dark'))
+        else:
+            self.var_dark_label.set(self._tr('theme.light'))
+        self.apply_theme()
+        try:
+            self._update_status_bar()
+        except Exception:
+            pass
+
+    def _toggle_dark_clicked(self):
+        """Toggle dark mode from the right-aligned theme button and update its label."""
         try:
             self.var_dark_mode.set(not bool(self.var_dark_mode.get()))
             # on_toggle_dark will update label and theme
@@ -1375,14 +1739,21 @@ class App(tk.Tk):
         except Exception:
             pass
 
-    def apply_theme(self):
-        dark = self.var_dark_mode.get()
+    def apply_theme(self, force: bool = False):
+        dark = bool(self.var_dark_mode.get())
+        # Full restyle + re-render is expensive; skip repeats once the UI has been themed
+        if not force and getattr(self, '_ui_ready', False) and getattr(self, '_last_applied_dark', None) == dark:
+            return
+        if getattr(self, '_ui_ready', False):
+            self._last_applied_dark = dark
+        self._theme_class_cached = 'dark' if dark else ''
+        self._geom_dirty = True  # restyled widgets may request new sizes
         if dark:
             _setup_style_dark(self.style)
         else:
             _setup_style_light(self.style)
         # Keep the label in sync too
-        self.var_dark_label.set(self._('theme.dark') if dark else self._('theme.light'))
+        self.var_dark_label.set(self._tr('theme.dark') if dark else self._tr('theme.light'))
         # Apply to text widget explicitly
         try:
             txt_log = getattr(self, 'txt_log', None)
@@ -1399,10 +1770,12 @@ class App(tk.Tk):
                 apply_text_widget_theme(txt_html, dark)
         except Exception:
             pass
-        # Re-render HTML with theme-aware styles if we have prior content
+        # Re-theme the HTML preview: flip the body class in place when WebView2 can run script,
+        # otherwise re-wrap and reload the last body
         if getattr(self, '_last_html_body', ''):
             try:
-                self.set_preview_html_from_body(self._last_html_body)
+                if not self._webview2_set_theme_class(dark):
+                    self.set_preview_html_from_body(self._last_html_body)
             except Exception:
                 pass
         # Re-render styled Text fallback if applicable
@@ -1433,39 +1806,59 @@ class App(tk.Tk):
 
     # ---- Session Temp Directory Management ---------------------------------
     def _init_session_temp_dir(self):
-        """Create per-run temp directory and prune old/oversized sessions.
+        """Create per-run temp directory and prune old/oversized sessions in the background.
 
         Layout:
             %TEMP%/RedScriptConflictGUI/session_YYYYMMDD_HHMMSS_<id>/
         """
+        self._create_session_dir()
+        # Snapshot limits on the Tk thread; the worker must not touch self/Tk state
+        max_days = getattr(self, '_temp_max_days', 5) or 5
+        max_total_mb = getattr(self, '_temp_max_total_mb', 300) or 300
+        try:
+            threading.Thread(
+                target=self._prune_old_sessions,
+                args=(self._temp_base_dir, self.session_temp_dir, max_days, max_total_mb),
+                name='rcr-temp-prune',
+                daemon=True,
+            ).start()
+        except Exception:
+            pass
+
+    def _create_session_dir(self):
+        """Create the session directory synchronously (cheap: one mkdir)."""
         base = self._temp_base_dir
         try:
             base.mkdir(exist_ok=True)
         except Exception:
             pass
-        # Prune existing sessions by age & size
+        ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+        sid = secrets.token_hex(4)
+        session_dir = base / f'session_{ts}_{sid}'
         try:
-            sessions = []  # list[(Path, datetime, int)]
+            session_dir.mkdir(exist_ok=True)
+            self.session_temp_dir = session_dir
+        except Exception:
+            self.session_temp_dir = None
+
+    @staticmethod
+    def _prune_old_sessions(base: Path, keep: Optional[Path], max_days: int, max_total_mb: int):
+        """Prune existing sessions by age & size (runs on a worker thread; filesystem only)."""
+        try:
+            sessions = []  # list[(Path, mtime seconds, int)]
             total = 0
             for p in base.glob('session_*'):
                 try:
-                    if not p.is_dir():
+                    if p == keep or not p.is_dir():
                         continue
-                    stat = p.stat()
-                    mtime = datetime.utcfromtimestamp(stat.st_mtime)
-                    size = 0
-                    try:
-                        for f in p.rglob('*'):
-                            if f.is_file():
-                                size += f.stat().st_size
-                    except Exception:
-                        pass
+                    mtime = p.stat().st_mtime
+                    size = _dir_size_scandir(p)
                     sessions.append((p, mtime, size))
                     total += size
                 except Exception:
                     pass
             # Age pruning
-            cutoff = datetime.now(timezone.utc) - timedelta(days=getattr(self, '_temp_max_days', 5) or 5)
+            cutoff = time.time() - max_days * 86400.0
             for p, mtime, size in list(sessions):
                 if mtime < cutoff:
                     try:
@@ -1475,7 +1868,7 @@ class App(tk.Tk):
                     except Exception:
                         pass
             # Size pruning
-            limit_bytes = (getattr(self, '_temp_max_total_mb', 300) or 300) * 1024 * 1024
+            limit_bytes = max_total_mb * 1024 * 1024
             if total > limit_bytes:
                 for p, mtime, size in sorted(sessions, key=lambda t: t[1]):  # oldest first
                     if total <= limit_bytes:
@@ -1487,15 +1880,6 @@ class App(tk.Tk):
                         pass
         except Exception:
             pass
-        # Create session directory
-        ts = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
-        sid = uuid.uuid4().hex[:8]
-        session_dir = base / f'session_{ts}_{sid}'
-        try:
-            session_dir.mkdir(exist_ok=True)
-            self.session_temp_dir = session_dir
-        except Exception:
-            self.session_temp_dir = None
 
     def _cleanup_session_temp_dir(self):
         if getattr(self, '_retain_temp_files', False):
@@ -1514,11 +1898,30 @@ class App(tk.Tk):
         d = getattr(self, 'session_temp_dir', None)
         if d:
             try:
-                shutil.rmtree(d, ignore_errors=True)
+                _fast_rmtree(d)
             except Exception:
                 pass
 
     def _cleanup_session_temp_dir_atexit(self):
+        # Give the background cleanup a short grace period; the next startup purges leftovers
+        t = self._start_temp_cleanup()
+        if t is not None:
+            t.join(0.5)
+
+    def _start_temp_cleanup(self) -> Optional[threading.Thread]:
+        """Start (once) a daemon thread running the temp cleanup so closing isn't delayed by deletes."""
+        t = getattr(self, '_temp_cleanup_thread', None)
+        if t is None:
+            try:
+                t = threading.Thread(target=self._cleanup_temp_body, name='rcr-temp-cleanup', daemon=True)
+                t.start()
+                self._temp_cleanup_thread = t
+            except Exception:
+                self._cleanup_temp_body()
+                return None
+        return t
+
+    def _cleanup_temp_body(self):
         try:
             self._cleanup_session_temp_dir()
         except Exception:
@@ -1540,7 +1943,7 @@ class App(tk.Tk):
             return
         try:
             if base.exists():
-                shutil.rmtree(base, ignore_errors=True)
+                _fast_rmtree(base)
         except Exception:
             pass
 
@@ -1550,7 +1953,14 @@ class App(tk.Tk):
 
         Returns: { found: bool, version: Optional[str], path: Optional[str] }
         Note: This is diagnostic only; initialization still relies on tkwebview2 internals.
+        The result is cached for the session (installed runtimes don't change while we run).
         """
+        cached = getattr(self, '_webview2_probe_cache', None)
+        if cached is None:
+            cached = self._webview2_probe_cache = self._probe_webview2_runtime_uncached()
+        return dict(cached)
+
+    def _probe_webview2_runtime_uncached(self) -> Dict[str, Any]:
         info: Dict[str, Any] = {'found': False, 'version': None, 'path': None, 'arch': None}
         try:
             # Windows only: check registry keys
@@ -1564,34 +1974,22 @@ class App(tk.Tk):
                     ]
                     product_code = '{F3017226-FE2A-4295-8BDF-00C3A9A7E4C5}'  # Evergreen Runtime
                     for root, base, arch in reg_paths:
+                        # The product GUID is fixed: open its key directly (no EnumKey scan)
                         try:
-                            with winreg.OpenKey(root, base) as k:
-                                i = 0
-                                while True:
-                                    try:
-                                        sub = winreg.EnumKey(k, i)
-                                    except OSError:
-                                        break
-                                    i += 1
-                                    if product_code and product_code.lower() not in sub.lower():
-                                        continue
-                                    try:
-                                        with winreg.OpenKey(k, sub) as sk:
-                                            try:
-                                                version, _ = winreg.QueryValueEx(sk, 'pv')
-                                            except OSError:
-                                                version = None
-                                            try:
-                                                name, _ = winreg.QueryValueEx(sk, 'name')
-                                            except OSError:
-                                                name = None
-                                            info['found'] = True
-                                            info['version'] = version
-                                            info['path'] = name
-                                            info['arch'] = arch
-                                            return info
-                                    except OSError:
-                                        continue
+                            with winreg.OpenKey(root, base + '\\' + product_code) as sk:
+                                try:
+                                    version, _ = winreg.QueryValueEx(sk, 'pv')
+                                except OSError:
+                                    version = None
+                                try:
+                                    name, _ = winreg.QueryValueEx(sk, 'name')
+                                except OSError:
+                                    name = None
+                                info['found'] = True
+                                info['version'] = version
+                                info['path'] = name
+                                info['arch'] = arch
+                                return info
                         except OSError:
                             continue
                 except Exception:
@@ -1603,16 +2001,19 @@ class App(tk.Tk):
                     (os.path.expandvars(r"%ProgramFiles(x86)%\Microsoft\EdgeWebView\Application"), 'x86'),
                 ]
                 for d, arch in common_dirs:
-                    if not d or not os.path.isdir(d):
+                    if not d:
                         continue
-                    # pick highest version folder
+                    # pick highest version folder (running max over one directory scan)
                     try:
-                        subs = [p for p in os.listdir(d) if os.path.isdir(os.path.join(d, p))]
-                        if subs:
-                            subs.sort(reverse=True)
+                        best = None
+                        with os.scandir(d) as it:
+                            for e in it:
+                                if e.is_dir(follow_symlinks=False) and (best is None or e.name > best):
+                                    best = e.name
+                        if best is not None:
                             info['found'] = True
-                            info['version'] = subs[0]
-                            info['path'] = os.path.join(d, subs[0])
+                            info['version'] = best
+                            info['path'] = os.path.join(d, best)
                             info['arch'] = arch
                             return info
                     except Exception:
@@ -1646,7 +2047,7 @@ class App(tk.Tk):
             # Determine candidates near the executable/source directory
             base = getattr(self, '_exe_dir', None)
             if not base:
-                base = Path(sys.executable).parent if getattr(sys, 'frozen', False) else SRC_DIR
+                base = _EXE_DIR
             candidates: list[tuple[str, str]] = []
             try:
                 import platform as _plat
@@ -1675,11 +2076,15 @@ class App(tk.Tk):
     def _update_font_px_label(self):
         """Update the font size label to show multiplier (e.g. 90%)."""
         try:
-            scale = float(self.var_font_scale.get() or 1.0)
-            # Clamp to 1.5 (150%). Earlier logic clamped at 1.4 causing stalled updates above 140%.
-            scale = max(0.5, min(1.5, scale))
-            self.var_font_px.set(f"{int(scale*100)}%")
+            # Clamp to 50..150%: settings may carry values outside the slider range
+            pct = max(50, min(150, int(round(float(self.var_font_scale.get() or 1.0) * 100))))
+            # Sub-step drag samples usually round to the same percent; skip the write then
+            if pct == self._last_font_pct:
+                return
+            self._last_font_pct = pct
+            self.tk.globalsetvar(self._vn_font_px, f"{pct}%")
         except Exception:
+            self._last_font_pct = None
             self.var_font_px.set("")
 
     # Automatic button height sync disabled (fixed value)
@@ -1695,18 +2100,55 @@ class App(tk.Tk):
         lw = getattr(self, '_get_log_widget', lambda: None)()
         if lw is None:
             try:
-                self._early_logs.append((msg, tag))
+                buf = self._early_logs
+                if len(buf) == buf.maxlen:
+                    self._early_logs_dropped += 1
+                buf.append((msg, tag))
             except Exception:
                 pass
             return
+        # Enqueue only; one idle drain on the Tk thread inserts the batch (safe from the scan worker too)
+        self._log_queue.put((msg, tag))
+        if not self._log_drain_scheduled:
+            self._log_drain_scheduled = True
+            try:
+                self.after_idle(self._drain_log_queue)
+            except Exception:
+                self._drain_log_queue()
+
+    _LOG_DRAIN_BATCH = 64
+    _EARLY_LOG_MAX = 2000  # lines kept for a Log tab that has not been opened yet
+
+    def _drain_log_queue(self):
+        """Insert up to _LOG_DRAIN_BATCH queued log lines, then scroll once; reschedules while lines remain."""
+        self._log_drain_scheduled = False
+        batch: List[tuple] = []
+        q = self._log_queue
         try:
-            if tag:
-                lw.insert('end', msg + '\n', tag)
-            else:
-                lw.insert('end', msg + '\n')
+            while len(batch) < self._LOG_DRAIN_BATCH:
+                batch.append(q.get_nowait())
+        except queue.Empty:
+            pass
+        if not batch:
+            return
+        lw = getattr(self, '_get_log_widget', lambda: None)()
+        if lw is None:
+            return
+        try:
+            for msg, tag in batch:
+                if tag:
+                    lw.insert('end', msg + '\n', tag)
+                else:
+                    lw.insert('end', msg + '\n')
             lw.see('end')
         except Exception:
             pass
+        if not q.empty() and not self._log_drain_scheduled:
+            self._log_drain_scheduled = True
+            try:
+                self.after_idle(self._drain_log_queue)
+            except Exception:
+                self._log_drain_scheduled = False
 
     # --- Commonized helpers (template/theme) ---------------------------------
     def _is_dark_mode(self) -> bool:
@@ -1716,19 +2158,29 @@ class App(tk.Tk):
             return False
 
     def _theme_class(self) -> str:
-        return 'dark' if self._is_dark_mode() else ''
+        cached = getattr(self, '_theme_class_cached', None)
+        if cached is None:
+            cached = self._theme_class_cached = 'dark' if self._is_dark_mode() else ''
+        return cached
 
-    def _render_full_html(self, body_html: str, inline_css: bool, tr=None) -> tuple[str, bool]:
+    def _invalidate_theme_class(self, *_):
+        self._theme_class_cached = None
+
+    def _render_full_html(self, body_html: str, inline_css: bool, tr=None, theme_class: Optional[str] = None,
+                          timings: Optional[Dict[str, float]] = None,
+                          template: Optional[Tuple[str, bool]] = None) -> tuple[str, bool]:
         """Central wrapper applying template placeholders consistently.
 
-        Returns (full_html, used_external_template_flag).
+        Returns (full_html, used_external_template_flag). ``theme_class`` defaults to the GUI
+        theme; the wrap time is added to ``timings`` (default: self._timings). ``template`` is a
+        (html, used_external) pair already loaded by the caller (skips _load_template_and_css).
         """
-        t0 = time.time()
+        t0 = _perf()
         try:
-            tpl, used_tpl = _load_template_and_css(inline_css=inline_css)
+            tpl, used_tpl = template if template is not None else _load_template_and_css(inline_css=inline_css)
         except Exception:
             tpl, used_tpl = ('<html><body>{{BODY}}</body></html>', False)
-        _t = tr if callable(tr) else self._
+        _t = tr if callable(tr) else self._tr
         try:
             header = _t('report.header')
         except Exception:
@@ -1740,15 +2192,15 @@ class App(tk.Tk):
         except Exception:
             header = 'Report'
         try:
-            full_html = (tpl
-                         .replace('{{TITLE}}', header)
-                         .replace('{{HEADER_LABEL}}', header)
-                         .replace('{{THEME_CLASS}}', self._theme_class())
-                         .replace('{{BODY}}', body_html))
+            if theme_class is None:
+                theme_class = self._theme_class()
+            values = {'TITLE': header, 'HEADER_LABEL': header, 'THEME_CLASS': theme_class, 'BODY': body_html}
+            full_html = _TPL_PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], tpl)
         except Exception:
             full_html = '<html><body>' + body_html + '</body></html>'
         try:
-            self._timings['html_wrap'] = self._timings.get('html_wrap', 0.0) + (time.time() - t0) * 1000.0
+            tm = self._timings if timings is None else timings
+            tm['html_wrap'] = tm.get('html_wrap', 0.0) + (_perf() - t0) * 1000.0
         except Exception:
             pass
         return full_html, used_tpl
@@ -1757,28 +2209,80 @@ class App(tk.Tk):
     def _safe_set_text(self, widget_attr: str, content: str):  # pragma: no cover - GUI
         """Safely update a tk.Text widget attribute if it exists.
 
-        Schedules on the Tk event loop via after(0, ...) to avoid threading
-        issues. Silently no-ops if the attribute is missing or not a widget.
+        Updates are queued per widget and applied in one idle callback
+        (_flush_text_updates), so a burst of writes to the same widget only
+        inserts the latest content. Silently no-ops if the attribute is missing.
         """
         try:
             widget = getattr(self, widget_attr, None)
         except Exception:
             return
+        if widget_attr in ('txt_md', 'txt_json'):
+            # Concrete content supersedes a deferred or running producer (see _defer_tab_text)
+            self._pending_tab_builders.pop(widget_attr, None)
+            self._tab_text_gen[widget_attr] = self._tab_text_gen.get(widget_attr, 0) + 1
         if widget is None:
+            # Markdown/JSON tabs not built yet: keep the latest content for first activation
+            if widget_attr in ('txt_md', 'txt_json'):
+                try:
+                    self._pending_tab_text[widget_attr] = content
+                except Exception:
+                    pass
             return
-        def _update():
+        self._pending_text[widget_attr] = content
+        if self._text_flush_id is not None:
+            return
+        try:
+            self._text_flush_id = self.after_idle(self._flush_text_updates)
+        except Exception:
+            # If after_idle not yet available (very early), fallback immediate
+            self._flush_text_updates()
+
+    _TEXT_CHUNK_THRESHOLD = 256 * 1024
+    _TEXT_CHUNK_SIZE = 64 * 1024
+
+    def _flush_text_updates(self):  # pragma: no cover - GUI
+        """Apply the latest queued content per widget (see _safe_set_text).
+
+        Content above _TEXT_CHUNK_THRESHOLD is inserted in ~64 KB line-aligned chunks, one per
+        event-loop turn, so a multi-MB JSON/Markdown preview does not freeze the UI.
+        """
+        self._text_flush_id = None
+        pending, self._pending_text = self._pending_text, {}
+        for widget_attr, content in pending.items():
+            widget = getattr(self, widget_attr, None)
+            if widget is None:
+                continue
+            # A newer update cancels any chunked insert still streaming into this widget
+            gen = self._text_chunk_gen[widget_attr] = self._text_chunk_gen.get(widget_attr, 0) + 1
             try:
                 widget.configure(state='normal')
                 widget.delete('1.0', 'end')
-                widget.insert('1.0', content)
-                widget.configure(state='normal')
+                if len(content) > self._TEXT_CHUNK_THRESHOLD:
+                    self._insert_text_chunk(widget_attr, content, gen, 0)
+                else:
+                    widget.insert('1.0', content)
             except Exception:
                 pass
+
+    def _insert_text_chunk(self, widget_attr: str, content: str, gen: int, pos: int):  # pragma: no cover - GUI
+        """Append the next chunk of ``content`` (from ``pos``) and schedule the rest via after(0)."""
+        if self._text_chunk_gen.get(widget_attr) != gen:
+            return
+        widget = getattr(self, widget_attr, None)
+        if widget is None:
+            return
+        end = content.find('\n', pos + self._TEXT_CHUNK_SIZE)
+        end = len(content) if end < 0 else end + 1
         try:
-            self.after(0, _update)
+            widget.insert('end-1c', content[pos:end])
         except Exception:
-            # If after not yet available (very early), fallback immediate
-            _update()
+            return
+        if end < len(content):
+            try:
+                self.after(0, self._insert_text_chunk, widget_attr, content, gen, end)
+            except Exception:
+                pass
 
     def apply_font_scale(self):
         """Apply current font scale (multiplier) to text widgets & HTML preview.
@@ -1792,90 +2296,15 @@ class App(tk.Tk):
         except Exception:
             scale = 1.0
         scale = max(0.5, min(1.5, scale))
+        # Bases are captured once by _init_font_bases; ignore very early scale events
+        if not getattr(self, '_font_bases_ready', False):
+            return
 
         try:
-            import tkinter.font as tkfont
-            # Lazy capture of per-widget base fonts the first time we scale
             widgets = [getattr(self, 'txt_md', None), getattr(self, 'txt_json', None), getattr(self, 'txt_log', None), getattr(self, 'txt_html', None)]
-            if not hasattr(self, '_content_font_bases'):
-                self._content_font_bases = {}
-                for w in widgets:
-                    try:
-                        if w is None:
-                            continue
-                        f = tkfont.Font(font=w.cget('font'))
-                        self._content_font_bases[w] = {
-                            'family': f.cget('family'),
-                            'size': int(f.cget('size') or 12),
-                            'weight': f.cget('weight'),
-                            'slant': f.cget('slant')
-                        }
-                    except Exception:
-                        pass
-            # Also capture and scale Text fallback rendering fonts used by tags (h1/h2/mono)
-            try:
-                if hasattr(self, 'font_base') and self.font_base is not None:
-                    if not hasattr(self, '_text_font_bases'):
-                        self._text_font_bases = {}
-                        try:
-                            self._text_font_bases['base'] = int(self.font_base.cget('size') or 10)
-                        except Exception:
-                            self._text_font_bases['base'] = 10
-                        try:
-                            self._text_font_bases['bold'] = int(self.font_bold.cget('size') or self._text_font_bases['base'])
-                        except Exception:
-                            self._text_font_bases['bold'] = self._text_font_bases['base']
-                        try:
-                            self._text_font_bases['h1'] = int(self.font_h1.cget('size') or (self._text_font_bases['base'] + 4))
-                        except Exception:
-                            self._text_font_bases['h1'] = self._text_font_bases['base'] + 4
-                        try:
-                            self._text_font_bases['h2'] = int(self.font_h2.cget('size') or (self._text_font_bases['base'] + 2))
-                        except Exception:
-                            self._text_font_bases['h2'] = self._text_font_bases['base'] + 2
-                        try:
-                            self._text_font_bases['mono'] = int(self.font_mono.cget('size') or self._text_font_bases['base'])
-                        except Exception:
-                            self._text_font_bases['mono'] = self._text_font_bases['base']
-                        try:
-                            self._text_font_bases['meta'] = int(self.font_meta.cget('size') or max(self._text_font_bases['base'] - 1, 8))
-                        except Exception:
-                            self._text_font_bases['meta'] = max(self._text_font_bases['base'] - 1, 8)
-                        try:
-                            self._text_font_bases['impact'] = int(self.font_impact.cget('size') or self._text_font_bases['base'])
-                        except Exception:
-                            self._text_font_bases['impact'] = self._text_font_bases['base']
-                    # Apply scaled sizes to these Font objects (tags will follow automatically)
-                    try:
-                        self.font_base.configure(size=max(6, int(round(self._text_font_bases['base'] * scale))))
-                    except Exception:
-                        pass
-                    try:
-                        self.font_bold.configure(size=max(6, int(round(self._text_font_bases['bold'] * scale))))
-                    except Exception:
-                        pass
-                    try:
-                        self.font_h1.configure(size=max(7, int(round(self._text_font_bases['h1'] * scale))))
-                    except Exception:
-                        pass
-                    try:
-                        self.font_h2.configure(size=max(7, int(round(self._text_font_bases['h2'] * scale))))
-                    except Exception:
-                        pass
-                    try:
-                        self.font_mono.configure(size=max(6, int(round(self._text_font_bases['mono'] * scale))))
-                    except Exception:
-                        pass
-                    try:
-                        self.font_meta.configure(size=max(6, int(round(self._text_font_bases['meta'] * scale))))
-                    except Exception:
-                        pass
-                    try:
-                        self.font_impact.configure(size=max(6, int(round(self._text_font_bases['impact'] * scale))))
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            # Text fallback tag fonts (h1/h2/mono/...); bases were captured in _init_fonts
+            for f, base_size, min_size in getattr(self, '_font_scale_targets', ()):
+                f.configure(size=max(min_size, int(round(base_size * scale))))
             # Apply scaled size per widget
             for w in widgets:
                 try:
@@ -1885,9 +2314,11 @@ class App(tk.Tk):
                     if not base:
                         continue
                     new_size = max(6, int(round(base['size'] * scale)))
-                    f = tkfont.Font(font=w.cget('font'))
+                    # Persistent per-widget Font: resizing it updates the widget in place
+                    f = self._content_fonts[w]
                     f.configure(size=new_size)
-                    w.configure(font=f)
+                    if str(w.cget('font')) != f.name:  # rebound elsewhere (e.g. txt_html -> font_base)
+                        w.configure(font=f)
                 except Exception:
                     pass
             # After scaling fonts, adjust displayed line counts to keep pixel height stable
@@ -1912,7 +2343,6 @@ class App(tk.Tk):
         scaling preserves per-widget size differentials while sharing family.
         """
         try:
-            import tkinter.font as tkfont
             family = None
             try:
                 if hasattr(self, 'font_base') and self.font_base is not None:
@@ -1922,14 +2352,25 @@ class App(tk.Tk):
             if not family:
                 return
             widgets = [getattr(self, 'txt_md', None), getattr(self, 'txt_json', None), getattr(self, 'txt_log', None)]
+            content_fonts = getattr(self, '_content_fonts', {})
             for w in widgets:
                 if w is None:
                     continue
                 try:
-                    f = tkfont.Font(font=w.cget('font'))
-                    if f.cget('family') != family:
-                        f.configure(family=family)
-                        w.configure(font=f)
+                    # Each widget owns one persistent Font (see _capture_content_font); bind it on first use
+                    nf = content_fonts.get(w)
+                    if nf is None and getattr(self, '_font_bases_ready', False):
+                        self._capture_content_font(w)
+                        nf = content_fonts.get(w)
+                    if nf is None or nf.cget('family') == family:
+                        continue
+                    # Requested name differs but Tk may already resolve to the same face (fallbacks): skip the redraw
+                    try:
+                        if str(nf.actual('family')).lower() == str(family).lower():
+                            continue
+                    except Exception:
+                        pass
+                    nf.configure(family=family)
                 except Exception:
                     pass
         except Exception:
@@ -1939,12 +2380,12 @@ class App(tk.Tk):
     from contextlib import contextmanager as _cm
     @_cm
     def _timed(self, label: str):  # pragma: no cover - GUI
-        t0 = time.time()
+        t0 = _perf()
         try:
             yield
         finally:
             try:
-                self._timings[label] = self._timings.get(label, 0.0) + (time.time() - t0) * 1000.0
+                self._timings[label] = self._timings.get(label, 0.0) + (_perf() - t0) * 1000.0
             except Exception:
                 pass
 
@@ -1954,17 +2395,27 @@ class App(tk.Tk):
         - Captures current geometry (size/position) before scaling
         - Applies scaling and triggers preview re-render
         - Restores geometry unless the window is maximized (state == 'zoomed')
+        - No-op when the scale equals the last one applied (stepper mashing, theme re-apply)
         """
         try:
             try:
-                state = self.state()
+                new_s = float(self.var_font_scale.get() or 1.0)
             except Exception:
-                state = None
-            # Snapshot geometry
+                new_s = 1.0
+            if abs(new_s - getattr(self, '_last_applied_scale', -1.0)) < 1e-6:
+                safe_call(self._update_font_px_label)
+                return
             try:
-                self.update_idletasks()
+                state = self.state()
             except Exception:
-                pass
+                state = None
+            # Snapshot geometry; flush pending layout only after a geometry-mutating path marked it dirty
+            if getattr(self, '_geom_dirty', True):
+                try:
+                    self.update_idletasks()
+                except Exception:
+                    pass
+                self._geom_dirty = False
             w = int(self.winfo_width() or 0)
             h = int(self.winfo_height() or 0)
             x = int(self.winfo_x() or 0)
@@ -1992,24 +2443,18 @@ class App(tk.Tk):
                 locked = True
 
             # Do the scaling work
-            try:
-                self.apply_font_scale()
-            except Exception:
-                pass
-            try:
-                self._rerender_preview()
-            except Exception:
-                pass
-            try:
-                self._update_font_px_label()
-            except Exception:
-                pass
+            safe_call(self.apply_font_scale)
+            self._geom_dirty = True
+            safe_call(self._rerender_preview)
+            safe_call(self._update_font_px_label)
+            if getattr(self, '_font_bases_ready', False):
+                self._last_applied_scale = new_s
 
             # Restore geometry / defer unlock if not maximized and meaningful
             if state != 'zoomed' and w > 1 and h > 1:
                 # Restore size/position immediately while keeping min/max lock
                 try:
-                    pos_allowed = not (getattr(self, '_fs_user_moved', False) or getattr(self, '_first_run', False))
+                    pos_allowed = not (self._fs_user_moved or getattr(self, '_first_run', False))
                     if not pos_allowed:
                         self.geometry(f"{w}x{h}")
                     else:
@@ -2017,145 +2462,92 @@ class App(tk.Tk):
                 except Exception:
                     pass
 
-                def _unlock(final: bool = True):
-                    # Enforce geometry again after a few frames then release size locks
-                    try:
-                        pos_allowed2 = not (getattr(self, '_fs_user_moved', False) or getattr(self, '_first_run', False))
-                        if not pos_allowed2:
-                            self.geometry(f"{w}x{h}")
-                        else:
-                            self.geometry(f"{w}x{h}+{x}+{y}")
-                    except Exception:
-                        pass
-                    if final:
-                        try:
-                            if sw and sh:
-                                self.maxsize(sw, sh)
-                            else:
-                                self.maxsize(10000, 10000)
-                        except Exception:
-                            pass
-                        try:
-                            self.minsize(720, 720)
-                        except Exception:
-                            pass
-
-                # Multiple short delayed restores to suppress late layout expansion.
+                # Single <Configure> guard snaps late layout growth back to w x h until the final unlock
+                target_w, target_h = w, h
                 try:
-                    self.after(0, lambda: _unlock(False))      # immediately after idle
-                except Exception:
-                    pass
-                try:
-                    self.after(40, lambda: _unlock(False))     # roughly one frame later (~40ms)
-                except Exception:
-                    pass
-                # Final unlock delayed until after watch/guard period to prevent late growth.
-                try:
-                    self.after(1400, _unlock)  # final unlock after guard window
+                    prev_unlock = getattr(self, '_fs_unlock_after_id', None)
+                    if prev_unlock is not None:
+                        self.after_cancel(prev_unlock)
+                    prev_bind = getattr(self, '_fs_geom_guard_bind_id', None)
+                    if prev_bind is not None:
+                        self._unbind_func('<Configure>', prev_bind)
                 except Exception:
                     pass
+                self._fs_geom_guard_reentry = False
+                first_run = bool(getattr(self, '_first_run', False))  # fixed for the lifetime of this guard
 
-                # Rebound watch: prevent post-unlock size creep on some platforms.
-                try:
-                    if not hasattr(self, '_fs_watch_active'):
-                        self._fs_watch_active = False
-                    if getattr(self, '_fs_watch_active', False):
-                        # Skip if already watching.
+                def _fs_geom_guard(event=None):
+                    # Only the toplevel's own events matter (children propagate <Configure> to the root binding)
+                    if self._fs_geom_guard_reentry or (event is not None and event.widget is not self):
                         return
-                    self._fs_watch_active = True
-                    target_w, target_h = w, h
-
-                    def _watch(step=0):
-                        try:
-                            cur_w = int(self.winfo_width() or 0)
-                            cur_h = int(self.winfo_height() or 0)
-                            cur_x = int(self.winfo_x() or 0)
-                            cur_y = int(self.winfo_y() or 0)
-                            # Detect user move
-                            if not getattr(self, '_fs_user_moved', False):
-                                if abs(cur_x - x) > move_threshold or abs(cur_y - y) > move_threshold:
-                                    self._fs_user_moved = True
-                            # Enforce: allow <=1px; otherwise snap back.
-                            if abs(cur_w - target_w) > 1 or abs(cur_h - target_h) > 1:
-                                try:
-                                    pos_allowed3 = not (getattr(self, '_fs_user_moved', False) or getattr(self, '_first_run', False))
-                                    if not pos_allowed3:
-                                        self.geometry(f"{target_w}x{target_h}")
-                                    else:
-                                        self.geometry(f"{target_w}x{target_h}+{x}+{y}")
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                        # Limit watch iterations (~600ms total: 0,40,...,560).
-                        if step < 14:
+                    try:
+                        cur_w, cur_h = event.width, event.height
+                        # Detect user move; stop forcing position once moved.
+                        if not self._fs_user_moved:
+                            if abs(int(self.winfo_x() or 0) - x) > move_threshold or abs(int(self.winfo_y() or 0) - y) > move_threshold:
+                                self._fs_user_moved = True
+                        # Allow <=1px; otherwise snap back.
+                        if abs(cur_w - target_w) > 1 or abs(cur_h - target_h) > 1:
                             try:
-                                self.after(40, lambda: _watch(step + 1))
-                            except Exception:
-                                pass
-                        else:
-                            self._fs_watch_active = False
+                                self._fs_geom_guard_reentry = True
+                                if self._fs_user_moved or first_run:
+                                    self.geometry(f"{target_w}x{target_h}")
+                                else:
+                                    self.geometry(f"{target_w}x{target_h}+{x}+{y}")
+                            finally:
+                                self._fs_geom_guard_reentry = False
+                    except Exception:
+                        pass
 
-                    # Start watch slightly after first unlock (unlock ~120ms -> start ~160ms).
+                def _unlock_final():
+                    self._fs_unlock_after_id = None
                     try:
-                        self.after(160, _watch)
+                        bid = getattr(self, '_fs_geom_guard_bind_id', None)
+                        if bid is not None:
+                            self._unbind_func('<Configure>', bid)
                     except Exception:
-                        self._fs_watch_active = False
-                except Exception:
-                    pass
-                    # <Configure> guard: clamp size during late layout expansion attempts.
+                        pass
+                    self._fs_geom_guard_bind_id = None
                     try:
-                        guard_duration_ms = 1200  # Guard total duration (ms).
-                        target_w, target_h = w, h
-                        if not hasattr(self, '_fs_geom_guard_active') or not self._fs_geom_guard_active:
-                            self._fs_geom_guard_active = True
-                            self._fs_geom_guard_reentry = False
-                            start_ts = time.time()
-
-                            def _fs_geom_guard(event=None):
-                                # Reentry guard
-                                if getattr(self, '_fs_geom_guard_reentry', False):
-                                    return
-                                try:
-                                    cur_x = int(self.winfo_x() or 0)
-                                    cur_y = int(self.winfo_y() or 0)
-                                    # Detect user move; stop forcing position once moved.
-                                    if not getattr(self, '_fs_user_moved', False):
-                                        if abs(cur_x - x) > move_threshold or abs(cur_y - y) > move_threshold:
-                                            self._fs_user_moved = True
-                                    if (time.time() - start_ts) * 1000.0 > guard_duration_ms:
-                                        # Guard expired: unbind and stop.
-                                        try:
-                                            self.unbind('<Configure>', self._fs_geom_guard_bind_id)
-                                        except Exception:
-                                            pass
-                                        self._fs_geom_guard_active = False
-                                        return
-                                    cur_w = int(self.winfo_width() or 0)
-                                    cur_h = int(self.winfo_height() or 0)
-                                    # Allow up to +1px; restore if exceeded.
-                                    if cur_w - target_w > 1 or cur_h - target_h > 1:
-                                        try:
-                                            self._fs_geom_guard_reentry = True
-                                            pos_allowed4 = not (getattr(self, '_fs_user_moved', False) or getattr(self, '_first_run', False))
-                                            if not pos_allowed4:
-                                                self.geometry(f"{target_w}x{target_h}")
-                                            else:
-                                                self.geometry(f"{target_w}x{target_h}+{x}+{y}")
-                                        finally:
-                                            self._fs_geom_guard_reentry = False
-                                except Exception:
-                                    pass
-
-                            try:
-                                self._fs_geom_guard_bind_id = self.bind('<Configure>', _fs_geom_guard, add='+')
-                            except Exception:
-                                self._fs_geom_guard_active = False
+                        if sw and sh:
+                            self.maxsize(sw, sh)
+                        else:
+                            self.maxsize(10000, 10000)
+                    except Exception:
+                        pass
+                    try:
+                        self.minsize(720, 720)
                     except Exception:
                         pass
+
+                try:
+                    self._fs_geom_guard_bind_id = self.bind('<Configure>', _fs_geom_guard, add='+')
+                except Exception:
+                    self._fs_geom_guard_bind_id = None
+                try:
+                    self._fs_unlock_after_id = self.after(1400, _unlock_final)
+                except Exception:
+                    _unlock_final()
         except Exception:
             return
 
+    def _unbind_func(self, sequence: str, funcid: str, widget: Optional[tk.Misc] = None):
+        """Remove one add='+' binding from ``widget`` (default: the root window), keeping the other handlers.
+
+        (tkinter's unbind(sequence, funcid) clears every script bound to the sequence.)
+        """
+        w = self if widget is None else widget
+        try:
+            script = str(self.tk.call('bind', w._w, sequence) or '')
+            keep = '\n'.join(line for line in script.split('\n') if funcid not in line)
+            self.tk.call('bind', w._w, sequence, keep)
+        except Exception:
+            pass
+        try:
+            self.deletecommand(funcid)
+        except Exception:
+            pass
+
     def _adjust_text_widget_heights_for_scale(self):
         """Inverse-adjust Text widget 'height' lines when scale > 1.0 to curb toplevel growth.
 
@@ -2171,23 +2563,19 @@ class App(tk.Tk):
             bases = getattr(self, '_text_base_heights', {}) or {}
             if not widgets or not bases:
                 return
-            if s <= 1.0:
-                # Use original height values
-                for w in widgets:
-                    try:
-                        base = bases.get(w, 12)
-                        if int(w.cget('height')) != base:
-                            w.configure(height=base)
-                    except Exception:
-                        pass
-                return
-            # scale > 1.0
+            # Last height we applied per widget (seeded with the creation height) avoids cget round-trips
+            last = self._text_last_heights
+            lines_for: Dict[int, int] = {}  # base -> target lines, computed once per distinct base
             for w in widgets:
                 try:
                     base = bases.get(w, 12)
-                    new_lines = max(4, int(round(base / s)))
-                    if int(w.cget('height')) != new_lines:
+                    new_lines = lines_for.get(base)
+                    if new_lines is None:
+                        # scale <= 1.0 keeps the original height values
+                        new_lines = lines_for[base] = base if s <= 1.0 else max(4, int(round(base / s)))
+                    if last.get(w) != new_lines:
                         w.configure(height=new_lines)
+                        last[w] = new_lines
                 except Exception:
                     pass
         except Exception:
@@ -2203,279 +2591,159 @@ class App(tk.Tk):
             self._log_i18n('[START]', 'log.startScan', path=str(root))
         """
         try:
-            msg = self._(key)
-            for k, v in (kwargs or {}).items():
-                msg = msg.replace('{' + k + '}', str(v))
+            msg = self._tr(key)
+            if kwargs:
+                try:
+                    msg = msg.format_map(_KeepMissing(kwargs))
+                except (ValueError, IndexError):
+                    # Stray braces in a translation: fall back to plain substitution
+                    for k, v in kwargs.items():
+                        msg = msg.replace('{' + k + '}', str(v))
             self.log(f"{prefix} {msg}")
         except Exception:
             # Fallback to key if missing
             self.log(f"{prefix} {key}")
 
 
-    def on_browse_root(self):
-        import time, threading
-        kind = 'root'
+    def _browse_watchdog(self, kind: str, t1: float) -> Callable[[], None]:
+        """Log a 'still waiting' line every 3 s while a file dialog is open (after-based, no thread).
+
+        Returns a function that stops the watchdog; call it once the dialog has returned.
+        """
+        wd_id: List[Optional[str]] = [None]
+        def _tick():
+            try: self.log(f"[BROWSE][WATCHDOG] kind={kind} still waiting +{int(_perf()-t1)}s")
+            except Exception: pass
+            wd_id[0] = self.after(3000, _tick)
+        def _stop():
+            if wd_id[0] is not None:
+                try: self.after_cancel(wd_id[0])
+                except Exception: pass
+                wd_id[0] = None
+        try:
+            wd_id[0] = self.after(3000, _tick)
+        except Exception:
+            pass
+        return _stop
+
+    def _browse_dispatch(self, kind: str):
+        """Shared body of the on_browse_* handlers, driven by the module-level _BROWSE_SPECS row for ``kind``.
+
+        Handles the optional one-tick delayed dispatch, timing/log lines, busy cursor and
+        watchdog around the file dialog. A non-empty result is stored in the row's variable
+        and passed to its on_result method (if any).
+        """
+        dialog_name, title_key, var_attr, init_attr, result_attr, dialog_kw = _BROWSE_SPECS[kind]
         # Delayed dispatch (B)
         if getattr(self, '_browse_delay_mode', False) and not getattr(self, '_browse_delay_skip_next', False):
             self._browse_delay_skip_next = True
             try: self.log(f"[BROWSE] schedule delay=50ms kind={kind}")
             except Exception: pass
-            self.after(50, self.on_browse_root)
+            self.after(50, lambda: self._browse_dispatch(kind))
             return
         if getattr(self, '_browse_delay_skip_next', False):
             self._browse_delay_skip_next = False
-        t0 = time.time()
+        t0 = _perf()
         try: self.log(f"[BROWSE] start kind={kind}")
         except Exception: pass
-        # Setup initial directory
-        try:
-            cur = (self.var_root.get() or '').strip()
-            init = cur if cur and Path(cur).exists() else str(self._exe_dir)
-        except Exception:
-            init = str(getattr(self, '_exe_dir', Path.cwd()))
-        t1 = time.time()
-        # Watchdog thread
-        done = {'v': False}
-        def _watch():
-            n = 1
-            while not done['v']:
-                time.sleep(3)
-                if done['v']:
-                    break
-                try: self.log(f"[BROWSE][WATCHDOG] kind={kind} still waiting +{int(time.time()-t1)}s")
-                except Exception: pass
-        threading.Thread(target=_watch, daemon=True).start()
-        # Busy cursor feedback
+        var = getattr(self, var_attr)
+        # Re-validated on every click: the folder may have been deleted or renamed outside the app
+        init_kw = getattr(self, init_attr)(var)
+        t1 = _perf()
+        stop_watchdog = self._browse_watchdog(kind, t1)
+        # Busy cursor feedback (no update_idletasks: the modal dialog pumps events itself)
         try:
             old_cursor = self['cursor']
             self.configure(cursor='wait')
-            self.update_idletasks()
         except Exception:
             old_cursor = ''
-        dryrun = bool(os.environ.get('RCR_BROWSE_DRYRUN'))
-        if dryrun:
+        if os.environ.get('RCR_BROWSE_DRYRUN'):
             p = ''
         else:
             try:
-                p = filedialog.askdirectory(parent=self, title=self._('scan.root'), initialdir=init, mustexist=True)
+                p = getattr(filedialog, dialog_name)(parent=self, title=self._(title_key), **init_kw, **dialog_kw)
             except Exception:
                 p = ''
-        t2 = time.time()
-        done['v'] = True
-        # Restore cursor
-        try:
-            if old_cursor is not None:
-                self.configure(cursor=old_cursor)
-        except Exception:
-            pass
-        # Post-set
-        if p:
-            try: self.var_root.set(p)
-            except Exception: pass
-        t3 = time.time()
-        try:
-            self.log(
-                f"[BROWSE] kind={kind} prep={(t1-t0)*1000:.1f}ms dialog={(t2-t1)*1000:.1f}ms post={(t3-t2)*1000:.1f}ms total={(t3-t0)*1000:.1f}ms init='{init}' result='{p}'")
-        except Exception:
-            pass
-
-    def on_browse_json(self):
-        import time, threading
-        kind='json'
-        if getattr(self,'_browse_delay_mode', False) and not getattr(self,'_browse_delay_skip_next', False):
-            self._browse_delay_skip_next = True
-            try: self.log(f"[BROWSE] schedule delay=50ms kind={kind}")
-            except Exception: pass
-            self.after(50, self.on_browse_json)
-            return
-        if getattr(self,'_browse_delay_skip_next', False):
-            self._browse_delay_skip_next = False
-        t0=time.time()
-        try: self.log(f"[BROWSE] start kind={kind}")
-        except Exception: pass
-        cur = (self.var_out_json.get() or '').strip()
-        init_dir = str(Path(cur).parent) if cur else str(self._exe_dir)
-        t1=time.time()
-        done={'v':False}
-        def _watch():
-            while not done['v']:
-                time.sleep(3)
-                if done['v']: break
-                try: self.log(f"[BROWSE][WATCHDOG] kind={kind} still waiting +{int(time.time()-t1)}s")
-                except Exception: pass
-        threading.Thread(target=_watch, daemon=True).start()
-        try:
-            old_cursor=self['cursor']
-            self.configure(cursor='wait'); self.update_idletasks()
-        except Exception:
-            old_cursor=''
-        dryrun = bool(os.environ.get('RCR_BROWSE_DRYRUN'))
-        if dryrun:
-            p=''
-        else:
-            try:
-                p = filedialog.asksaveasfilename(parent=self, title=self._('scan.outJson'), defaultextension='.json', initialdir=init_dir, filetypes=[('JSON', '*.json'), ('All Files', '*.*')])
-            except Exception:
-                p=''
-        # Capture dialog completion timestamp for duration metrics
-        t2 = time.time()
-                # Store current font for next switch.
+        t2 = _perf()
+        stop_watchdog()
         try: self.configure(cursor=old_cursor)
         except Exception: pass
         if p:
-            try: self.var_out_json.set(p)
+            try: var.set(p)
             except Exception: pass
-        t3=time.time()
-        try: self.log(f"[BROWSE] kind={kind} prep={(t1-t0)*1000:.1f}ms dialog={(t2-t1)*1000:.1f}ms post={(t3-t2)*1000:.1f}ms total={(t3-t0)*1000:.1f}ms init='{init_dir}' result='{p}'")
-        except Exception: pass
-
-    def on_browse_md(self):
-        import time, threading
-        kind='md'
-        if getattr(self,'_browse_delay_mode', False) and not getattr(self,'_browse_delay_skip_next', False):
-            self._browse_delay_skip_next = True
-            try: self.log(f"[BROWSE] schedule delay=50ms kind={kind}")
-            except Exception: pass
-            self.after(50, self.on_browse_md)
-            return
-        if getattr(self,'_browse_delay_skip_next', False): self._browse_delay_skip_next=False
-        t0=time.time();
-        try: self.log(f"[BROWSE] start kind={kind}")
-        except Exception: pass
-        cur = (self.var_out_md.get() or '').strip()
-        init_dir = str(Path(cur).parent) if cur else str(self._exe_dir)
-        t1=time.time(); done={'v':False}
-        def _watch():
-            while not done['v']:
-                time.sleep(3)
-                if done['v']: break
-                try: self.log(f"[BROWSE][WATCHDOG] kind={kind} still waiting +{int(time.time()-t1)}s")
+            self._geom_dirty = True  # entry text changed
+            if result_attr:
+                try: getattr(self, result_attr)(p)
                 except Exception: pass
-        threading.Thread(target=_watch, daemon=True).start()
-        try: old_cursor=self['cursor']; self.configure(cursor='wait'); self.update_idletasks()
-        except Exception: old_cursor=''
-        dryrun = bool(os.environ.get('RCR_BROWSE_DRYRUN'))
-        if dryrun:
-            p=''
-        else:
-            try:
-                p = filedialog.asksaveasfilename(parent=self, title=self._('scan.outMd'), defaultextension='.md', initialdir=init_dir, filetypes=[('Markdown', '*.md'), ('All Files', '*.*')])
-            except Exception: p=''
-        t2=time.time(); done['v']=True
-        try: self.configure(cursor=old_cursor)
-        except Exception: pass
-        if p:
-            try: self.var_out_md.set(p)
-            except Exception: pass
-        t3=time.time()
-        try: self.log(f"[BROWSE] kind={kind} prep={(t1-t0)*1000:.1f}ms dialog={(t2-t1)*1000:.1f}ms post={(t3-t2)*1000:.1f}ms total={(t3-t0)*1000:.1f}ms init='{init_dir}' result='{p}'")
+        t3 = _perf()
+        init_desc = f"init='{init_kw.get('initialdir', '')}'"
+        if 'initialfile' in init_kw:
+            init_desc += f" file='{init_kw['initialfile']}'"
+        try: self.log(f"[BROWSE] kind={kind} prep={(t1-t0)*1000:.1f}ms dialog={(t2-t1)*1000:.1f}ms post={(t3-t2)*1000:.1f}ms total={(t3-t0)*1000:.1f}ms {init_desc} result='{p}'")
         except Exception: pass
 
-    def on_browse_html(self):
-        import time, threading
-        kind='html'
-        if getattr(self,'_browse_delay_mode', False) and not getattr(self,'_browse_delay_skip_next', False):
-            self._browse_delay_skip_next=True
-            try: self.log(f"[BROWSE] schedule delay=50ms kind={kind}")
-            except Exception: pass
-            self.after(50, self.on_browse_html); return
-        if getattr(self,'_browse_delay_skip_next', False): self._browse_delay_skip_next=False
-        t0=time.time();
-        try: self.log(f"[BROWSE] start kind={kind}")
-        except Exception: pass
-        cur = (self.var_out_html.get() or '').strip()
-        init_dir = str(Path(cur).parent) if cur else str(self._exe_dir)
-        t1=time.time(); done={'v':False}
-        def _watch():
-            while not done['v']:
-                time.sleep(3)
-                if done['v']: break
-                try: self.log(f"[BROWSE][WATCHDOG] kind={kind} still waiting +{int(time.time()-t1)}s")
-                except Exception: pass
-        threading.Thread(target=_watch, daemon=True).start()
-        try: old_cursor=self['cursor']; self.configure(cursor='wait'); self.update_idletasks()
-        except Exception: old_cursor=''
-        dryrun = bool(os.environ.get('RCR_BROWSE_DRYRUN'))
-        if dryrun:
-            p=''
-        else:
-            try:
-                p = filedialog.asksaveasfilename(parent=self, title=self._('scan.outHtml'), defaultextension='.html', initialdir=init_dir, filetypes=[('HTML', '*.html'), ('All Files', '*.*')])
-            except Exception: p=''
-        t2=time.time(); done['v']=True
-        try: self.configure(cursor=old_cursor)
-        except Exception: pass
-        if p:
-            try: self.var_out_html.set(p)
-            except Exception: pass
-        t3=time.time()
-        try: self.log(f"[BROWSE] kind={kind} prep={(t1-t0)*1000:.1f}ms dialog={(t2-t1)*1000:.1f}ms post={(t3-t2)*1000:.1f}ms total={(t3-t0)*1000:.1f}ms init='{init_dir}' result='{p}'")
-        except Exception: pass
+    def _browse_init_root(self, var: tk.Variable) -> Dict[str, str]:
+        try:
+            cur = (var.get() or '').strip()
+            init = cur if cur and Path(cur).exists() else str(self._exe_dir)
+        except Exception:
+            init = str(getattr(self, '_exe_dir', Path.cwd()))
+        return {'initialdir': init}
 
-    def on_browse_settings(self):
-        import time, threading
-        kind='settings'
-        if getattr(self,'_browse_delay_mode', False) and not getattr(self,'_browse_delay_skip_next', False):
-            self._browse_delay_skip_next=True
-            try: self.log(f"[BROWSE] schedule delay=50ms kind={kind}")
-            except Exception: pass
-            self.after(50, self.on_browse_settings); return
-        if getattr(self,'_browse_delay_skip_next', False): self._browse_delay_skip_next=False
-        t0=time.time();
-        try: self.log(f"[BROWSE] start kind={kind}")
-        except Exception: pass
+    def _browse_init_output(self, var: tk.Variable) -> Dict[str, str]:
+        cur = (var.get() or '').strip()
+        return {'initialdir': str(Path(cur).parent) if cur else str(self._exe_dir)}
+
+    def _browse_init_settings(self, var: tk.Variable) -> Dict[str, str]:
         try:
-            cur = (self.var_settings_path.get() or '').strip()
+            cur = (var.get() or '').strip()
             initialdir = str(Path(cur).parent) if cur else str(self._exe_dir)
             if not Path(initialdir).exists():
                 initialdir = str(getattr(self, '_exe_dir', Path.cwd()))
             initialfile = Path(cur).name if cur else 'redscript_conflict_gui.json'
         except Exception:
-            initialdir = str(getattr(self, '_exe_dir', Path.cwd())); initialfile='redscript_conflict_gui.json'
-        t1=time.time(); done={'v':False}
-        def _watch():
-            while not done['v']:
-                time.sleep(3)
-                if done['v']: break
-                try: self.log(f"[BROWSE][WATCHDOG] kind={kind} still waiting +{int(time.time()-t1)}s")
-                except Exception: pass
-        threading.Thread(target=_watch, daemon=True).start()
-        try: old_cursor=self['cursor']; self.configure(cursor='wait'); self.update_idletasks()
-        except Exception: old_cursor=''
-        dryrun = bool(os.environ.get('RCR_BROWSE_DRYRUN'))
-        if dryrun:
-            p=''
-        else:
-            try:
-                p = filedialog.asksaveasfilename(parent=self, title=self._('scan.saveAs'), defaultextension='.json', initialdir=initialdir, initialfile=initialfile, filetypes=[('JSON', '*.json'), ('All Files', '*.*')])
-            except Exception: p=''
-        t2=time.time(); done['v']=True
-        try: self.configure(cursor=old_cursor)
+            initialdir = str(getattr(self, '_exe_dir', Path.cwd())); initialfile = 'redscript_conflict_gui.json'
+        return {'initialdir': initialdir, 'initialfile': initialfile}
+
+    def _on_settings_path_chosen(self, p: str):
+        try: self._settings_path = Path(p)
         except Exception: pass
-        if p:
-            try: self.var_settings_path.set(p)
-            except Exception: pass
-            try: self._settings_path = Path(p)
-            except Exception: pass
-            try: self._save_settings_pointer()
-            except Exception: pass
-        t3=time.time()
-        try: self.log(f"[BROWSE] kind={kind} prep={(t1-t0)*1000:.1f}ms dialog={(t2-t1)*1000:.1f}ms post={(t3-t2)*1000:.1f}ms total={(t3-t0)*1000:.1f}ms init='{initialdir}' file='{initialfile}' result='{p}'")
+        try: self._save_settings_pointer()
         except Exception: pass
 
+    def on_browse_root(self):
+        self._browse_dispatch('root')
+
+    def on_browse_json(self):
+        self._browse_dispatch('json')
+
+    def on_browse_md(self):
+        self._browse_dispatch('md')
+
+    def on_browse_html(self):
+        self._browse_dispatch('html')
+
+    def on_browse_settings(self):
+        self._browse_dispatch('settings')
+
     # --- Core availability helper -------------------------------------------------
     def _require_core(self) -> bool:
-        """Ensure the core scanner module is available; show error if missing.
+        """Ensure the core scanner module is available; show error (once per session) if missing.
 
         Returns True when core is usable; False otherwise.
         Centralizes the import failure UX so multiple call sites stay minimal.
         """
         try:
             if core is None:
-                try:
-                    messagebox.showerror(self._('dialog.cannotRun.title'), self._('dialog.cannotRun.body'))
-                except Exception:
-                    pass
+                # Modal error only once per session; later attempts just log
+                if not getattr(self, '_core_error_shown', False):
+                    self._core_error_shown = True
+                    try:
+                        messagebox.showerror(self._('dialog.cannotRun.title'), self._('dialog.cannotRun.body'))
+                    except Exception:
+                        pass
+                else:
+                    log_message('error', self.log, self._tr('dialog.cannotRun.body'))
                 return False
         except Exception:
             return False
@@ -2507,8 +2775,20 @@ class App(tk.Tk):
             if not html_body:
                 messagebox.showinfo(self._('dialog.info.title'), self._('dialog.noPreview'))
                 return
+            # Repeat clicks on an unchanged preview reopen the file written last time
+            # (template/CSS mtimes are part of the key so an edited asset is picked up)
+            try:
+                cache_key = (hashlib.blake2b(html_body.encode('utf-8'), digest_size=8).hexdigest(),
+                             self._theme_class(), self._tr('report.header'), _tpl_cache_key(True))
+                cached = self._preview_cache.get(cache_key)
+            except Exception:
+                cache_key = cached = None
+            if cached is not None and cached.exists():
+                self._open_path_in_browser(str(cached))
+                return
             # Inline CSS for external browser preview (self-contained)
             full_html, _ = self._render_full_html(html_body, inline_css=True, tr=self._)
+            html_bytes = full_html.encode('utf-8')
             # Prefer placing temp HTML inside the per-session folder to ensure cleanup on exit
             try:
                 dest_dir = self.session_temp_dir if self.session_temp_dir and Path(self.session_temp_dir).exists() else None
@@ -2517,14 +2797,14 @@ class App(tk.Tk):
             temp_path: str
             if dest_dir is not None:
                 try:
-                    fname = f"preview_{uuid.uuid4().hex}.html"
+                    fname = f"preview_{secrets.token_hex(8)}.html"
                     fpath = Path(dest_dir) / fname
-                    fpath.write_text(full_html, encoding='utf-8')
+                    fpath.write_bytes(html_bytes)
                     temp_path = str(fpath)
                 except Exception:
                     # Fallback to system temp and track for manual cleanup on exit
-                    with tempfile.NamedTemporaryFile('w', delete=False, suffix='.html', encoding='utf-8') as tf:
-                        tf.write(full_html)
+                    with tempfile.NamedTemporaryFile('wb', delete=False, suffix='.html') as tf:
+                        tf.write(html_bytes)
                         temp_path = tf.name
                     try:
                         self._loose_temp_files.append(Path(temp_path))
@@ -2532,24 +2812,30 @@ class App(tk.Tk):
                         pass
             else:
                 # No session dir available; use system temp and track
-                with tempfile.NamedTemporaryFile('w', delete=False, suffix='.html', encoding='utf-8') as tf:
-                    tf.write(full_html)
+                with tempfile.NamedTemporaryFile('wb', delete=False, suffix='.html') as tf:
+                    tf.write(html_bytes)
                     temp_path = tf.name
                 try:
                     self._loose_temp_files.append(Path(temp_path))
                 except Exception:
                     pass
-            # Open by default browser
-            try:
-                if sys.platform.startswith('win'):
-                    os.startfile(temp_path)  # type: ignore[attr-defined]
-                else:
-                    webbrowser.open(f'file://{temp_path}')
-            except Exception:
-                webbrowser.open(f'file://{temp_path}')
+            if cache_key is not None:
+                self._preview_cache[cache_key] = Path(temp_path)
+            self._open_path_in_browser(temp_path)
         except Exception as e:
             messagebox.showerror(self._('dialog.error.title'), f'Failed to open in browser:\n{e}')
 
+    @staticmethod
+    def _open_path_in_browser(path: str):
+        """Open a local HTML file in the default browser (os.startfile on Windows, a file:// URI elsewhere).
+
+        webbrowser on macOS hands its argument to AppleScript, which needs a URI rather than a bare path.
+        """
+        if sys.platform.startswith('win'):
+            os.startfile(path)  # type: ignore[attr-defined]
+        else:
+            webbrowser.open(Path(path).resolve().as_uri())
+
     def on_open_browser(self):
         """Button callback wrapper for opening preview in external browser."""
         try:
@@ -2577,12 +2863,14 @@ class App(tk.Tk):
         if not root.exists():
             messagebox.showwarning(self._('dialog.inputCheck.title'), f"{self._('scan.root')} does not exist:\n{root}")
             return
+        # Evaluated once: file outputs (JSON/MD) vs any output at all (the HTML file counts too)
         preview_only = not (enable_json or enable_md)
+        any_output = bool(enable_preview_html or not preview_only)
         if preview_only:
             log_message('info', self.log, 'No file outputs selected; generating Preview only (no files will be written).')
     # Create parent folders for enabled outputs only (skip entirely if none selected)
         def _ensure_output_dirs():
-            if not (enable_preview_html or enable_json or enable_md):
+            if not any_output:
                 return
             parents = set()
             if enable_preview_html:
@@ -2605,16 +2893,19 @@ class App(tk.Tk):
         def work():
             """Background worker thread: run scan, write files, populate previews, and render GUI-only views."""
             try:
-                import time as _tprof
-                t0_total = _tprof.time()
-                t_build = t_html_write = t_md_write = t_json_write = 0.0
-                t_preview_json = t_preview_md = t_preview_html = t_preview_text = 0.0
+                # Integer nanosecond bracketing; converted to ms only when [TIMER] lines are enabled
+                profile = self._profile_enabled
+                t0_total = _NOW()
+                t_build = t_html_write = t_md_write = t_json_write = 0
+                t_preview_json = t_preview_md = t_preview_html = t_preview_text = 0
                 # Lazy safety: recheck/create parent just before each write in case user deleted it
-                def _safe_parent(path: Path):
+                def _with_parent(path: Path, write: Callable[[], Any]):
+                    # _ensure_output_dirs already created the folders; recreate only if one vanished mid-run
                     try:
+                        return write()
+                    except FileNotFoundError:
                         path.parent.mkdir(parents=True, exist_ok=True)
-                    except Exception:
-                        pass
+                        return write()
                 # UI: indicate running
                 def _start_ui():
                     try:
@@ -2624,9 +2915,9 @@ class App(tk.Tk):
                         self.progress.start(10)
                     except Exception:
                         pass
-                self.after(0, _start_ui)
+                self._post_ui(_start_ui)
                 self._log_i18n('[START]', 'log.startScan', path=str(root))
-                t0 = _tprof.time()
+                t0 = _NOW()
                 # Collect internal phase metrics from core (discover/parse/enrich/group)
                 if core is None or not hasattr(core, 'build_report'):
                     raise RuntimeError('core.build_report not available')
@@ -2635,191 +2926,285 @@ class App(tk.Tk):
                     report, core_metrics = _ret
                 else:  # fallback safety
                     report, core_metrics = _ret, {}
-                t_build = _tprof.time() - t0
+                t_build = _NOW() - t0
                 try:
-                    if core_metrics:
+                    if profile and core_metrics:
                         self.log(
                             "[TIMER] core discover={d:.1f}ms parse={p:.1f}ms enrich={e:.1f}ms group={g:.1f}ms total={tot:.1f}ms".format(
                                 d=core_metrics.get('discover', 0.0),
                                 p=core_metrics.get('parse', 0.0),
                                 e=core_metrics.get('enrich', 0.0),
                                 g=core_metrics.get('group', 0.0),
-                                tot=core_metrics.get('total', t_build * 1000.0)
+                                tot=core_metrics.get('total', t_build / 1e6)
                             )
                         )
-                    self.log(f"[TIMER] build_report wrapper {t_build*1000:.1f}ms (includes core.total)")
+                    if profile:
+                        self.log(f"[TIMER] build_report wrapper {t_build / 1e6:.1f}ms (includes core.total)")
+                except Exception:
+                    pass
+                # Share repeated class/method/mod/path strings before the report is cached and serialized
+                try:
+                    self._intern_report(report)
                 except Exception:
                     pass
+                # Tk state is read once here; the writer threads below only see these plain values.
+                # The file template and report.css dir are resolved here too, so the pool never touches
+                # the module _TPL_CACHE or the _css_dir_* pair. Against Tk-thread preview renders this thread
+                # only does single dict get/set/clear calls (atomic under the GIL); a lost entry costs a reload.
+                include_wrap = bool(self.var_include_wrap.get())
+                lang = self.var_lang.get()
+                theme_class = self._theme_class()
+                tr_out = self._make_gettext_for(lang if localize_output else 'en')
+                file_template: Optional[Tuple[str, bool]] = None  # (html, used external template)
+                css_dir: Optional[Path] = None
+                if enable_preview_html:
+                    try:
+                        file_template = _load_template_and_css(inline_css=False)
+                        css_dir = self._report_css_dir() if file_template[1] else None
+                    except Exception:
+                        file_template = ('<html><body>{{BODY}}</body></html>', False)
                 # Propagate include_wrap flag to report options for shared writers
                 try:
                     opts = dict(report.get('_options') or {})
-                    opts['include_wrap_coexistence'] = bool(self.var_include_wrap.get())
+                    opts['include_wrap_coexistence'] = include_wrap
                     report['_options'] = opts
                 except Exception:
                     pass
                 # Cache last full report for re-rendering/filters
                 self._last_report = report
-                # Write files (order: HTML -> MD -> JSON)
-                if conflicts_only:
-                    trimmed = {
-                        'scanned_root': report['scanned_root'],
-                        'files_scanned': report['files_scanned'],
-                        'annotation_counts': report['annotation_counts'],
-                        'conflicts': report['conflicts'],
-                    }
+                self._last_filter_state = None
+                self._last_include_wrap = include_wrap
+                self._preview_cache.clear()
+                self._md_cache.clear()
+                # One JSON projection (mode trim + include_wrap pruning) shared by the file writer and preview
+                projected = self._project_report(report, conflicts_only, include_wrap)
+                localized_block = self._localized_json_labels(lang)
+                # Write files: HTML / MD / JSON are independent once the report is final, so run them concurrently.
+                # Each writer returns (kind, elapsed ns, payload, timings, log notes); shared App state
+                # (_timings, _md_cache, the log) is only touched after the join, on this thread.
+                def _write_html():
+                    t0w = _NOW()
+                    body_full = None
+                    timings: Dict[str, float] = {}
+                    notes: List[tuple] = []
                     try:
-                        trimmed['_options'] = dict(report.get('_options') or {})
-                    except Exception:
-                        pass
-                # HTML first
-                try:
-                    if enable_preview_html:
-                        t0w = _tprof.time()
-                        _safe_parent(out_html)
-                        src_report = report
-                        tr = self._ if localize_output else self._make_gettext_for('en')
-                        html_body = self.build_html_body(src_report, conflicts_only=conflicts_only, include_reference=include_reference, tr=tr)
-                        full_html, used_tpl = self._wrap_full_html_for_file(html_body)
-                        out_html.write_text(full_html, encoding='utf-8')
+                        html_body = self.build_html_body(report, conflicts_only=conflicts_only, include_reference=include_reference,
+                                                         tr=tr_out, include_wrap=include_wrap, lang=lang)
+                        if localize_output:
+                            body_full = html_body  # same translator as the preview; reusable below
+                        full_html, used_tpl = self._wrap_full_html_for_file(html_body, tr=tr_out, theme_class=theme_class, timings=timings,
+                                                                            template=file_template)
+                        html_bytes = full_html.encode('utf-8')  # encoded once; LF line endings on every platform
+                        _with_parent(out_html, lambda: out_html.write_bytes(html_bytes))
                         if used_tpl:
-                            self._maybe_copy_report_css(out_html)
-                        t_html_write += (_tprof.time() - t0w)
+                            self._maybe_copy_report_css(out_html, css_dir=css_dir)
                         # HTML write done (no dedicated i18n key)
-                except Exception as e:
-                    self._log_i18n('[WARN]', 'log.warnRenderHtml', err=str(e))
-                # Markdown second
-                if not preview_only and enable_md:
+                    except Exception as e:
+                        notes.append(('[WARN]', 'log.warnRenderHtml', {'err': str(e)}))
+                    return 'html', _NOW() - t0w, body_full, timings, notes
+
+                def _write_md():
+                    t0w = _NOW()
+                    md_text = None
+                    timings: Dict[str, float] = {}
+                    notes: List[tuple] = []
                     try:
-                        t0w = _tprof.time()
-                        _safe_parent(out_md)
                         if localize_output:
-                            with self._timed('markdown_build'):
-                                md_text = self._build_localized_markdown(report, conflicts_only=conflicts_only, include_reference=include_reference)
-                            out_md.write_text(md_text, encoding='utf-8')
+                            t0m = _perf()
+                            md_text = self._build_localized_markdown(report, conflicts_only=conflicts_only, include_reference=include_reference,
+                                                                     include_wrap=include_wrap, tr=tr_out)
+                            timings['markdown_build'] = (_perf() - t0m) * 1000.0
+                            md_bytes = md_text.encode('utf-8')
+                            _with_parent(out_md, lambda: out_md.write_bytes(md_bytes))
                         else:
+                            # Exception to the LF policy: the shared CLI writer keeps its text-mode platform newlines
                             if core and hasattr(core, 'write_markdown'):
-                                core.write_markdown(report, out_md, conflicts_only=conflicts_only, include_reference=include_reference)  # type: ignore[attr-defined]
-                        t_md_write += (_tprof.time() - t0w)
-                        self._log_i18n('[DONE]', 'log.doneMd', path=str(out_md))
+                                _with_parent(out_md, lambda: core.write_markdown(report, out_md, conflicts_only=conflicts_only, include_reference=include_reference))  # type: ignore[attr-defined]
+                        notes.append(('[DONE]', 'log.doneMd', {'path': str(out_md)}))
                     except Exception as e:
-                        self._log_i18n('[WARN]', 'log.warnBuildMdPreview', err=str(e))
-                # JSON last
-                if not preview_only and enable_json:
+                        notes.append(('[WARN]', 'log.warnBuildMdPreview', {'err': str(e)}))
+                    return 'md', _NOW() - t0w, md_text, timings, notes
+
+                def _write_json():
+                    # Localized file content equals the JSON preview, so it is serialized once and shared
+                    t0w = _NOW()
+                    text = None
+                    notes: List[tuple] = []
                     try:
-                        t0w = _tprof.time()
-                        _safe_parent(out_json)
-                        if conflicts_only:
-                            data = dict(trimmed)
-                        else:
-                            data = dict(report)
-                            if not bool(self.var_include_wrap.get()):
-                                data.pop('wrap_coexistence', None)
-                                data.pop('replace_wrap_coexistence', None)
+                        data = projected
                         if localize_output:
-                            data = self._augment_json_with_localized(data)
-                        out_json.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
-                        t_json_write += (_tprof.time() - t0w)
-                        self._log_i18n('[DONE]', 'log.doneJson', path=str(out_json))
+                            data = dict(data)
+                            data['localized'] = localized_block
+                            text = json.dumps(data, ensure_ascii=False, indent=2)  # kept for the preview
+
+                        # Written to a sibling temp file and swapped in, so a failed dump never leaves a truncated report
+                        def _dump_json(data=data, text=text):
+                            tmp = out_json.with_name(out_json.name + '.tmp')
+                            try:
+                                if text is not None:
+                                    tmp.write_bytes(text.encode('utf-8'))
+                                else:
+                                    # Stream straight to disk instead of materializing the indented string (LF like the byte writes)
+                                    with tmp.open('w', encoding='utf-8', newline='\n', buffering=1 << 20) as f:
+                                        json.dump(data, f, ensure_ascii=False, indent=2)
+                                os.replace(tmp, out_json)
+                            except BaseException:
+                                try:
+                                    tmp.unlink()
+                                except Exception:
+                                    pass
+                                raise
+                        _with_parent(out_json, _dump_json)
+                        notes.append(('[DONE]', 'log.doneJson', {'path': str(out_json)}))
                     except Exception as e:
-                        self._log_i18n('[WARN]', 'log.warnBuildJsonPreview', err=str(e))
+                        notes.append(('[WARN]', 'log.warnBuildJsonPreview', {'err': str(e)}))
+                    return 'json', _NOW() - t0w, text, {}, notes
+
+                writers = []
+                if enable_preview_html:
+                    writers.append(_write_html)
+                if enable_md:
+                    writers.append(_write_md)
+                if enable_json:
+                    writers.append(_write_json)
+                html_body_full: Optional[str] = None
+                json_text: Optional[str] = None
+                md_written: Optional[str] = None
+                t0ws = _NOW()
+                results = []
+                if len(writers) > 1:
+                    with ThreadPoolExecutor(max_workers=len(writers), thread_name_prefix='rcr-write') as pool:
+                        results = [fut.result() for fut in as_completed([pool.submit(fn) for fn in writers])]
+                elif writers:
+                    results = [writers[0]()]
+                for kind_w, dt, payload, w_timings, w_notes in results:
+                    if kind_w == 'html':
+                        t_html_write += dt
+                        html_body_full = payload
+                    elif kind_w == 'md':
+                        t_md_write += dt
+                        md_written = payload
+                    else:
+                        t_json_write += dt
+                        json_text = payload
+                    for label, ms_w in w_timings.items():
+                        self._timings[label] = self._timings.get(label, 0.0) + ms_w
+                    for prefix, key, kw in w_notes:
+                        self._log_i18n(prefix, key, **kw)
+                if profile and writers:
+                    try:
+                        self.log(f"[TIMER] writes {'+'.join(r[0] for r in results)} wall={(_NOW() - t0ws) / 1e6:.1f}ms")
+                    except Exception:
+                        pass
                 if preview_only:
                     self._log_i18n('[DONE]', 'log.previewOnly')
 
-                # Always render localized Markdown/JSON into the GUI tabs (independent of file outputs)
+                # Markdown/JSON tabs: text the file writers already produced is shown as-is; otherwise a
+                # producer is registered and runs on its own thread when the tab is first selected
+                # (see _defer_tab_text). Producers only see plain values captured here.
                 try:
-                    # JSON preview (trim if conflicts_only)
-                    t0p = _tprof.time()
-                    if conflicts_only:
-                        data = {
-                            'scanned_root': report['scanned_root'],
-                            'files_scanned': report['files_scanned'],
-                            'annotation_counts': report['annotation_counts'],
-                            'conflicts': report['conflicts'],
-                        }
-                        try:
-                            data['_options'] = dict(report.get('_options') or {})
-                        except Exception:
-                            pass
+                    t0p = _NOW()
+                    if json_text is not None:
+                        self._post_ui(lambda t=json_text: self.set_preview_json(t), key='tab_json')
                     else:
-                        # Copy to avoid mutating original when pruning wrap sections
-                        data = dict(report)
-                        # Respect include_wrap for JSON preview (prune sections when off)
-                        try:
-                            if not bool(self.var_include_wrap.get()):
-                                data.pop('wrap_coexistence', None)
-                                data.pop('replace_wrap_coexistence', None)
-                            # Ensure options are present
-                            opts = dict(data.get('_options') or {})
-                            opts['include_wrap_coexistence'] = bool(self.var_include_wrap.get())
-                            data['_options'] = opts
-                        except Exception:
-                            pass
-                    data_disp = self._augment_json_with_localized(data)
-                    self.set_preview_json(json.dumps(data_disp, ensure_ascii=False, indent=2))
-                    t_preview_json += (_tprof.time() - t0p)
+                        def _json_preview(data=dict(projected, localized=localized_block)):
+                            return _json_text(data)
+                        self._post_ui(lambda: self._defer_tab_text('txt_json', _json_preview, 'log.warnBuildJsonPreview'),
+                                      key='tab_json')
+                    t_preview_json += (_NOW() - t0p)
                 except Exception as e:
                     self._log_i18n('[WARN]', 'log.warnBuildJsonPreview', err=str(e))
                 try:
-                    # Markdown preview (localized)
-                    t0p = _tprof.time()
-                    with self._timed('markdown_build'):
-                        md_text = self._build_localized_markdown(report, conflicts_only=conflicts_only, include_reference=include_reference)
-                    self.set_preview_md(md_text)
-                    t_preview_md += (_tprof.time() - t0p)
+                    t0p = _NOW()
+                    tr_md = self._make_gettext_for(lang)
+
+                    def _seed_md_cache(text: str, report=report, conflicts_only=conflicts_only, include_reference=include_reference):
+                        # Tk thread: later rerenders (language / include-wrap refresh) reuse the text
+                        self._localized_markdown_cached(report, conflicts_only=conflicts_only, include_reference=include_reference,
+                                                        include_wrap=include_wrap, lang=lang, prebuilt=text)
+
+                    if md_written is not None:
+                        def _show_md(t=md_written):
+                            _seed_md_cache(t)
+                            self.set_preview_md(t)
+                        self._post_ui(_show_md, key='tab_md')
+                    else:
+                        def _md_preview(report=report, conflicts_only=conflicts_only, include_reference=include_reference):
+                            return self._build_localized_markdown(report, conflicts_only=conflicts_only, include_reference=include_reference,
+                                                                  include_wrap=include_wrap, tr=tr_md)
+                        self._post_ui(lambda: self._defer_tab_text('txt_md', _md_preview, 'log.warnBuildMdPreview', on_done=_seed_md_cache),
+                                      key='tab_md')
+                    t_preview_md += (_NOW() - t0p)
                 except Exception as e:
                     self._log_i18n('[WARN]', 'log.warnBuildMdPreview', err=str(e))
 
-                # Build HTML body (GUI-only) and render (apply filters for Preview only)
+                # Preview: filter only for a renderer that will consume it (WebView2 HTML or the styled Text fallback)
+                render_html = self.webview2 is not None
+                render_text = not render_html and self.txt_html is not None
+                filtered = None
+
+                def _get_filtered():
+                    nonlocal filtered
+                    if filtered is None:
+                        filtered = self._filter_report_for_preview(report, conflicts_only=conflicts_only)
+                        try:
+                            self._last_filtered_conflicts_count = len(filtered.get('conflicts', []) or [])
+                        except Exception:
+                            self._last_filtered_conflicts_count = 0
+                    return filtered
+
+                # Build HTML body (GUI-only) and render; Text mode leaves it empty so "open in browser" builds on demand
                 try:
-                    t0p = _tprof.time()
-                    filtered = self._filter_report_for_preview(report, conflicts_only=conflicts_only)
-                    html_body = self.build_html_body(filtered, conflicts_only=conflicts_only, include_reference=include_reference)
-                    self._last_html_body = html_body
-                    try:
-                        self._last_filtered_conflicts_count = len(filtered.get('conflicts', []) or [])
-                    except Exception:
-                        self._last_filtered_conflicts_count = 0
-                    if self.webview2 is not None:
+                    t0p = _NOW()
+                    if render_html:
+                        flt = _get_filtered()
+                        # Filters that kept every conflict (and no per-entry mod filter) leave the body unchanged
+                        if (html_body_full is not None
+                                and len(flt.get('conflicts') or []) == len(report.get('conflicts') or [])
+                                and not (self.var_filter_mods.get() or '').strip()):
+                            html_body = html_body_full
+                        else:
+                            html_body = self.build_html_body(flt, conflicts_only=conflicts_only, include_reference=include_reference)
+                        self._last_html_body = html_body
                         self.set_preview_html_from_body(html_body)
-                    t_preview_html += (_tprof.time() - t0p)
+                    else:
+                        self._last_html_body = ''
+                    t_preview_html += (_NOW() - t0p)
                 except Exception as e:
                     self._log_i18n('[WARN]', 'log.warnRenderHtml', err=str(e))
 
                 # Styled Text fallback (no external deps)
                 try:
-                    # Reuse previously filtered result
-                    t0p = _tprof.time()
-                    if 'filtered' not in locals():  # safety, should exist
-                        filtered = self._filter_report_for_preview(report, conflicts_only=conflicts_only)
-                    self._last_render_args = (filtered, conflicts_only, include_reference)
-                    if self.webview2 is None and self.txt_html is not None:
+                    t0p = _NOW()
+                    if render_html or render_text:
+                        self._last_render_args = (_get_filtered(), conflicts_only, include_reference)
+                    else:
+                        self._last_render_args = None
+                    if render_text:
                         self.render_report_to_text(filtered, conflicts_only=conflicts_only, include_reference=include_reference)
-                    try:
-                        if not hasattr(self, '_last_filtered_conflicts_count'):
-                            self._last_filtered_conflicts_count = len(filtered.get('conflicts', []) or [])
-                    except Exception:
-                        pass
-                    t_preview_text += (_tprof.time() - t0p)
+                    t_preview_text += (_NOW() - t0p)
                 except Exception as e:
                     self._log_i18n('[WARN]', 'log.warnRenderText', err=str(e))
 
                 # Auto-switch to an available preview tab
                 def _post_success():
                     try:
-                        self.nb.select(0)
-                    except Exception:
-                        pass
-                    try:
-                        self._update_status_bar()
+                        self.nb.select(0)
                     except Exception:
                         pass
-                    # Timing summary (only after successful finish)
                     try:
-                        t_total = _tprof.time() - t0_total
-                        self.log(
-                            f"[TIMER] summary build={t_build*1000:.1f}ms htmlW={t_html_write*1000:.1f}ms mdW={t_md_write*1000:.1f}ms jsonW={t_json_write*1000:.1f}ms prevJson={t_preview_json*1000:.1f}ms prevMd={t_preview_md*1000:.1f}ms prevHtml={t_preview_html*1000:.1f}ms prevText={t_preview_text*1000:.1f}ms total={t_total*1000:.1f}ms")
+                        self._update_status_bar()
                     except Exception:
                         pass
+                    # Timing summary (only after successful finish, profiling builds only)
+                    if profile:
+                        try:
+                            ms = lambda ns: ns / 1e6
+                            t_total = _NOW() - t0_total
+                            self.log(
+                                f"[TIMER] summary build={ms(t_build):.1f}ms htmlW={ms(t_html_write):.1f}ms mdW={ms(t_md_write):.1f}ms jsonW={ms(t_json_write):.1f}ms prevJson={ms(t_preview_json):.1f}ms prevMd={ms(t_preview_md):.1f}ms prevHtml={ms(t_preview_html):.1f}ms prevText={ms(t_preview_text):.1f}ms total={ms(t_total):.1f}ms")
+                        except Exception:
+                            pass
                     # Show browser open button after first successful run
                     try:
                         if hasattr(self, 'btn_open_browser') and self.btn_open_browser and not self.btn_open_browser.winfo_ismapped():
@@ -2829,7 +3214,6 @@ class App(tk.Tk):
                         pass
                     # Show 'Open folder' button only when any output file was requested and written
                     try:
-                        any_output = bool(enable_preview_html or enable_json or enable_md)
                         if any_output and hasattr(self, 'btn_open_folder') and self.btn_open_folder and not self.btn_open_folder.winfo_ismapped():
                             # Show third, after the browser button
                             self.btn_open_folder.pack(side='left', padx=(0, 6))
@@ -2842,16 +3226,17 @@ class App(tk.Tk):
                     except Exception:
                         self._toast(self._('toast.done'))
                     try:
-                        if self.var_auto_open.get() and not preview_only and (enable_json or enable_md):
+                        if not preview_only and self.var_auto_open.get():
                             self.on_open_folder()
                     except Exception:
                         pass
-                self.after(0, _post_success)
+                done_cbs.append(_post_success)
             except Exception as e:
-                def _post_error():
-                    messagebox.showerror(self._('dialog.error.title'), f'Failed to run:\n{e}')
-                    log_message('error', self.log, f'{e}')
-                self.after(0, _post_error)
+                # Bound now: the except clause unbinds ``e`` before the callback runs on the Tk thread
+                def _post_error(err=e):
+                    messagebox.showerror(self._('dialog.error.title'), f'Failed to run:\n{err}')
+                    log_message('error', self.log, f'{err}')
+                done_cbs.append(_post_error)
             finally:
                 # UI: restore when done
                 def _stop_ui():
@@ -2866,11 +3251,188 @@ class App(tk.Tk):
                             pass
                     except Exception:
                         pass
-                self.after(0, _stop_ui)
+                done_cbs.append(_stop_ui)
+                self._signal_scan_done(done_pipe, done_cbs)
+        # Disabled right away (not via the worker's _start_ui) so a quick second click cannot start another run
+        try:
+            self.btn_run.configure(state='disabled')
+        except Exception:
+            pass
+        # Per-run completion state, captured by work() so overlapping runs never share a pipe or callback list
+        done_cbs: List[Callable[[], Any]] = []
+        done_pipe = self._arm_scan_done_notifier(done_cbs)
         threading.Thread(target=work, daemon=True).start()
 
+    # --- Scan completion notification ------------------------------------------------
+    def _arm_scan_done_notifier(self, callbacks: List[Callable[[], Any]]) -> Optional[tuple]:
+        """Prepare a pipe watched by Tk so the worker can wake the event loop once ``callbacks`` are filled.
+
+        Returns the run's (read fd, write fd) pair for _signal_scan_done, or None when Tk file handlers are
+        unavailable (Windows); the worker then falls back to _post_ui (one after(0) wakeup).
+        """
+        if os.name == 'nt' or not hasattr(self.tk, 'createfilehandler'):
+            return None
+        try:
+            r, w = os.pipe()
+        except Exception:
+            return None
+        pipe = (r, w)
+        try:
+            self.tk.createfilehandler(r, tk.READABLE, lambda *_: self._on_scan_done(pipe, callbacks))
+        except Exception:
+            self._close_scan_done_pipe(pipe)
+            return None
+        self._scan_done_pipes.add(pipe)
+        return pipe
+
+    def _signal_scan_done(self, pipe: Optional[tuple], callbacks: List[Callable[[], Any]]):
+        """Called from the worker thread once ``callbacks`` is complete: wake the main loop once."""
+        if pipe is not None:
+            try:
+                os.write(pipe[1], b'1')
+                return
+            except Exception:
+                pass
+        self._post_ui(lambda: self._on_scan_done(pipe, callbacks))
+
+    def _close_scan_done_pipe(self, pipe: Optional[tuple]):
+        """Unregister a completion pipe's Tk file handler and close both ends (no-op for None or a closed pipe)."""
+        if pipe is None:
+            return
+        self._scan_done_pipes.discard(pipe)
+        r, w = pipe
+        try:
+            self.tk.deletefilehandler(r)
+        except Exception:
+            pass
+        for fd in (r, w):
+            try:
+                os.close(fd)
+            except Exception:
+                pass
+
+    def _on_scan_done(self, pipe: Optional[tuple], callbacks: List[Callable[[], Any]]):
+        """Main thread: tear down the run's completion pipe (if any) and run its UI callbacks in order."""
+        # A closed pipe's fds may already belong to a newer run; never close them twice
+        if pipe is not None and pipe in self._scan_done_pipes:
+            self._close_scan_done_pipe(pipe)
+        for cb in list(callbacks):
+            try:
+                cb()
+            except Exception:
+                pass
+
+    def _post_ui(self, fn: Callable[[], Any], key: Optional[str] = None):
+        """Queue ``fn`` for the Tk thread; callable from workers. One after(0) wakeup drains the whole batch.
+
+        Callbacks sharing a ``key`` are coalesced: only the most recently queued one runs.
+        """
+        self._ui_queue.put((key, fn))
+        if not self._ui_drain_scheduled:
+            self._ui_drain_scheduled = True
+            try:
+                self.after(0, self._drain_ui_queue)
+            except Exception:
+                self._ui_drain_scheduled = False
+
+    def _drain_ui_queue(self):
+        """Main thread: run every queued UI callback in order (latest only per coalescing key)."""
+        self._ui_drain_scheduled = False
+        batch: List[tuple] = []
+        try:
+            while True:
+                batch.append(self._ui_queue.get_nowait())
+        except queue.Empty:
+            pass
+        last_for_key = {key: i for i, (key, _fn) in enumerate(batch) if key is not None}
+        for i, (key, fn) in enumerate(batch):
+            if key is not None and last_for_key[key] != i:
+                continue
+            try:
+                fn()
+            except Exception:
+                pass
+
+    _WRAP_KEYS = frozenset({'wrap_coexistence', 'replace_wrap_coexistence'})
+    _INTERN_ENTRY_KEYS = ('annotation', 'class', 'method', 'mod', 'file', 'relpath', 'func_sig')
+    _INTERN_GROUP_LISTS = ('mods', 'mods_replace', 'mods_wrap')
+
+    @classmethod
+    def _intern_report(cls, report: dict) -> None:
+        """Intern the heavily repeated strings of a fresh scan report in place.
+
+        Entry dicts are shared between ``entries`` and the group ``occurrences`` lists, so one walk
+        over ``entries`` covers them; group class/method names and mod lists are handled separately.
+        """
+        _intern = sys.intern
+        entry_keys = cls._INTERN_ENTRY_KEYS
+        list_keys = cls._INTERN_GROUP_LISTS
+        for e in report.get('entries') or []:
+            for k in entry_keys:
+                v = e.get(k)
+                if type(v) is str:
+                    e[k] = _intern(v)
+        for group_key in ('conflicts', 'wrap_coexistence', 'replace_wrap_coexistence'):
+            for g in report.get(group_key) or []:
+                for k in ('class', 'method'):
+                    v = g.get(k)
+                    if type(v) is str:
+                        g[k] = _intern(v)
+                for k in list_keys:
+                    lst = g.get(k)
+                    if type(lst) is list:
+                        g[k] = [_intern(m) if type(m) is str else m for m in lst]
+
+    def _project_report(self, report: dict, conflicts_only: bool, include_wrap: bool) -> dict:
+        """Shallow JSON view of ``report``: the 4 summary keys in conflicts-only mode, else every key
+        except the wrap sections when include_wrap is off. ``_options`` is always a fresh copy
+        carrying include_wrap_coexistence, so the report's own options are never mutated.
+        """
+        if conflicts_only:
+            data = {k: report.get(k) for k in ('scanned_root', 'files_scanned', 'annotation_counts', 'conflicts')}
+        else:
+            wrap_keys = self._WRAP_KEYS
+            data = {k: v for k, v in report.items() if include_wrap or k not in wrap_keys}
+        opts = report.get('_options')
+        opts = dict(opts) if isinstance(opts, dict) else {}
+        if not conflicts_only:
+            opts['include_wrap_coexistence'] = include_wrap
+        data['_options'] = opts
+        return data
+
+    _INCLUDE_WRAP_DEBOUNCE_MS = 120
+
     def _on_include_wrap_toggle(self):
-        """Handle include-wrap toggle: rerender preview and refresh Markdown/JSON tabs and outwin status."""
+        """Coalesce include-wrap toggles (checkbox command + var trace, rapid flicks) into one refresh."""
+        try:
+            prev = getattr(self, '_include_wrap_after_id', None)
+            if prev is not None:
+                self.after_cancel(prev)
+            self._include_wrap_after_id = self.after(self._INCLUDE_WRAP_DEBOUNCE_MS, self._do_include_wrap_refresh)
+        except Exception:
+            self._do_include_wrap_refresh()
+
+    def _do_include_wrap_refresh(self):
+        """Rerender preview and refresh Markdown/JSON tabs; no-op if include_wrap ends up unchanged."""
+        self._include_wrap_after_id = None
+        try:
+            include_wrap = bool(self.var_include_wrap.get())
+        except Exception:
+            include_wrap = None
+        if include_wrap is not None and include_wrap == getattr(self, '_last_include_wrap', None):
+            return
+        self._last_include_wrap = include_wrap
+        self._md_cache.clear()
+        # Keep the cached report's options in step: builders read report['_options'] on every rerender
+        # (hidden-wrap tooltip, wrap sections), so filter/theme/font rerenders must see the new value
+        try:
+            lr = getattr(self, '_last_report', None)
+            if lr and include_wrap is not None:
+                opts = dict(lr.get('_options') or {})
+                opts['include_wrap_coexistence'] = include_wrap
+                lr['_options'] = opts
+        except Exception:
+            pass
         try:
             self._rerender_preview()
         except Exception:
@@ -2882,47 +3444,14 @@ class App(tk.Tk):
                 include_reference = not conflicts_only
                 # JSON tab
                 try:
-                    if conflicts_only:
-                        data = {}
-                        try:
-                            data['scanned_root'] = lr.get('scanned_root')  # type: ignore[index]
-                            data['files_scanned'] = lr.get('files_scanned')  # type: ignore[index]
-                            data['annotation_counts'] = lr.get('annotation_counts')  # type: ignore[index]
-                            data['conflicts'] = lr.get('conflicts')  # type: ignore[index]
-                        except Exception:
-                            pass
-                        try:
-                            opts_src = getattr(lr, 'get', lambda *_: None)('_options')  # type: ignore[call-arg]
-                            if isinstance(opts_src, dict):
-                                data['_options'] = dict(opts_src)  # type: ignore[index]
-                        except Exception:
-                            pass
-                    else:
-                        try:
-                            data = dict(lr)  # type: ignore[arg-type]
-                        except Exception:
-                            data = {}
-                        try:
-                            if not bool(self.var_include_wrap.get()):
-                                data.pop('wrap_coexistence', None)  # type: ignore[call-arg]
-                                data.pop('replace_wrap_coexistence', None)  # type: ignore[call-arg]
-                        except Exception:
-                            pass
-                        try:
-                            opts2 = data.get('_options') if isinstance(data, dict) else None  # type: ignore[index]
-                            if not isinstance(opts2, dict):
-                                opts2 = {}
-                            opts2['include_wrap_coexistence'] = bool(self.var_include_wrap.get())  # type: ignore[index]
-                            data['_options'] = opts2  # type: ignore[index]
-                        except Exception:
-                            pass
+                    data = self._project_report(lr, conflicts_only, bool(self.var_include_wrap.get()))
                     data_disp = self._augment_json_with_localized(data)
-                    self.set_preview_json(json.dumps(data_disp, ensure_ascii=False, indent=2))
+                    self.set_preview_json(_json_text(data_disp))
                 except Exception:
                     pass
                 # MD tab
                 try:
-                    md_text = self._build_localized_markdown(lr, conflicts_only=conflicts_only, include_reference=include_reference)
+                    md_text = self._localized_markdown_cached(lr, conflicts_only=conflicts_only, include_reference=include_reference)
                     self.set_preview_md(md_text)
                 except Exception:
                     pass
@@ -3002,8 +3531,13 @@ class App(tk.Tk):
                         wv.load_html_string(html)  # type: ignore[attr-defined]
                         return
                     if hasattr(wv, 'navigate'):
+                        html_bytes = html.encode('utf-8')
+                        if len(html_bytes) > self._WV_DATA_URL_MAX:
+                            # Large page: navigate to a temp file instead of a multi-MB base64 data URL
+                            wv.navigate(self._webview2_nav_temp_uri(html_bytes))  # type: ignore[attr-defined]
+                            return
                         import base64
-                        data_url = 'data:text/html;base64,' + base64.b64encode(html.encode('utf-8')).decode('ascii')
+                        data_url = 'data:text/html;base64,' + base64.b64encode(html_bytes).decode('ascii')
                         wv.navigate(data_url)  # type: ignore[attr-defined]
                         return
             except Exception as e:
@@ -3012,6 +3546,65 @@ class App(tk.Tk):
         except Exception:
             pass
 
+    _WV_DATA_URL_MAX = 1_000_000  # bytes; above this _webview2_dispatch_load navigates to a temp file
+
+    def _webview2_nav_temp_uri(self, html_bytes: bytes) -> str:
+        """Write ``html_bytes`` to a fresh temp .html (session folder preferred) and return its file URI.
+
+        The file from the previous large load is removed first, so at most one is left behind.
+        """
+        prev = getattr(self, '_wv_nav_temp', None)
+        if prev is not None:
+            try:
+                prev.unlink()
+            except Exception:
+                pass
+        try:
+            dest_dir = Path(self.session_temp_dir) if self.session_temp_dir and Path(self.session_temp_dir).exists() else None
+        except Exception:
+            dest_dir = None
+        if dest_dir is not None:
+            path = dest_dir / f"webview_{secrets.token_hex(8)}.html"
+            path.write_bytes(html_bytes)
+        else:
+            with tempfile.NamedTemporaryFile('wb', delete=False, suffix='.html') as tf:
+                tf.write(html_bytes)
+                path = Path(tf.name)
+            try:
+                self._loose_temp_files.append(path)
+            except Exception:
+                pass
+        self._wv_nav_temp = path
+        return path.as_uri()
+
+    def _webview2_set_theme_class(self, dark: bool) -> bool:  # pragma: no cover - GUI
+        """Toggle the template's THEME_CLASS on the loaded page via script (no reload).
+
+        Returns False when WebView2 is inactive or exposes no script API, so callers can
+        fall back to a full reload.
+        """
+        wv = getattr(self, 'webview2', None)
+        if wv is None:
+            return False
+        js = f"document.body.classList.toggle('dark', {'true' if dark else 'false'})"
+        try:
+            for name in ('evaluate_js', 'execute_script', 'run_js'):
+                fn = getattr(wv, name, None)
+                if callable(fn):
+                    fn(js)
+                    break
+            else:
+                return False
+        except Exception as e:
+            log_message('warn', self.log, f"WebView2 theme script failed: {e.__class__.__name__}: {e}")
+            return False
+        # Keep the cached document (Copy HTML) in sync with what is displayed
+        try:
+            self._last_full_html, _ = self._render_full_html(self._last_html_body, inline_css=True, tr=self._)
+        except Exception:
+            pass
+        return True
+
     def set_preview_md(self, content: str):  # pragma: no cover - GUI
         """Push text into the Markdown tab (read-only-ish) with None guard."""
         self._safe_set_text('txt_md', content)
@@ -3025,6 +3618,7 @@ class App(tk.Tk):
         """Wrap body HTML with external template (inline CSS for preview) and load it."""
         full_html, _ = self._render_full_html(body_html, inline_css=True, tr=self._)
         self._last_full_html = full_html
+        self._geom_dirty = True
         def _update():
             try:
                 if HAS_WEBVIEW2 and self.webview2 is not None:
@@ -3034,7 +3628,7 @@ class App(tk.Tk):
                     self.render_report_to_text(rep, conflicts_only=c_only, include_reference=inc_ref)
             except Exception:
                 pass
-        self.after(0, _update)
+        self._post_ui(_update, key='preview_html')
 
     # Restored high-level renderer (not currently called directly but kept for parity)
     def render_report_to_html(self, report: dict, conflicts_only: bool, include_reference: bool):  # pragma: no cover - GUI
@@ -3046,41 +3640,55 @@ class App(tk.Tk):
         except Exception:
             pass
 
-    def _wrap_full_html_for_file(self, body_html: str) -> tuple[str, bool]:
+    def _wrap_full_html_for_file(self, body_html: str, tr=None, theme_class: Optional[str] = None,
+                                 timings: Optional[Dict[str, float]] = None,
+                                 template: Optional[Tuple[str, bool]] = None) -> tuple[str, bool]:
         """Return (html, used_external_template) for file export.
 
         When an external template is used we DO NOT inline CSS so that the
         companion report.css can be copied next to the output file for reuse.
         Callers should, when the bool is True, invoke _maybe_copy_report_css().
         """
-        return self._render_full_html(body_html, inline_css=False, tr=self._)
+        return self._render_full_html(body_html, inline_css=False, tr=tr if callable(tr) else self._,
+                                      theme_class=theme_class, timings=timings, template=template)
+
+    def _report_css_dir(self) -> Optional[Path]:
+        """First asset dir containing report.css (same order as discovery), resolved once per session."""
+        if not self._css_dir_resolved:
+            self._css_dir_cached = next((d for d in discover_asset_dirs() if (d / 'report.css').exists()), None)
+            self._css_dir_resolved = True
+        return self._css_dir_cached
 
-    def _maybe_copy_report_css(self, destination_html: Path, overwrite: bool = False):
+    def _maybe_copy_report_css(self, destination_html: Path, overwrite: bool = False, css_dir: Optional[Path] = None):
         """Delegate CSS copy to common_assets.ensure_css_copy.
 
-        We locate the first asset dir containing report.css (same order as discovery)
-        and copy it next to destination if needed.
+        report.css is copied next to destination if needed, from ``css_dir`` when the caller
+        already resolved it (scan writers), else from _report_css_dir() (asset dirs are fixed
+        at startup, so later writes skip the exists() probes).
         """
         def _copy():
-            chosen: Optional[Path] = None
-            for d in discover_asset_dirs():
-                if (d / 'report.css').exists():
-                    chosen = d
-                    break
+            chosen = css_dir if css_dir is not None else self._report_css_dir()
             if chosen:
                 _ca_ensure_css_copy(destination_html, chosen, overwrite=overwrite)
         safe_call(_copy)
 
     # Copy handlers omitted
 
-    def build_html_body(self, report: dict, conflicts_only: bool, include_reference: bool, tr=None) -> str:
+    def build_html_body(self, report: dict, conflicts_only: bool, include_reference: bool, tr=None,
+                        include_wrap: Optional[bool] = None, lang: Optional[str] = None) -> str:
+        """HTML body fragment for ``report``; include_wrap/lang default to the GUI state.
+
+        Callers off the Tk thread (scan writers) pass include_wrap, lang and tr explicitly so no
+        Tk variable is touched.
+        """
         from builders.report_builders import build_html_body_gui  # type: ignore
         from typing import Callable, cast
         # Determine include_wrap from GUI state
-        try:
-            include_wrap = bool(self.var_include_wrap.get())
-        except Exception:
-            include_wrap = False
+        if include_wrap is None:
+            try:
+                include_wrap = bool(self.var_include_wrap.get())
+            except Exception:
+                include_wrap = False
         # Determine disable_file_links from report options
         try:
             disable_file_links = bool((report.get('_options') or {}).get('disable_file_links', False))
@@ -3088,7 +3696,7 @@ class App(tk.Tk):
             disable_file_links = False
         # Prepare legend lines (GUI bundles) injected so common builder can use them
         try:
-            cur_lang = self.var_lang.get() if hasattr(self, 'var_lang') else 'en'
+            cur_lang = lang if lang is not None else (self.var_lang.get() if hasattr(self, 'var_lang') else 'en')
             bundle = (self._bundles.get(cur_lang) or {})
             if isinstance(bundle.get('legend.lines'), list):
                 report = dict(report)
@@ -3098,6 +3706,11 @@ class App(tk.Tk):
         # Ensure translator has (str)->str signature for type checkers
         raw_tr = tr if callable(tr) else self._
         tr_fn = cast(Callable[[str], str], raw_tr)
+        # Anchors are precomputed in one pass so the builder indexes a list instead of calling back per row
+        try:
+            anchors = self._anchor_pairs_for_conflicts(report.get('conflicts') or [])
+        except Exception:
+            anchors = None
         # Delegate; pass GUI impact & anchor helpers
         return build_html_body_gui(
             report,
@@ -3106,19 +3719,38 @@ class App(tk.Tk):
             include_reference=include_reference,
             include_wrap=include_wrap,
             disable_file_links=disable_file_links,
-            impact_fn=lambda cls, meth, mods, entries: self._assess_conflict_impact(cls, meth, mods, entries),
-            anchor_fn=lambda idx, cls, meth: self._anchor_id_for_conflict(idx, cls, meth),
+            impact_fn=self._assess_conflict_impact,
+            anchor_fn=self._anchor_id_for_conflict,
+            anchors=anchors,
         )
 
     # --- Helper: anchor id for conflicts ---
+    @staticmethod
+    def _anchor_base(cls: str, meth: str) -> str:
+        base = (cls + '-' + meth).lower()
+        if base.isascii():
+            return base.translate(_ANCHOR_TABLE)
+        return ''.join(ch for ch in base.replace(' ', '-') if ch.isalnum() or ch in ('-', '_', '.'))
+
     def _anchor_id_for_conflict(self, idx: Optional[int], cls: str, meth: str) -> str:
-        base = (cls + '-' + meth).lower().replace(' ', '-')
-        base = ''.join(ch for ch in base if ch.isalnum() or ch in ('-', '_', '.'))
+        base = self._anchor_base(cls, meth)
         if idx is not None:
             return f"conf-{idx}-{base}"
         return f"conf-{base}"
 
+    def _anchor_pairs_for_conflicts(self, conflicts: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        """Return [(row_anchor, detail_anchor), ...] aligned with conflicts (1-based row index)."""
+        base_of = self._anchor_base
+        pairs: List[Tuple[str, str]] = []
+        add = pairs.append
+        for idx, c in enumerate(conflicts, start=1):
+            base = base_of(c.get('class', ''), c.get('method', ''))
+            add((f"conf-{idx}-{base}", f"conf-{base}"))
+        return pairs
+
     # --- Styled Text fallback rendering (no external deps) ---
+    _NAMED_DEFAULT_FONTS = ("TkDefaultFont", "TkHeadingFont", "TkTextFont", "TkFixedFont", "TkMenuFont", "TkTooltipFont")
+
     def _init_fonts(self):
         """Initialize fonts for the styled Text fallback renderer."""
         try:
@@ -3147,6 +3779,24 @@ class App(tk.Tk):
             self.font_mono = tkfont.Font(size=10)
             self.font_meta = tkfont.Font(size=9)
             self.font_impact = tkfont.Font(size=10)
+        # Unscaled sizes captured once at creation: apply_font_scale multiplies these
+        self._font_scale_targets: List[Tuple[tkfont.Font, int, int]] = []
+        for attr, min_size in self._TEXT_FONT_SPEC:
+            try:
+                f = getattr(self, attr)
+                self._font_scale_targets.append((f, int(f.cget('size') or 10), min_size))
+            except Exception:
+                pass
+        # Family-change targets resolved once; apply_font_family_flow reconfigures them in place
+        self._all_custom_fonts = tuple(f for f in (self.font_base, self.font_bold, self.font_h1, self.font_h2,
+                                                   self.font_mono, self.font_meta, self.font_impact) if f is not None)
+        named: List[tkfont.Font] = []
+        for tkname in self._NAMED_DEFAULT_FONTS:
+            try:
+                named.append(tkfont.nametofont(tkname))
+            except Exception:
+                pass
+        self._named_default_fonts = tuple(named)
         # Apply base font to the HTML Text widget so untagged text also uses Segoe UI
         try:
             if hasattr(self, 'txt_html') and self.txt_html is not None:
@@ -3180,6 +3830,10 @@ class App(tk.Tk):
         """
         try:
             fam = (explicit_family or (self.var_font_family.get() if hasattr(self, 'var_font_family') else '') or 'Segoe UI').strip()
+            # Re-selecting the active family (e.g. its MRU entry) changes nothing: skip the reconfigure + re-render.
+            # The MRU already has it first, since it was bumped when it became active.
+            if fam == getattr(self, '_last_font_family', None):
+                return
             # MRU maintenance
             try:
                 prev = getattr(self, '_last_font_family', None)
@@ -3195,24 +3849,21 @@ class App(tk.Tk):
                 self._last_font_family = fam
             except Exception:
                 pass
-            # Update custom font objects
-            fonts = [getattr(self, n, None) for n in ('font_base','font_bold','font_h1','font_h2','font_mono','font_meta','font_impact')]
-            for f in fonts:
-                if f is not None:
-                    try:
-                        f.configure(family=fam)
-                    except Exception:
-                        pass
-            # Named defaults
-            try:
-                for tkname in ("TkDefaultFont","TkHeadingFont","TkTextFont","TkFixedFont","TkMenuFont","TkTooltipFont"):
+            # Update custom font objects + Tk named defaults (both resolved once in _init_fonts)
+            named = getattr(self, '_named_default_fonts', None)
+            if named is None:  # settings load can apply a family before _init_fonts ran
+                named = []
+                for tkname in self._NAMED_DEFAULT_FONTS:
                     try:
-                        nf = tkfont.nametofont(tkname)
-                        nf.configure(family=fam)
+                        named.append(tkfont.nametofont(tkname))
                     except Exception:
                         pass
-            except Exception:
-                pass
+                named = tuple(named)
+            for f in getattr(self, '_all_custom_fonts', ()) + named:
+                try:
+                    f.configure(family=fam)
+                except Exception:
+                    pass
             # Apply to existing Text widgets (HTML + others)
             try:
                 if hasattr(self, 'txt_html') and self.txt_html is not None:
@@ -3293,6 +3944,46 @@ class App(tk.Tk):
             pass
 
     # --- Font chooser dialog -------------------------------------------------------
+    @staticmethod
+    def _categorize_font_family(name: str) -> str:
+        """Font chooser category for a family name (very lightweight heuristics)."""
+        n = name.lower()
+        for cat, kws in _FONT_CAT_RULES:
+            if any(k in n for k in kws):
+                return cat
+        return 'other'
+
+    def _get_font_families_cached(self, force_reload: bool = False) -> Tuple[Tuple[str, ...], Dict[str, str]]:
+        """Return (sorted normalized families, family -> category) for the font chooser.
+
+        tkfont.families() is a Tcl round-trip over every installed font, so the normalized list
+        ('@' vertical variants folded, deduped, case-insensitive sort) and its categories are
+        computed on first use and reused by later dialog opens. An empty result is not cached.
+        """
+        fonts = getattr(self, '_font_families_cache', None)
+        if fonts is not None and not force_reload:
+            return fonts, self._font_cat_map
+        import tkinter.font as tkfont
+        try:
+            raw = list(tkfont.families())
+        except Exception:
+            raw = []
+        norm_seen = set(); out = []
+        for r in raw:
+            base = r[1:] if r.startswith('@') else r
+            if not base or base in norm_seen: continue
+            norm_seen.add(base); out.append(base)
+        out.sort(key=str.lower)
+        categorize = self._categorize_font_family
+        fonts = tuple(out)
+        cat_map = {f: categorize(f) for f in fonts}
+        if fonts:
+            self._font_families_cache = fonts
+            self._font_cat_map = cat_map
+        return fonts, cat_map
+
+    _FONT_SEARCH_DEBOUNCE_MS = 80
+
     def open_font_chooser(self):
         """Enhanced font selection dialog with search + category grouping.
 
@@ -3319,32 +4010,8 @@ class App(tk.Tk):
             frm = ttk.Frame(win)
             frm.pack(fill='both', expand=True, padx=8, pady=8)
 
-            # Gather & normalize fonts (reuse same logic as menu: remove '@', dedupe)
-            try:
-                raw = list(tkfont.families())
-            except Exception:
-                raw = []
-            norm_seen = set(); fonts = []
-            for r in raw:
-                base = r[1:] if r.startswith('@') else r
-                if not base or base in norm_seen: continue
-                norm_seen.add(base); fonts.append(base)
-            fonts.sort(key=str.lower)
-
-            # Categorize
-            def categorize(name: str) -> str:
-                n = name.lower()
-                # very lightweight heuristics
-                if any(k in n for k in ('mono','console','terminal','courier','coder','code','fixed')):
-                    return 'mono'
-                if any(k in n for k in ('gothic','ui','segoe','arial','helvetica','sans','verdana','roboto','noto','meiryo','yu ')):
-                    return 'sans'
-                if any(k in n for k in ('serif','times','georgia','garamond','roman')):
-                    return 'serif'
-                if any(k in n for k in ('meiryo','gothic','yu ','noto sans cjk','ms pgothic','ms gothic','hiragino','ud ')):
-                    return 'cjk'
-                return 'other'
-            cat_map = {f: categorize(f) for f in fonts}
+            # Normalized family list + categories (enumerated once per session)
+            fonts, cat_map = self._get_font_families_cached()
 
             # UI controls
             topbar = ttk.Frame(frm); topbar.pack(fill='x', pady=(0,6))
@@ -3386,6 +4053,13 @@ class App(tk.Tk):
             # Fallback sample string kept ASCII-only to comply with English-only comment/content policy
             sample_label = ttk.Label(sample_frame, text=self._('fontChooser.previewSample'))
             sample_label.pack(fill='x')
+            # One named preview font per dialog; selections only reconfigure its family.
+            # Kept on self so the Tk font is not deleted while the label still uses it.
+            try:
+                self._font_preview_font = tkfont.Font(family=(self.var_font_family.get() or 'Segoe UI'), size=12)
+                sample_label.configure(font=self._font_preview_font)
+            except Exception:
+                self._font_preview_font = None
 
             # Buttons
             btn_frame = ttk.Frame(frm); btn_frame.pack(fill='x', pady=(8,0))
@@ -3420,24 +4094,38 @@ class App(tk.Tk):
             btn_apply.pack(side='right')
 
             # Filtering logic
+            def _cancel_search_refresh():
+                prev = getattr(self, '_font_search_after', None)
+                self._font_search_after = None
+                if prev is not None:
+                    try: self.after_cancel(prev)
+                    except Exception: pass
+
             def refresh(event=None):
+                _cancel_search_refresh()  # a direct refresh supersedes a pending debounced one
+                try:
+                    if not lb.winfo_exists():
+                        return
+                except Exception:
+                    return
                 term = var_search.get().strip().lower()
                 cat = var_cat.get()
+                if not term and cat == 'all':
+                    shown = fonts
+                else:
+                    shown = [f for f in fonts
+                             if (not term or term in f.lower()) and (cat == 'all' or cat_map.get(f) == cat)]
+                # One variadic insert = one Tcl call for the whole list
                 lb.delete(0, 'end')
-                for fnt in fonts:
-                    if term and term not in fnt.lower():
-                        continue
-                    if cat != 'all' and cat_map.get(fnt) != cat:
-                        continue
-                    lb.insert('end', fnt)
-                # try to select current
+                if shown:
+                    lb.insert('end', *shown)
+                # try to select current (index from the Python list; no lb.get round-trip)
                 cur = (self.var_font_family.get() or '').strip()
                 if cur:
                     try:
-                        idxs = lb.get(0,'end')
-                        if cur in idxs:
-                            lb.selection_set(idxs.index(cur))
-                            lb.see(idxs.index(cur))
+                        idx = shown.index(cur)
+                        lb.selection_set(idx)
+                        lb.see(idx)
                     except Exception: pass
                 upd_preview_font()
 
@@ -3445,15 +4133,25 @@ class App(tk.Tk):
                 try:
                     sel = lb.curselection()
                     fam = lb.get(sel[0]) if sel else (self.var_font_family.get() or 'Segoe UI')
-                    fprev = tkfont.Font(family=fam, size=12)
-                    sample_label.configure(font=fprev)
+                    fprev = self._font_preview_font
+                    if fprev is None:
+                        return
+                    if fprev.cget('family') != fam:
+                        fprev.configure(family=fam)
                 except Exception:
                     pass
 
             lb.bind('<<ListboxSelect>>', upd_preview_font)
             # Double-click: apply only (do not close).
             lb.bind('<Double-Button-1>', lambda e: (_apply_selected(False), win.focus_set()))
-            var_search.trace_add('write', lambda *_: refresh())
+            # Typing coalesces into one listbox rebuild per burst
+            def _schedule_search_refresh(*_):
+                _cancel_search_refresh()
+                try:
+                    self._font_search_after = self.after(self._FONT_SEARCH_DEBOUNCE_MS, refresh)
+                except Exception:
+                    refresh()
+            var_search.trace_add('write', _schedule_search_refresh)
             refresh()
 
             # --- Theming (Dark/Light) -------------------------------------------------
@@ -3522,6 +4220,7 @@ class App(tk.Tk):
                 trace_id = None
 
             def _on_close():
+                _cancel_search_refresh()
                 try:
                     if trace_id and hasattr(self, 'var_dark_mode'):
                         self.var_dark_mode.trace_remove('write', trace_id)
@@ -3570,6 +4269,7 @@ class App(tk.Tk):
         """Render a readable text-only preview with minimal styling tags."""
         if self.txt_html is None:
             return
+        self._geom_dirty = True
         t = self.txt_html
         t.configure(state='normal')
         t.delete('1.0', 'end')
@@ -3846,7 +4546,7 @@ class App(tk.Tk):
                 return order
         except Exception:
             pass
-        return ['uiHud', 'player', 'vehicle', 'quest', 'inventory', 'damage', 'other']
+        return list(_SYMPTOM_CODES)
 
     def _build_symptom_filter_row(self):
         """Build or rebuild the symptom checkbox row using i18n order; preserve states.
@@ -3880,12 +4580,15 @@ class App(tk.Tk):
                 var = self.var_filter_symptoms.get(code)
                 if var is None:
                     continue
-                # restore state if existed
+                # restore state if existed (same value; keep the filter trace quiet)
+                self._in_bulk_filter_set = True
                 try:
                     if code in current:
                         var.set(bool(current[code]))
                 except Exception:
                     pass
+                finally:
+                    self._in_bulk_filter_set = False
                 try:
                     try:
                         from common.common_i18n import symptom_label as _symptom_label  # type: ignore
@@ -3901,11 +4604,11 @@ class App(tk.Tk):
                     pass
                 # Use ttk.Checkbutton for consistent look (checkmark/focus ring)
                 # wraplength assigned later in _relayout_symptom_checks (works with ttk)
+                # Re-render is driven by the shared filter variable trace
                 chk = ttk.Checkbutton(
                     self.ff_sym_checks,
                     text=label,
-                    variable=var,
-                    command=self._rerender_preview_with_filters
+                    variable=var
                 )
                 self.chk_symptoms[code] = chk
             # Initial layout; enable a one-time forced relayout for the next pass
@@ -4139,7 +4842,6 @@ class App(tk.Tk):
             try:
                 self.ff_sym_checks = ttk.Frame(self.ff_sym_row)
                 self.ff_sym_checks.grid(row=0, column=1, sticky='ew')
-                self._sym_layout_scheduled = False
                 self._sym_layout_last_avail = None
                 self.ff_sym_checks.bind('<Configure>', self._on_sym_checks_configure)
             except Exception:
@@ -4176,6 +4878,12 @@ class App(tk.Tk):
         except Exception:
             pass
 
+    def _create_severity_checks(self):
+        """(Re)create the severity checkbuttons in ff_sev_checks from _SEV_SPEC (layout is done separately)."""
+        parent = self.ff_sev_checks
+        for code, attr, var_attr in self._SEV_SPEC:
+            setattr(self, attr, ttk.Checkbutton(parent, text=self._tr(f'filters.sev.{code}'), variable=getattr(self, var_attr)))
+
     def _rebuild_severity_row(self):
         """Safely rebuild the Severity row widgets after language/visibility changes.
 
@@ -4240,18 +4948,14 @@ class App(tk.Tk):
             try:
                 self.ff_sev_checks = ttk.Frame(self.ff_sev_row)
                 self.ff_sev_checks.grid(row=0, column=1, sticky='ew')
-                # Reset debounced layout state and bind Configure
-                self._sev_layout_scheduled = False
+                # Reset layout width cache and bind Configure (a pending idle relayout stays valid)
                 self._sev_layout_last_avail = None
                 self.ff_sev_checks.bind('<Configure>', self._on_sev_checks_configure)
             except Exception:
                 self.ff_sev_checks = None
             # Recreate checkbuttons bound to existing variables
             try:
-                self.chk_sev_c = ttk.Checkbutton(self.ff_sev_checks, text=self._('filters.sev.critical'), variable=self.var_filter_sev_critical)
-                self.chk_sev_h = ttk.Checkbutton(self.ff_sev_checks, text=self._('filters.sev.high'), variable=self.var_filter_sev_high)
-                self.chk_sev_m = ttk.Checkbutton(self.ff_sev_checks, text=self._('filters.sev.medium'), variable=self.var_filter_sev_medium)
-                self.chk_sev_l = ttk.Checkbutton(self.ff_sev_checks, text=self._('filters.sev.low'), variable=self.var_filter_sev_low)
+                self._create_severity_checks()
             except Exception:
                 pass
             # Force immediate and delayed relayout to settle geometry
@@ -4412,44 +5116,42 @@ class App(tk.Tk):
             pass
 
     def _on_sev_checks_configure(self, *_):
-        """Debounce Configure events for severity checks container."""
+        """Coalesce Configure events for the severity checks container into one idle relayout."""
+        if getattr(self, '_sev_layout_token', None) is not None:
+            return
         try:
-            if getattr(self, '_sev_layout_scheduled', False):
-                return
-            self._sev_layout_scheduled = True
-            self.after(60, self._run_sev_relayout_scheduled)
+            self._sev_layout_token = self.after_idle(self._run_sev_relayout_scheduled)
         except Exception:
+            self._sev_layout_token = None
             try:
                 self._relayout_severity_checks()
             except Exception:
                 pass
 
     def _run_sev_relayout_scheduled(self):
+        self._sev_layout_token = None
         try:
-            self._sev_layout_scheduled = False
             self._relayout_severity_checks()
         except Exception:
             pass
 
     def _on_sym_checks_configure(self, *_):
-        """Debounce-heavy Configure events for symptom checks container."""
+        """Coalesce Configure events for the symptom checks container into one idle relayout."""
+        if getattr(self, '_sym_layout_token', None) is not None:
+            return
         try:
-            # No-op if already scheduled (coalesce rapid bursts)
-            if getattr(self, '_sym_layout_scheduled', False):
-                return
-            self._sym_layout_scheduled = True
-            # Delay slightly to batch rapid events
-            self.after(60, self._run_symptom_relayout_scheduled)
+            self._sym_layout_token = self.after_idle(self._run_symptom_relayout_scheduled)
         except Exception:
             # Fallback: execute immediately
+            self._sym_layout_token = None
             try:
                 self._relayout_symptom_checks()
             except Exception:
                 pass
 
     def _run_symptom_relayout_scheduled(self):
+        self._sym_layout_token = None
         try:
-            self._sym_layout_scheduled = False
             self._relayout_symptom_checks()
         except Exception:
             pass
@@ -4467,6 +5169,7 @@ class App(tk.Tk):
             except Exception:
                 pass
             # Reset severities to initial (all ON)
+            self._in_bulk_filter_set = True
             try:
                 self.var_filter_sev_critical.set(True)
                 self.var_filter_sev_high.set(True)
@@ -4483,46 +5186,119 @@ class App(tk.Tk):
                         pass
             except Exception:
                 pass
+            self._in_bulk_filter_set = False
             # Re-render
-            self._rerender_preview_with_filters()
+            self._apply_filters()
         except Exception:
             pass
 
     def _set_all_symptoms(self, state: bool):
         """Set all symptom checkboxes to given state and re-render."""
         try:
-            for code, var in (self.var_filter_symptoms or {}).items():
-                try:
-                    var.set(bool(state))
-                except Exception:
-                    pass
-            self._rerender_preview_with_filters()
+            self._in_bulk_filter_set = True
+            try:
+                for code, var in (self.var_filter_symptoms or {}).items():
+                    try:
+                        var.set(bool(state))
+                    except Exception:
+                        pass
+            finally:
+                self._in_bulk_filter_set = False
+            self._refresh_filters_debounced()
         except Exception:
             pass
 
     def _set_all_filters(self, state: bool):
         """Set all filter checkboxes (severity + symptoms) to given state and re-render."""
         try:
-            # Severities
+            self._in_bulk_filter_set = True
             try:
-                self.var_filter_sev_critical.set(bool(state))
-                self.var_filter_sev_high.set(bool(state))
-                self.var_filter_sev_medium.set(bool(state))
-                self.var_filter_sev_low.set(bool(state))
-            except Exception:
-                pass
-            # Symptoms
-            try:
-                for _, var in (self.var_filter_symptoms or {}).items():
-                    try:
-                        var.set(bool(state))
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            self._rerender_preview_with_filters()
+                # Severities
+                try:
+                    self.var_filter_sev_critical.set(bool(state))
+                    self.var_filter_sev_high.set(bool(state))
+                    self.var_filter_sev_medium.set(bool(state))
+                    self.var_filter_sev_low.set(bool(state))
+                except Exception:
+                    pass
+                # Symptoms
+                try:
+                    for _, var in (self.var_filter_symptoms or {}).items():
+                        try:
+                            var.set(bool(state))
+                        except Exception:
+                            pass
+                except Exception:
+                    pass
+            finally:
+                self._in_bulk_filter_set = False
+            self._refresh_filters_debounced()
+        except Exception:
+            pass
+
+    def _on_filter_var_change(self, name, idx, mode):
+        """Shared write trace for all filter variables (see _wire_events)."""
+        if name in self._filter_text_var_names:
+            self._mark_filter_dirty(self._FILTER_DIRTY_TEXT)
+        else:
+            self._mark_filter_dirty(self._FILTER_DIRTY_TOGGLE)
+
+    def _mark_filter_dirty(self, flag: int):
+        """Record a filter change and schedule the single pending re-render for it."""
+        self._filter_dirty_mask |= flag
+        if flag & self._FILTER_DIRTY_TEXT:
+            self._schedule_rerender()
+        else:
+            self._refresh_filters_debounced()
+
+    def _refresh_filters_debounced(self, *_):
+        """Schedule one idle re-render for filter changes; ignored while a bulk update is in progress."""
+        if getattr(self, '_in_bulk_filter_set', False):
+            return
+        if getattr(self, '_filter_refresh_token', None) is not None:
+            return
+        try:
+            self._filter_refresh_token = self.after_idle(self._apply_filters)
+        except Exception:
+            self._filter_refresh_token = None
+            self._apply_filters()
+
+    def _apply_filters(self):
+        """Dispatch point for both filter schedulers; renders once per burst of changes."""
+        try:
+            tok = getattr(self, '_filter_refresh_token', None)
+            if tok is not None:
+                self.after_cancel(tok)
+        except Exception:
+            pass
+        self._filter_refresh_token = None
+        # A pending keystroke-debounced render would only repeat this one
+        try:
+            if getattr(self, '_filter_after_id', None) is not None:
+                self.after_cancel(self._filter_after_id)
+        except Exception:
+            pass
+        self._filter_after_id = None
+        mask = getattr(self, '_filter_dirty_mask', 0)
+        self._filter_dirty_mask = 0
+        if not mask:
+            return
+        # Traces also fire for same-value writes; skip when the preview already shows this state
+        try:
+            if self._filter_state() == getattr(self, '_last_filter_state', None):
+                return
         except Exception:
             pass
+        self._rerender_preview()
+
+    def _filter_state(self) -> tuple:
+        """Snapshot of every Preview filter input (compared against _last_filter_state)."""
+        return (
+            self.var_filter_mods.get(),
+            self.var_filter_class.get(),
+            tuple(bool(getattr(self, var_attr).get()) for _code, _attr, var_attr in self._SEV_SPEC),
+            tuple((code, bool(v.get())) for code, v in (getattr(self, 'var_filter_symptoms', {}) or {}).items()),
+        )
 
     # (Removed legacy _classify_symptom_code / _symptom_label_for_code; unified logic lives in report_builders)
 
@@ -4531,59 +5307,46 @@ class App(tk.Tk):
         """Filter conflicts by mods/class/severity for Preview only (does not affect saved files)."""
         mods_tokens = [t.strip().lower() for t in (self.var_filter_mods.get() or '').split(',') if t.strip()]
         cls_token = (self.var_filter_class.get() or '').strip().lower()
-        allowed_sev = set()
-        if self.var_filter_sev_critical.get():
-            allowed_sev.add('critical')
-        if self.var_filter_sev_high.get():
-            allowed_sev.add('high')
-        if self.var_filter_sev_medium.get():
-            allowed_sev.add('medium')
-        if self.var_filter_sev_low.get():
-            allowed_sev.add('low')
-
-        def mod_matches(mod_name: str) -> bool:
-            if not mods_tokens:
-                return True
-            mn = (mod_name or '').lower()
-            return any(tok in mn for tok in mods_tokens)
-
-        # Symptom whitelist logic (code-based): if any checkbox active, restrict to selected codes
+        # Read every toggle exactly once (each .get() is a Tcl round-trip)
+        allowed_sev = frozenset(code for code, _attr, var_attr in self._SEV_SPEC if getattr(self, var_attr).get())
+        # Symptom whitelist logic (code-based): when all False, match none; only match when at least one is True
         symptom_vars = getattr(self, 'var_filter_symptoms', {}) or {}
-        active_symptom_codes = [code for code, v in symptom_vars.items() if v.get()]
-        restrict_symptoms = True  # Spec change: when all False, match none; only match when at least one is True
+        active_symptom_codes = frozenset(code for code, v in symptom_vars.items() if v.get())
 
         new_conflicts = []
-        for c in (report.get('conflicts') or []):
-            cls = c.get('class','')
-            meth = c.get('method','')
-            entries = list(c.get('occurrences') or c.get('entries') or [])
-            if cls_token and cls_token not in (cls or '').lower():
-                continue
-            if mods_tokens:
-                entries = [e for e in entries if mod_matches(e.get('mod',''))]
-                if not entries:
+        # Severity / symptoms: empty set (= all False) → match none, no need to scan
+        if allowed_sev and active_symptom_codes:
+            try:
+                from common.common_impact import classify_conflict_symptom as _classify_symptom
+            except Exception:
+                _classify_symptom = None
+            assess = self._assess_conflict_impact
+            append = new_conflicts.append
+            for c in (report.get('conflicts') or []):
+                cls = c.get('class','')
+                meth = c.get('method','')
+                entries = list(c.get('occurrences') or c.get('entries') or [])
+                if cls_token and cls_token not in (cls or '').lower():
+                    continue
+                if mods_tokens:
+                    entries = [e for e in entries if any(tok in (e.get('mod','') or '').lower() for tok in mods_tokens)]
+                    if not entries:
+                        continue
+                sev = assess(cls, meth, c.get('mods', []), entries).get('severity','').lower()
+                if sev not in allowed_sev:
                     continue
-            sev = self._assess_conflict_impact(cls, meth, c.get('mods', []), entries).get('severity','').lower()
-            # Severity: empty set (= all False) → match none
-            if not allowed_sev:
-                continue
-            if sev not in allowed_sev:
-                continue
-            # Symptoms: when zero selected (= active_symptom_codes is empty), match none
-            if restrict_symptoms:
                 try:
-                    from common.common_impact import classify_conflict_symptom as _classify_symptom
-                    code = _classify_symptom((cls or '').lower(), meth)
+                    code = _classify_symptom((cls or '').lower(), meth) if _classify_symptom else 'other'
                 except Exception:
                     code = 'other'
-                if not active_symptom_codes or code not in active_symptom_codes:
+                if code not in active_symptom_codes:
                     continue
-            nc = dict(c)
-            if 'occurrences' in nc:
-                nc['occurrences'] = entries
-            elif 'entries' in nc:
-                nc['entries'] = entries
-            new_conflicts.append(nc)
+                nc = dict(c)
+                if 'occurrences' in nc:
+                    nc['occurrences'] = entries
+                elif 'entries' in nc:
+                    nc['entries'] = entries
+                append(nc)
 
         new_report = dict(report)
         new_report['conflicts'] = new_conflicts
@@ -4597,6 +5360,7 @@ class App(tk.Tk):
             report = self._last_report  # local narrowing
             conflicts_only = self.var_mode_conflicts.get()
             include_reference = not conflicts_only
+            filter_state = self._filter_state()
             filtered = self._filter_report_for_preview(report, conflicts_only=conflicts_only)
             html_body = self.build_html_body(filtered, conflicts_only=conflicts_only, include_reference=include_reference)
             if self.webview2 is not None:
@@ -4604,6 +5368,7 @@ class App(tk.Tk):
             self._last_render_args = (filtered, conflicts_only, include_reference)
             if self.webview2 is None and self.txt_html is not None:
                 self.render_report_to_text(filtered, conflicts_only=conflicts_only, include_reference=include_reference)
+            self._last_filter_state = filter_state
             # Preview-updated event emission intentionally skipped
         except Exception as e:
             self._log_i18n('[WARN]', 'log.warnRerender', err=str(e))
@@ -4622,7 +5387,7 @@ class App(tk.Tk):
     def _update_status_bar(self):
         """Refresh status bar text (engine / theme / current language)."""
         try:
-            if not hasattr(self, 'status_bar') or self.status_bar is None:
+            if getattr(self, 'status_bar', None) is None:
                 return
             # Debounce: if called again within 50ms, reschedule in 60ms
             try:
@@ -4642,8 +5407,8 @@ class App(tk.Tk):
 
             eng_id = self.get_preview_engine()
             # Localized engine name (fallback to id if the key is missing)
-            eng = self._(f'ui.engine.{eng_id}') if self._(f'ui.engine.{eng_id}') != f'ui.engine.{eng_id}' else eng_id
-            theme = self._('theme.dark') if self.var_dark_mode.get() else self._('theme.light')
+            eng = self._tr(f'ui.engine.{eng_id}') if self._tr(f'ui.engine.{eng_id}') != f'ui.engine.{eng_id}' else eng_id
+            theme = self._tr('theme.dark') if self.var_dark_mode.get() else self._tr('theme.light')
             lang = self.var_lang.get()
             # Counts
             total_conflicts = getattr(self, '_last_report', {}).get('conflicts', []) if getattr(self, '_last_report', None) else []
@@ -4658,23 +5423,27 @@ class App(tk.Tk):
             if self.var_filter_sev_medium.get(): sev_parts.append('M')
             if self.var_filter_sev_low.get(): sev_parts.append('L')
             sev_summary = ''.join(sev_parts) if sev_parts and len(sev_parts) < 4 else ('-' if not sev_parts else 'ALL')
-            mods_lbl = self._('status.mods')
-            class_lbl = self._('status.class')
-            sev_lbl = self._('status.sev')
+            mods_lbl = self._tr('status.mods')
+            class_lbl = self._tr('status.class')
+            sev_lbl = self._tr('status.sev')
             filt_summary = f"{mods_lbl}={mods_f or '-'} {class_lbl}={class_f or '-'} {sev_lbl}={sev_summary}"
             # i18n keys used (fallback to English if missing)
-            lbl_engine = self._('ui.engine')
-            lbl_theme = self._('ui.theme')
-            lbl_lang = self._('ui.lang')
-            lbl_conflicts = self._('ui.conflicts')
+            lbl_engine = self._tr('ui.engine')
+            lbl_theme = self._tr('ui.theme')
+            lbl_lang = self._tr('ui.lang')
+            lbl_conflicts = self._tr('ui.conflicts')
             # Font family label
             try:
-                lbl_font = self._('status.font')
+                lbl_font = self._tr('status.font')
                 fam = (self.var_font_family.get() or 'Segoe UI').strip()
             except Exception:
                 lbl_font, fam = 'font', 'Segoe UI'
             txt = f"{lbl_engine}: {eng} | {lbl_theme}: {theme} | {lbl_lang}: {lang} | {lbl_font}: {fam} | {lbl_conflicts}: {filtered_count}/{total_count} | {filt_summary}"
+            # Only touch the label when the text actually changed (avoids a relayout)
+            if txt == getattr(self, '_last_status_text', None):
+                return
             self.status_bar.configure(text=txt)
+            self._last_status_text = txt
         except Exception:
             pass
 
@@ -5058,7 +5827,7 @@ class App(tk.Tk):
         """
         try:
             if not getattr(self, '_settings_bootstrap', None):
-                self._exe_dir = Path(sys.executable).parent if getattr(sys, 'frozen', False) else SRC_DIR
+                self._exe_dir = _EXE_DIR
                 self._settings_bootstrap = self._exe_dir / 'redscript_conflict_gui.json'
             # Merge/update existing bootstrap content
             data = {}
@@ -5149,25 +5918,41 @@ class App(tk.Tk):
             return key.split('.')[-1]
         return _
 
+    def _tr(self, key: str) -> str:
+        """Memoized self._(key); the cache is cleared by on_change_language."""
+        v = self._tr_cache.get(key)
+        if v is None:
+            v = self._tr_cache[key] = self._(key)
+        return v
+
     def _make_gettext_for(self, lang: str):
-        """Return a gettext-like lookup bound to a specific language code (used for file outputs)."""
-        def _(key: str) -> str:
-            b = self._bundles.get(lang) or {}
-            if key in b:
-                return b[key]
-            if lang != 'en' and key in (self._bundles.get('en') or {}):
-                return (self._bundles.get('en') or {})[key]
-            return key.split('.')[-1]
-        return _
+        """Return a gettext-like lookup bound to a specific language code (used for file outputs).
+
+        Memoized per language (bundles are loaded once): the lookup is the ``__getitem__`` of a
+        pre-merged lang-over-en catalog, so each key is one C-level dict hit.
+        """
+        fn = self._gettext_for_cache.get(lang)
+        if fn is None:
+            merged = _Catalog(self._bundles.get('en') or {})
+            if lang != 'en':
+                merged.update(self._bundles.get(lang) or {})
+            fn = self._gettext_for_cache[lang] = merged.__getitem__
+        return fn
+
+    def _on_language_change(self):
+        """Rebind _() to the selected language and drop memoized _tr lookups."""
+        # var_lang already updated by menu radiobutton
+        try:
+            self._ = self._make_gettext()
+        except Exception:
+            pass
+        self._tr_cache.clear()
+        self._geom_dirty = True  # relabelled widgets may request new sizes
 
     def on_change_language(self, event=None):
         """Update language state from combobox and refresh all visible labels/tabs."""
         try:
-            # Rebind _() to new language (var_lang already updated by menu radiobutton)
-            try:
-                self._ = self._make_gettext()
-            except Exception:
-                pass
+            self._on_language_change()
             # Update window title and static labels
             self.title(self._('app.title'))
             try:
@@ -5243,10 +6028,8 @@ class App(tk.Tk):
                 except Exception:
                     # Fallback: update label texts only
                     try:
-                        self.chk_sev_c.configure(text=self._('filters.sev.critical'))
-                        self.chk_sev_h.configure(text=self._('filters.sev.high'))
-                        self.chk_sev_m.configure(text=self._('filters.sev.medium'))
-                        self.chk_sev_l.configure(text=self._('filters.sev.low'))
+                        for code, attr, _var in self._SEV_SPEC:
+                            getattr(self, attr).configure(text=self._tr(f'filters.sev.{code}'))
                     except Exception:
                         pass
                 # Update symptom checkbox labels
@@ -5462,13 +6245,12 @@ class App(tk.Tk):
                         else:
                             data = dict(report)
                         data_disp = self._augment_json_with_localized(data)
-                        self.set_preview_json(json.dumps(data_disp, ensure_ascii=False, indent=2))
+                        self.set_preview_json(_json_text(data_disp))
                     except Exception:
                         pass
                     # Markdown preview (localized)
                     try:
-                        md_src = dict(report)
-                        md_text = self._build_localized_markdown(md_src, conflicts_only=conflicts_only, include_reference=include_reference)
+                        md_text = self._localized_markdown_cached(report, conflicts_only=conflicts_only, include_reference=include_reference)
                         self.set_preview_md(md_text)
                     except Exception:
                         pass
@@ -5808,9 +6590,7 @@ class App(tk.Tk):
             ttk.Label(lf, text=self._('scan.outJson')).grid(row=row, column=0, sticky='w', padx=8, pady=6)
             self.ent_out_json = ttk.Entry(lf, textvariable=self.var_out_json); self.ent_out_json.grid(row=row, column=1, sticky='ew', padx=8, pady=6)
             self.btn_browse_json = ttk.Button(lf, text=self._('scan.browse'), command=self.on_browse_json); self.btn_browse_json.grid(row=row, column=2, padx=8, pady=6); row += 1
-            for c in (0,1,2):
-                try: lf.columnconfigure(c, weight=1 if c==1 else 0)
-                except Exception: pass
+            self._cfg_cols(lf, {0: 0, 1: 1, 2: 0})
 
             # Misc toggles + open folder button in SAME row (bottom area)
             misc_toggles = ttk.Frame(frm)
@@ -5971,69 +6751,100 @@ class App(tk.Tk):
             pass
 
     # --- Localized output helpers ---
-    def _build_localized_markdown(self, report: dict, conflicts_only: bool, include_reference: bool) -> str:
+    def _localized_markdown_cached(self, report: dict, conflicts_only: bool, include_reference: bool,
+                                   include_wrap: Optional[bool] = None, lang: Optional[str] = None,
+                                   prebuilt: Optional[str] = None) -> str:
+        """_build_localized_markdown memoized per (report, mode, include_wrap, language).
+
+        The report object is kept in the entry and compared by identity so a recycled id() never hits.
+        include_wrap/lang default to the GUI state; ``prebuilt`` seeds the entry with text already
+        built for these inputs (e.g. by the Markdown file writer).
+        """
+        try:
+            if include_wrap is None:
+                include_wrap = bool(self.var_include_wrap.get())
+            if lang is None:
+                lang = self.var_lang.get()
+            key = (id(report), bool(conflicts_only), bool(include_reference), bool(include_wrap), lang)
+        except Exception:
+            return self._build_localized_markdown(report, conflicts_only=conflicts_only, include_reference=include_reference)
+        hit = self._md_cache.get(key)
+        if hit is not None and hit[0] is report:
+            return hit[1]
+        md_text = prebuilt if prebuilt is not None else self._build_localized_markdown(
+            report, conflicts_only=conflicts_only, include_reference=include_reference,
+            include_wrap=include_wrap, tr=self._make_gettext_for(lang))
+        if len(self._md_cache) >= 8:
+            self._md_cache.clear()
+        self._md_cache[key] = (report, md_text)
+        return md_text
+
+    def _build_localized_markdown(self, report: dict, conflicts_only: bool, include_reference: bool,
+                                  include_wrap: Optional[bool] = None, tr=None) -> str:
+        # Lines are collected and joined once at the end (no per-call buffer to pool); bind append locally
         lines: List[str] = []
-        _ = self._
-        lines.append(f"# {_( 'report.header' )}\n")
-        lines.append(f"- {_( 'report.scannedRoot' )} `{report.get('scanned_root','')}`\n")
-        lines.append(f"- {_( 'report.filesScanned' )} {report.get('files_scanned',0)}\n")
+        add = lines.append
+        _ = tr if callable(tr) else self._
+        add(f"# {_( 'report.header' )}\n")
+        add(f"- {_( 'report.scannedRoot' )} `{report.get('scanned_root','')}`\n")
+        add(f"- {_( 'report.filesScanned' )} {report.get('files_scanned',0)}\n")
         ac = report.get('annotation_counts') or {}
-        lines.append(f"- Annotation counts: replaceMethod={ac.get('replaceMethod',0)}, wrapMethod={ac.get('wrapMethod',0)}, replaceGlobal={ac.get('replaceGlobal',0)}\n")
+        add(f"- Annotation counts: replaceMethod={ac.get('replaceMethod',0)}, wrapMethod={ac.get('wrapMethod',0)}, replaceGlobal={ac.get('replaceGlobal',0)}\n")
         # Conflicts
-        lines.append(f"\n## {_( 'report.conflicts' ).split('(')[0].strip()}\n")
+        add(f"\n## {_( 'report.conflicts' ).split('(')[0].strip()}\n")
         confs = report.get('conflicts', []) or []
         if not confs:
-            lines.append(f"{_( 'report.noConflicts' )}\n")
+            add(f"{_( 'report.noConflicts' )}\n")
         else:
             for c in sorted(confs, key=lambda x: (x.get('class',''), x.get('method',''))):
                 mods_str = ", ".join(c.get('mods', []))
-                lines.append(f"### {c.get('class','')}.{c.get('method','')}  — {c.get('count',0)} occurrences  — MODs: {mods_str}\n")
+                add(f"### {c.get('class','')}.{c.get('method','')}  — {c.get('count',0)} occurrences  — MODs: {mods_str}\n")
                 occs = c.get('occurrences') or c.get('entries') or []
                 if occs:
                     sig = occs[0].get('func_sig') or occs[0].get('signature') or ''
                     if sig:
-                        lines.append(f"{_('report.targetMethod')}: `{sig}`\n")
+                        add(f"{_('report.targetMethod')}: `{sig}`\n")
                 for occ in occs:
                     mod = occ.get('mod', '<unknown>')
                     rel = occ.get('relpath', occ.get('file',''))
-                    lines.append(f"- [{mod}] {rel}:{occ.get('line','')}\n")
-                lines.append("")
+                    add(f"- [{mod}] {rel}:{occ.get('line','')}\n")
+                add("")
     # wrapMethod coexistence (if present and enabled)
-        include_wrap = False
-        try:
-            include_wrap = bool(self.var_include_wrap.get())
-        except Exception:
-            include_wrap = False
+        if include_wrap is None:
+            try:
+                include_wrap = bool(self.var_include_wrap.get())
+            except Exception:
+                include_wrap = False
         wrap_co = report.get('wrap_coexistence', []) or []
         if include_wrap and wrap_co:
             h = _( 'report.wrapCoexist' )
-            lines.append(f"\n## {h}\n")
+            add(f"\n## {h}\n")
             for c in sorted(wrap_co, key=lambda x: (x.get('class',''), x.get('method',''))):
                 mods_str = ", ".join(c.get('mods', []))
-                lines.append(f"### {c.get('class','')}.{c.get('method','')}  — wraps: {c.get('wrap_count',0)}  — MODs: {mods_str}\n")
+                add(f"### {c.get('class','')}.{c.get('method','')}  — wraps: {c.get('wrap_count',0)}  — MODs: {mods_str}\n")
                 for occ in c.get('occurrences') or []:
                     mod = occ.get('mod','<unknown>')
                     rel = occ.get('relpath', occ.get('file',''))
-                    lines.append(f"- [{mod}] {rel}:{occ.get('line','')}\n")
-                lines.append("")
+                    add(f"- [{mod}] {rel}:{occ.get('line','')}\n")
+                add("")
     # Replace + wrapMethod coexistence (if present and enabled)
         rw_co = report.get('replace_wrap_coexistence', []) or []
         if include_wrap and rw_co:
             h = _( 'report.replaceWrapCoexist' )
-            lines.append(f"\n## {h}\n")
+            add(f"\n## {h}\n")
             for c in sorted(rw_co, key=lambda x: (x.get('class',''), x.get('method',''))):
-                lines.append(f"### {c.get('class','')}.{c.get('method','')}  — replace: {c.get('replace_count',0)}, wrap: {c.get('wrap_count',0)}\n")
+                add(f"### {c.get('class','')}.{c.get('method','')}  — replace: {c.get('replace_count',0)}, wrap: {c.get('wrap_count',0)}\n")
                 mods_r = ", ".join(c.get('mods_replace', []))
                 mods_w = ", ".join(c.get('mods_wrap', []))
                 if mods_r:
-                    lines.append(f"- Replace MODs: {mods_r}\n")
+                    add(f"- Replace MODs: {mods_r}\n")
                 if mods_w:
-                    lines.append(f"- Wrap MODs: {mods_w}\n")
-                lines.append("")
+                    add(f"- Wrap MODs: {mods_w}\n")
+                add("")
 
         # Reference section
         if (not conflicts_only) and include_reference:
-            lines.append(f"\n## {_( 'report.reference' )}\n")
+            add(f"\n## {_( 'report.reference' )}\n")
             # Core uses 'replaceMethod' (no leading '@')
             repl_entries = [e for e in report.get('entries', []) if e.get('annotation')=='replaceMethod']
             grouped: Dict[tuple, list] = {}
@@ -6043,35 +6854,44 @@ class App(tk.Tk):
             for (cls, meth), gitems in sorted(grouped.items()):
                 mods = sorted({e.get('mod','<unknown>') for e in gitems})
                 mod_str = ", ".join(mods)
-                lines.append(f"### {cls}.{meth} — MODs: {mod_str}\n")
+                add(f"### {cls}.{meth} — MODs: {mod_str}\n")
                 if gitems:
                     sig = gitems[0].get('func_sig') or gitems[0].get('signature') or ''
                     if sig:
-                        lines.append(f"{_('report.targetMethod')}: `{sig}`\n")
+                        add(f"{_('report.targetMethod')}: `{sig}`\n")
                 for e in gitems:
                     rel = e.get('relpath', e.get('file',''))
                     mod = e.get('mod', '<unknown>')
-                    lines.append(f"- [{mod}] {rel}:{e.get('line','')}\n")
-                lines.append("")
+                    add(f"- [{mod}] {rel}:{e.get('line','')}\n")
+                add("")
         return "\n".join(lines)
 
-    def _augment_json_with_localized(self, data: dict) -> dict:
-        try:
-            lang = self.var_lang.get()
-            localized = {
+    def _localized_json_labels(self, lang: str) -> dict:
+        """The JSON ``localized`` labels block for ``lang`` (built once per language)."""
+        localized = self._localized_json_block.get(lang)
+        if localized is None:
+            _ = self._make_gettext_for(lang)
+            localized = self._localized_json_block[lang] = {
                 'lang': lang,
                 'labels': {
-                    'header': self._('report.header'),
-                    'scannedRoot': self._('report.scannedRoot'),
-                    'filesScanned': self._('report.filesScanned'),
-                    'conflicts': self._('report.conflicts').split('(')[0].strip(),
-                    'noConflicts': self._('report.noConflicts'),
-                    'reference': self._('report.reference'),
-                    'impact': self._('impact.label'),
+                    'header': _('report.header'),
+                    'scannedRoot': _('report.scannedRoot'),
+                    'filesScanned': _('report.filesScanned'),
+                    'conflicts': _('report.conflicts').split('(')[0].strip(),
+                    'noConflicts': _('report.noConflicts'),
+                    'reference': _('report.reference'),
+                    'impact': _('impact.label'),
                 }
             }
+        return localized
+
+    def _augment_json_with_localized(self, data: dict, lang: Optional[str] = None) -> dict:
+        """Shallow copy of ``data`` plus the ``localized`` labels block (lang defaults to the GUI language)."""
+        try:
+            if lang is None:
+                lang = self.var_lang.get()
             out = dict(data)
-            out['localized'] = localized
+            out['localized'] = self._localized_json_labels(lang)
             return out
         except Exception:
             return data
@@ -6081,9 +6901,24 @@ class App(tk.Tk):
             self._save_settings()
         except Exception:
             pass
-        # Attempt early cleanup (atexit will also try)
+        # Drop pending filter / include-wrap / font-search re-renders; the widgets are about to go away
         try:
-            self._cleanup_session_temp_dir()
+            self._filter_dirty_mask = 0
+            for attr in ('_filter_refresh_token', '_filter_after_id', '_include_wrap_after_id', '_font_search_after'):
+                tok = getattr(self, attr, None)
+                if tok is not None:
+                    self.after_cancel(tok)
+                    setattr(self, attr, None)
+        except Exception:
+            pass
+        # Start cleanup in the background (atexit waits briefly for it)
+        try:
+            self._start_temp_cleanup()
+        except Exception:
+            pass
+        try:
+            for pipe in list(self._scan_done_pipes):
+                self._close_scan_done_pipe(pipe)
         except Exception:
             pass
         try:
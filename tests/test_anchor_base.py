@@ -0,0 +1,18 @@
+import pytest
+
+from common.common_util import make_conflict_anchor
+from gui_conflict_report import App
+
+
+@pytest.mark.parametrize('cls,meth', [
+    ('Foo', 'Bar'),
+    ('PlayerPuppet', 'OnGameAttached'),
+    ('Player Puppet', 'On Game Attached'),
+    ('gameuiHUD::Widget', 'Set(Value)!'),
+    ('my_mod.Class', 'method-name'),
+    ('', ''),
+    ('Überklasse', 'Größe'),
+    ('クラス', 'メソッド 名'),
+])
+def test_anchor_base_matches_make_conflict_anchor(cls, meth):
+    assert 'conf-' + App._anchor_base(cls, meth) == make_conflict_anchor(None, cls, meth)
@@ -0,0 +1,71 @@
+import types
+from pathlib import Path
+
+import pytest
+
+from builders.report_builders import build_html_body_gui
+from common.common_util import make_conflict_anchor
+from gui_conflict_report import App
+from redscript_conflicts_report import build_report
+
+SAMPLE_ROOT = Path(__file__).parent / 'sample_mods'
+
+WRAP_REPORT = {
+    'scanned_root': 'R:/root',
+    'files_scanned': 3,
+    '_options': {'include_wrap_coexistence': True, 'disable_file_links': True},
+    'annotation_counts': {'replaceMethod': 4, 'wrapMethod': 2, 'replaceGlobal': 0},
+    'conflicts': [
+        {
+            'class': 'Foo', 'method': 'Bar', 'count': 2, 'mods': ['ModA', 'ModB'],
+            'occurrences': [
+                {'mod': 'ModA', 'relpath': 'a.reds', 'line': 10, 'func_sig': 'func Bar() -> Void'},
+                {'mod': 'ModB', 'relpath': 'b.reds', 'line': 20, 'func_sig': 'func Bar() -> Void'},
+            ],
+        },
+        {
+            'class': 'Player Puppet', 'method': 'OnGameAttached', 'count': 2, 'mods': ['ModA', 'ModC'],
+            'occurrences': [
+                {'mod': 'ModA', 'relpath': 'p.reds', 'line': 3, 'func_sig': 'func OnGameAttached() -> Void'},
+                {'mod': 'ModC', 'relpath': 'q.reds', 'line': 4, 'func_sig': 'func OnGameAttached() -> Void'},
+            ],
+        },
+    ],
+    'wrap_coexistence': [
+        {
+            'class': 'Foo', 'method': 'Bar', 'wrap_count': 2, 'mods': ['ModA', 'ModC'],
+            'occurrences': [
+                {'mod': 'ModA', 'relpath': 'a.reds', 'line': 30},
+                {'mod': 'ModC', 'relpath': 'c.reds', 'line': 40},
+            ],
+        }
+    ],
+    'replace_wrap_coexistence': [],
+    'entries': [],
+}
+
+# _anchor_pairs_for_conflicts only needs the static _anchor_base, so no Tk root is created
+_APP = types.SimpleNamespace(_anchor_base=App._anchor_base)
+
+
+def _build(report, anchors=None, **scope):
+    return build_html_body_gui(report, lambda k: k, disable_file_links=True,
+                               anchor_fn=make_conflict_anchor, anchors=anchors, **scope)
+
+
+@pytest.mark.parametrize('report', [WRAP_REPORT, build_report(SAMPLE_ROOT)], ids=['synthetic', 'sample_mods'])
+@pytest.mark.parametrize('conflicts_only', [False, True])
+@pytest.mark.parametrize('include_wrap', [True, False])
+def test_precomputed_anchors_match_anchor_fn(report, conflicts_only, include_wrap):
+    scope = dict(conflicts_only=conflicts_only, include_reference=not conflicts_only, include_wrap=include_wrap)
+    pairs = App._anchor_pairs_for_conflicts(_APP, report.get('conflicts') or [])
+    expected = _build(report, **scope)
+    assert _build(report, anchors=pairs, **scope) == expected
+    # A length mismatch falls back to anchor_fn instead of misaligning ids
+    assert _build(report, anchors=pairs[:-1], **scope) == expected
+
+
+def test_anchor_pairs_match_legacy_format():
+    pairs = App._anchor_pairs_for_conflicts(_APP, WRAP_REPORT['conflicts'])
+    assert pairs == [(make_conflict_anchor(i, c['class'], c['method']), make_conflict_anchor(None, c['class'], c['method']))
+                     for i, c in enumerate(WRAP_REPORT['conflicts'], start=1)]
@@ -0,0 +1,10 @@
+from gui_conflict_report import _Catalog
+
+
+def test_catalog_missing_key_falls_back_to_last_segment():
+    cat = _Catalog({'report.header': 'Header'})
+    assert cat['report.header'] == 'Header'
+    assert cat['foo.bar.label'] == 'label'
+    assert cat['plain'] == 'plain'
+    # Fallbacks are computed, not stored
+    assert 'foo.bar.label' not in cat
@@ -0,0 +1,26 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import gui_conflict_report as gcr
+from redscript_conflicts_report import build_report
+
+SAMPLE_ROOT = Path(__file__).parent / 'sample_mods'
+
+
+def test_json_text_stdlib_fallback_matches_json_dumps(monkeypatch):
+    monkeypatch.setattr(gcr, '_orjson', None)
+    data = {'a': [1, {}, [], 'é', 1.5, None, True], 'b': {'x': {'y': []}}, 3: 'k'}
+    assert gcr._json_text(data) == json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def test_json_text_orjson_matches_stdlib_on_real_report():
+    orjson = pytest.importorskip('orjson')
+    assert gcr._orjson is orjson
+    report = build_report(SAMPLE_ROOT)
+    expected = json.dumps(report, ensure_ascii=False, indent=2)
+    got = gcr._json_text(report)
+    assert json.loads(got) == json.loads(expected)
+    # Scan reports carry no floats/NaN, so the text is identical too
+    assert got == expected
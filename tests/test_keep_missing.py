@@ -0,0 +1,6 @@
+from gui_conflict_report import _KeepMissing
+
+
+def test_keep_missing_leaves_unknown_placeholders():
+    assert '{a} {b} ({c})'.format_map(_KeepMissing(a='x')) == 'x {b} ({c})'
+    assert 'no placeholders'.format_map(_KeepMissing()) == 'no placeholders'
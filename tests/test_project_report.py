@@ -0,0 +1,58 @@
+import copy
+import types
+
+import pytest
+
+from gui_conflict_report import App
+
+# _project_report only reads the class-level _WRAP_KEYS, so no Tk root is created
+_APP = types.SimpleNamespace(_WRAP_KEYS=App._WRAP_KEYS)
+
+REPORT = {
+    'scanned_root': 'R:/root',
+    'files_scanned': 2,
+    'annotation_counts': {'replaceMethod': 2},
+    'conflicts': [{'class': 'Foo', 'method': 'Bar'}],
+    'entries': [{'class': 'Foo', 'method': 'Bar'}],
+    'wrap_coexistence': [{'class': 'Foo', 'method': 'Bar'}],
+    'replace_wrap_coexistence': [],
+    '_options': {'include_wrap_coexistence': True, 'disable_file_links': True},
+}
+
+
+def _project(report, conflicts_only, include_wrap):
+    return App._project_report(_APP, report, conflicts_only, include_wrap)
+
+
+def test_project_report_full_mode_keeps_wrap_sections():
+    data = _project(REPORT, conflicts_only=False, include_wrap=True)
+    assert set(data) == set(REPORT)
+    assert data['wrap_coexistence'] is REPORT['wrap_coexistence']
+    assert data['_options'] == {'include_wrap_coexistence': True, 'disable_file_links': True}
+
+
+def test_project_report_full_mode_drops_wrap_sections():
+    data = _project(REPORT, conflicts_only=False, include_wrap=False)
+    assert set(data) == set(REPORT) - {'wrap_coexistence', 'replace_wrap_coexistence'}
+    assert data['_options']['include_wrap_coexistence'] is False
+
+
+def test_project_report_conflicts_only_mode():
+    data = _project(REPORT, conflicts_only=True, include_wrap=True)
+    assert set(data) == {'scanned_root', 'files_scanned', 'annotation_counts', 'conflicts', '_options'}
+    assert data['_options'] == REPORT['_options']
+
+
+@pytest.mark.parametrize('conflicts_only', [False, True])
+@pytest.mark.parametrize('include_wrap', [False, True])
+def test_project_report_does_not_mutate_original(conflicts_only, include_wrap):
+    before = copy.deepcopy(REPORT)
+    data = _project(REPORT, conflicts_only, include_wrap)
+    assert REPORT == before
+    assert data['_options'] is not REPORT['_options']
+
+
+def test_project_report_without_options():
+    report = {k: v for k, v in REPORT.items() if k != '_options'}
+    assert _project(report, conflicts_only=False, include_wrap=False)['_options'] == {'include_wrap_coexistence': False}
+    assert _project(report, conflicts_only=True, include_wrap=False)['_options'] == {}